@@ -653,6 +653,7 @@ struct PlanningSectionView: View {
             let taskName = "\(decision.title.replacingOccurrences(of: "을 추가하여 글로벌 시장에 진출할까요?", with: "").replacingOccurrences(of: "?", with: "")) (\(selectedOption.label))"
 
             let newTask: [String: Any?] = [
+                "id": UUID().uuidString,
                 "name": taskName,
                 "status": "not-started",
                 "targetDate": nil,
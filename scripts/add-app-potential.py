@@ -4,10 +4,8 @@
 20년차 기획자 관점에서 시장 기회, 성장 가능성, 수익화 전략 등을 정의
 """
 
-import json
-from pathlib import Path
-
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import APPS_DIR
+from portfolio.jsonio import load_json, save_json
 
 # 각 앱별 포텐셜 분석
 APP_POTENTIALS = {
@@ -716,45 +714,29 @@ APP_POTENTIALS = {
 }
 
 
-def load_app_json(app_file):
-    """앱 JSON 파일 로드"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
-def save_app_json(app_file, data):
-    """앱 JSON 파일 저장"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        original = f.read()
+def transform(app_id, data):
+    """메모리 상의 앱 데이터에 포텐셜 정보 넣기. 반환: 넣었으면 1"""
+    if app_id not in APP_POTENTIALS:
+        return 0
 
-    # 백업
-    backup_file = app_file.with_suffix('.json.backup-potential')
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(original)
+    # vision에 potential 필드 추가
+    if 'vision' not in data:
+        data['vision'] = {}
 
-    # 저장
-    with open(app_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    data['vision']['potential'] = APP_POTENTIALS[app_id]
+    return 1
 
 
 def add_potential(app_file):
     """앱에 포텐셜 정보 추가"""
     app_id = app_file.stem
-    data = load_app_json(app_file)
+    data = load_json(app_file)
 
-    if app_id not in APP_POTENTIALS:
+    if not transform(app_id, data):
         print(f"⚠ {data.get('name', app_id)}: 포텐셜 데이터 없음")
         return False
 
-    potential_data = APP_POTENTIALS[app_id]
-
-    # vision에 potential 필드 추가
-    if 'vision' not in data:
-        data['vision'] = {}
-
-    data['vision']['potential'] = potential_data
-
-    save_app_json(app_file, data)
+    save_json(app_file, data)
     print(f"✅ {data.get('name', app_id)}: 포텐셜 정보 추가")
     return True
 
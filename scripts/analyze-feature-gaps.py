@@ -3,10 +3,7 @@
 각 앱의 feature 개수 분석 및 부족한 앱 식별
 """
 
-import json
-from pathlib import Path
-
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import PortfolioStore
 
 
 def main():
@@ -16,15 +13,11 @@ def main():
     print("=" * 80)
     print()
 
-    app_files = sorted(APPS_DIR.glob("*.json"))
     app_feature_counts = []
 
-    for app_file in app_files:
-        with open(app_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        app_name = data.get('name', app_file.stem)
-        all_tasks = data.get('allTasks', [])
+    for app in PortfolioStore.load():
+        app_name = app.name
+        all_tasks = app.tasks
 
         feature_count = 0
         non_feature_count = 0
@@ -38,7 +31,7 @@ def main():
 
         app_feature_counts.append({
             'name': app_name,
-            'id': app_file.stem,
+            'id': app.slug,
             'features': feature_count,
             'non_features': non_feature_count,
             'total': len(all_tasks)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+생성 스크립트를 의존 관계대로, 바뀐 것만 실행
+
+    summary    update-summary.py        apps/*.json              → portfolio-summary.json
+    dashboard  generate-dashboard.py    apps/*.json, summary     → dashboard/index.html
+    badges     generate-badges.py       summary                  → STATS.md
+    site       build-portfolio-site.py  apps, 앱스토어 캐시, showcase-content, problem-map, 스크린샷
+                                                                 → docs/index.html, README.md
+    validate   validate-portfolio.py    apps, showcase-content, problem-map
+
+입력 · 출력 내용 해시는 scripts/.build-state.json 에 남는다. 스크립트 자체와 scripts/portfolio/
+도 입력이라 코드가 바뀌어도 다시 만든다. 사이트는 캐시만 사용 (--no-fetch) — 앱스토어 정보를
+새로 받으려면 build-portfolio-site.py 를 직접 실행하면 캐시가 바뀌어 다음 빌드에 반영된다.
+
+사용:
+    python3 scripts/build-graph.py                  # 오래된 대상 전부
+    python3 scripts/build-graph.py dashboard badges # 이 대상들 (+ 필요한 상류)
+    python3 scripts/build-graph.py --dry-run        # 무엇을 왜 다시 만들지만 출력
+    python3 scripts/build-graph.py --force --jobs 2
+    python3 scripts/build-graph.py --list
+"""
+
+import argparse
+import sys
+
+from portfolio import APPS_DIR, ROOT
+from portfolio.build import BuildGraph, Target
+
+APPS = APPS_DIR.relative_to(ROOT).as_posix()
+SHARED = "scripts/portfolio/*.py"
+CONTENT = "scripts/showcase-content*.json"
+PROBLEM_MAP = "scripts/problem-map.json"
+
+TARGETS = [
+    Target(
+        "summary",
+        ["scripts/update-summary.py", "--apps-dir", APPS],
+        inputs=[f"{APPS}/*.json", "scripts/update-summary.py", SHARED],
+        outputs=["portfolio-summary.json"],
+    ),
+    Target(
+        "dashboard",
+        ["scripts/generate-dashboard.py", "--apps-dir", APPS],
+        inputs=[f"{APPS}/*.json", "portfolio-summary.json", "scripts/generate-dashboard.py", SHARED],
+        outputs=["dashboard/index.html"],
+    ),
+    Target(
+        "badges",
+        ["scripts/generate-badges.py"],
+        inputs=["portfolio-summary.json", "scripts/generate-badges.py"],
+        outputs=["STATS.md"],
+    ),
+    Target(
+        "site",
+        ["scripts/build-portfolio-site.py", "--no-fetch", "--incremental"],
+        inputs=[f"{APPS}/*.json", CONTENT, PROBLEM_MAP, "scripts/.appstore-cache.json",
+                "docs/screenshots/*.png", "scripts/build-portfolio-site.py", SHARED],
+        outputs=["docs/index.html", "README.md"],
+    ),
+    Target(
+        "validate",
+        ["scripts/validate-portfolio.py", "--apps-dir", APPS],
+        inputs=[f"{APPS}/*.json", CONTENT, PROBLEM_MAP, "scripts/validate-portfolio.py", SHARED],
+    ),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생성 스크립트 빌드 그래프")
+    parser.add_argument("targets", nargs="*", help="대상 이름 (생략하면 전체)")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="동시 실행 수 (기본 4)")
+    parser.add_argument("--force", action="store_true", help="최신이어도 다시 실행")
+    parser.add_argument("--dry-run", action="store_true", help="실행하지 않고 재빌드 대상과 이유만 출력")
+    parser.add_argument("--verbose", "-v", action="store_true", help="스크립트 출력과 최신 대상도 표시")
+    parser.add_argument("--list", action="store_true", help="대상과 의존 관계 출력")
+    args = parser.parse_args()
+
+    graph = BuildGraph(TARGETS)
+    if args.list:
+        for name in graph.order():
+            deps = ", ".join(sorted(graph.deps[name])) or "-"
+            print(f"  {name:10s} ← {deps}")
+        return 0
+
+    try:
+        graph.closure(args.targets)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return 1
+    print("🧱 빌드 그래프 실행" + (" (dry-run)" if args.dry_run else ""))
+    ok = graph.run(args.targets or None, jobs=args.jobs, force=args.force,
+                   dry_run=args.dry_run, verbose=args.verbose)
+    print("✅ 완료" if ok else "❌ 실패한 대상이 있습니다")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,17 +9,31 @@
 사용:
     python3 scripts/build-portfolio-site.py
     python3 scripts/build-portfolio-site.py --no-fetch   # 캐시만 사용 (오프라인)
+    python3 scripts/build-portfolio-site.py --workers 16 # 앱스토어 동시 조회 스레드 수 (기본 8)
+    python3 scripts/build-portfolio-site.py --batch 50   # 국가별 id 50개씩 묶어 한 번에 조회
+    python3 scripts/build-portfolio-site.py --ttl ratings=3600,details=86400  # 캐시 TTL(초)
+    python3 scripts/build-portfolio-site.py --swr        # 만료 직후 항목은 캐시로 렌더하고 백그라운드 재검증
+    python3 scripts/build-portfolio-site.py --refresh    # TTL 무시하고 전부 다시 조회
+    python3 scripts/build-portfolio-site.py --incremental  # 입력이 바뀐 카드만 다시 렌더 (.build-manifest.json)
+    python3 scripts/build-portfolio-site.py --shard        # 그룹별 docs/sections/*.html + 지연 로딩 index
+    python3 scripts/build-portfolio-site.py --shard-size 12  # 앱 12개 안팎씩 묶어 샤딩
 """
 
+import hashlib
 import json
+import math
 import re
 import sys
 import urllib.request
 import urllib.error
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from html import escape
+from itertools import combinations, product
 from pathlib import Path
 
+from portfolio import PortfolioStore
+
 ROOT = Path(__file__).resolve().parent.parent
 APPS_DIR = ROOT / "projects/PortfolioCEO/PortfolioCEO/Data/apps"
 OUT_DIR = ROOT / "docs"
@@ -28,6 +42,7 @@ CACHE_FILE = ROOT / "scripts" / ".appstore-cache.json"
 CONTENT_FILE = ROOT / "scripts" / "showcase-content.json"
 CONTENT_EN_FILE = ROOT / "scripts" / "showcase-content.en.json"
 PROBLEM_MAP_FILE = ROOT / "scripts" / "problem-map.json"
+MANIFEST_FILE = ROOT / "scripts" / ".build-manifest.json"
 SHOTS_DIR = OUT_DIR / "screenshots"
 
 KST = timezone(timedelta(hours=9))
@@ -35,11 +50,11 @@ APPSTORE_ID_RE = re.compile(r"/id(\d+)")
 
 
 def load_apps():
+    # 렌더 중 붙이는 _slug / _store 가 공용 저장소의 원본 dict 를 건드리지 않도록 얕은 복사
     apps = []
-    for f in sorted(APPS_DIR.glob("*.json")):
-        with open(f, encoding="utf-8") as fp:
-            data = json.load(fp)
-        data["_slug"] = f.stem
+    for entry in PortfolioStore.load(APPS_DIR):
+        data = dict(entry.data)
+        data["_slug"] = entry.slug
         apps.append(data)
     return apps
 
@@ -97,34 +112,75 @@ def save_cache(cache):
 
 
 COUNTRIES = ("kr", "us", "jp")
+FETCH_WORKERS = 8  # 동시 조회 스레드 수 (--workers N 으로 변경)
+
+# 캐시 신선도: 필드 그룹별 TTL(초). 평점은 자주, 설명·아이콘 등은 하루 단위로 갱신
+# (--ttl ratings=3600,details=86400 으로 변경). 그룹마다 조회 시각을 따로 남기고,
+# 조회 응답에서는 만료된 그룹의 필드만 반영한다 (나머지 그룹은 이전 값 · 조회 시각 유지)
+CACHE_TTL = {"ratings": 3600, "details": 86400}
+RATING_FIELDS = ("rating", "ratingCount")  # 나머지 필드는 details
+# TTL 이 지나도 이 기간 안이면 stale-while-revalidate 대상 (--swr 일 때 캐시로 먼저 렌더)
+STALE_GRACE = 7 * 86400
+EN_FIELDS = ("trackName_en", "description_en", "genre_en", "price_en")
+
+# 조건부 요청(If-None-Match / If-Modified-Since)에 304 가 오면 돌려주는 표식 — 캐시 레코드 재사용
+NOT_MODIFIED = object()
+
 
+def lookup_country(app_id, country, validators=None):
+    """단건 조회. validators(etag / lastModified)가 있으면 조건부 요청을 보낸다.
 
-def lookup_country(app_id, country):
+    반환: 결과 dict (응답 검증자는 "_validators" 에 첨부) | None(미발견) | NOT_MODIFIED(304)
+    """
     url = f"https://itunes.apple.com/lookup?id={app_id}&country={country}"
+    headers = {"User-Agent": "portfolio-site-builder"}
+    if validators and validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators and validators.get("lastModified"):
+        headers["If-Modified-Since"] = validators["lastModified"]
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=20) as resp:
+            data = json.load(resp)
+            got = {"etag": resp.headers.get("ETag"), "lastModified": resp.headers.get("Last-Modified")}
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return NOT_MODIFIED
+        raise
+    if not data.get("resultCount"):
+        return None
+    r = data["results"][0]
+    r["_validators"] = {k: v for k, v in got.items() if v}
+    return r
+
+
+def lookup_batch(app_ids, country):
+    """여러 id 를 한 번에 조회 (id=1,2,3…). 반환: {app_id: 결과} — 응답에 없는 id 는 빠진다."""
+    url = f"https://itunes.apple.com/lookup?id={','.join(app_ids)}&country={country}"
     req = urllib.request.Request(url, headers={"User-Agent": "portfolio-site-builder"})
     with urllib.request.urlopen(req, timeout=20) as resp:
         data = json.load(resp)
-    return data["results"][0] if data.get("resultCount") else None
+    return {str(r["trackId"]): r for r in data.get("results", []) if r.get("trackId")}
 
 
-def fetch_appstore(app_id):
-    """여러 국가 스토어를 순차 조회 (KR → US → JP). US 스토어에서 영어 카피도 함께 수집."""
-    r = None
-    found = None
-    for country in COUNTRIES:
-        r = lookup_country(app_id, country)
-        if r:
-            found = country
-            break
-    if r is None:
-        return None
-    # 영어(EN) 표시용: US 스토어 설명·장르·가격 (미출시면 None → 렌더 시 폴백)
-    r_en = r if found == "us" else None
-    if r_en is None:
-        try:
-            r_en = lookup_country(app_id, "us")
-        except (urllib.error.URLError, TimeoutError):
-            r_en = None
+def store_record(r, r_en, prev=None):
+    """iTunes Lookup 결과(기준 국가 r, US 영어판 r_en) → 캐시에 저장하는 스토어 레코드.
+
+    r / r_en 이 NOT_MODIFIED 면 해당 필드는 이전 캐시 레코드(prev)에서 그대로 가져온다.
+    """
+    prev = prev or {}
+    if r is NOT_MODIFIED:
+        rec = {k: v for k, v in prev.items() if k not in EN_FIELDS and k != "_meta"}
+    else:
+        rec = _base_fields(r)
+    if r_en is NOT_MODIFIED:
+        rec.update({k: prev.get(k) for k in EN_FIELDS})
+    else:
+        rec.update(_en_fields(r_en))
+    return rec
+
+
+def _base_fields(r):
     return {
         "trackName": r.get("trackName"),
         "icon": r.get("artworkUrl512") or r.get("artworkUrl100"),
@@ -137,6 +193,11 @@ def fetch_appstore(app_id):
         "version": r.get("trackViewUrl") and r.get("version"),
         "url": r.get("trackViewUrl"),
         "screenshots": (r.get("screenshotUrls") or [])[:3],
+    }
+
+
+def _en_fields(r_en):
+    return {
         "trackName_en": r_en.get("trackName") if r_en else None,
         "description_en": r_en.get("description") if r_en else None,
         "genre_en": r_en.get("primaryGenreName") if r_en else None,
@@ -144,26 +205,270 @@ def fetch_appstore(app_id):
     }
 
 
-def enrich(apps, fetch=True):
+def _outcome(future):
+    """Future → (결과, 네트워크 예외). 네트워크 오류 외의 예외는 그대로 올린다."""
+    try:
+        return future.result(), None
+    except (urllib.error.URLError, TimeoutError) as e:
+        return None, e
+
+
+def _resolved(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def _submit_lookups(pool, app_ids, country, batch_size, validators):
+    """country 스토어 조회를 풀에 제출한다. 반환: {app_id: Future} (배치 모드면 같은 청크끼리 Future 공유).
+
+    단건 조회는 캐시에 남은 검증자(validators[app_id][country])로 조건부 요청을 보낸다.
+    """
+    if batch_size <= 1:
+        return {
+            app_id: pool.submit(
+                lookup_country, app_id, country, validators.get(app_id, {}).get(country)
+            )
+            for app_id in app_ids
+        }
+    futures = {}
+    for k in range(0, len(app_ids), batch_size):
+        chunk = app_ids[k : k + batch_size]
+        future = pool.submit(lookup_batch, chunk, country)
+        futures.update(dict.fromkeys(chunk, future))
+    return futures
+
+
+def _settle_batches(pool, futures, country, batch_size, validators):
+    """배치 응답을 앱별 Future 로 푼다. 응답에 없거나 배치가 실패한 id 는 단건 조회로 보충."""
+    if batch_size <= 1:
+        return futures
+    out = {}
+    for app_id, future in futures.items():
+        found, err = _outcome(future)
+        if err is None and app_id in found:
+            out[app_id] = _resolved(found[app_id])
+        else:
+            out[app_id] = pool.submit(
+                lookup_country, app_id, country, validators.get(app_id, {}).get(country)
+            )
+    return out
+
+
+def fetch_many(app_ids, workers=FETCH_WORKERS, batch_size=1, cache=None):
+    """여러 앱의 스토어 정보를 스레드 풀로 동시에 조회한다.
+
+    앱마다 KR·US 를 한꺼번에 조회하고(US 는 영어 카피로도 쓰임), 둘 다 없을 때만 JP 를 추가 조회한다.
+    우선순위는 순차 조회와 같다 (KR → US → JP).
+    batch_size > 1 이면 국가별로 id 를 batch_size 개씩 묶어 한 요청으로 조회한다.
+    cache 를 주면 단건 조회에 이전 응답의 ETag / Last-Modified 를 실어 보내고, 304 면 캐시 레코드를 재사용한다.
+    반환: {app_id: 레코드 | None(미발견) | 예외(조회 실패)} — 레코드의 "_meta" 에 조회 시각·검증자 기록
+    """
+    cache = cache or {}
+    ids = list(dict.fromkeys(i for i in app_ids if i))
+    validators = {
+        i: ((cache.get(i) or {}).get("_meta") or {}).get("validators") or {} for i in ids
+    }
+    out = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        submitted = {
+            c: _submit_lookups(pool, ids, c, batch_size, validators) for c in COUNTRIES[:2]
+        }  # KR·US
+        kr_futures, us_futures = (
+            _settle_batches(pool, submitted[c], c, batch_size, validators)
+            for c in COUNTRIES[:2]
+        )
+        pending_jp = []
+        for app_id in ids:
+            kr, err = _outcome(kr_futures[app_id])
+            if err:
+                out[app_id] = err
+                continue
+            us, us_err = _outcome(us_futures[app_id])
+            prev = cache.get(app_id)
+            if kr:
+                # 영어(EN) 표시용: US 스토어 설명·장르·가격 (미출시·실패면 None → 렌더 시 폴백)
+                out[app_id] = _stamp(store_record(kr, us, prev), prev, kr=kr, us=us)
+            elif us_err:
+                out[app_id] = us_err
+            elif us:
+                out[app_id] = _stamp(store_record(us, us, prev), prev, us=us)
+            else:
+                pending_jp.append(app_id)
+        jp_futures = _settle_batches(
+            pool,
+            _submit_lookups(pool, pending_jp, "jp", batch_size, validators),
+            "jp",
+            batch_size,
+            validators,
+        )
+        for app_id in pending_jp:
+            jp, err = _outcome(jp_futures[app_id])
+            prev = cache.get(app_id)
+            out[app_id] = err or (_stamp(store_record(jp, None, prev), prev, jp=jp) if jp else None)
+    return out
+
+
+def _stamp(record, prev, **used):
+    """레코드에 조회 시각과, 실제로 쓰인 국가별 응답의 검증자를 "_meta" 로 남긴다."""
+    old = ((prev or {}).get("_meta") or {}).get("validators") or {}
+    validators = {}
+    for country, r in used.items():
+        if r is NOT_MODIFIED:
+            if country in old:
+                validators[country] = old[country]
+        elif r and r.get("_validators"):
+            validators[country] = r["_validators"]
+    now = datetime.now(KST).isoformat(timespec="seconds")
+    record["_meta"] = {"fetched": {group: now for group in CACHE_TTL}}
+    if validators:
+        record["_meta"]["validators"] = validators
+    return record
+
+
+def field_group(field):
+    return "ratings" if field in RATING_FIELDS else "details"
+
+
+def group_fetched(entry):
+    """필드 그룹별 조회 시각 {group: iso}. 구버전 캐시의 단일 fetchedAt 은 모든 그룹에 적용."""
+    meta = (entry or {}).get("_meta") or {}
+    fetched = meta.get("fetched") or {}
+    legacy = meta.get("fetchedAt")
+    return {group: fetched.get(group) or legacy for group in CACHE_TTL if fetched.get(group) or legacy}
+
+
+def group_states(entry, ttl=CACHE_TTL, now=None):
+    """필드 그룹별 신선도: "fresh"(TTL 안) / "stale"(TTL 초과, 유예 기간 안) / "expired"(조회 시각 없음 포함)."""
+    now = now or datetime.now(KST)
+    fetched = group_fetched(entry)
+    states = {}
+    for group, sec in ttl.items():
+        if group not in fetched:
+            states[group] = "expired"
+            continue
+        age = (now - datetime.fromisoformat(fetched[group])).total_seconds()
+        states[group] = "fresh" if age < sec else "stale" if age < sec + STALE_GRACE else "expired"
+    return states
+
+
+def cache_state(entry, ttl=CACHE_TTL, now=None):
+    """캐시 항목 전체의 신선도: 모든 그룹이 fresh 면 "fresh", 하나라도 expired 면 "expired", 그 외 "stale"."""
+    states = set(group_states(entry, ttl, now).values())
+    if states <= {"fresh"}:
+        return "fresh"
+    return "expired" if "expired" in states else "stale"
+
+
+def merge_groups(prev, fresh, groups):
+    """새 레코드(fresh)에서 groups 에 든 필드 그룹만 가져오고, 나머지 그룹은 이전 값과 조회 시각을 유지한다.
+
+    조회 API 는 모든 필드를 한 번에 주지만, 아직 신선한 그룹(예: 하루 TTL 의 설명 · 아이콘)을
+    평점 TTL 마다 갈아 끼우지 않도록 한다.
+    """
+    prev_fetched = group_fetched(prev)
+    keep = [group for group in CACHE_TTL if group not in groups and group in prev_fetched]
+    if not keep:
+        return fresh
+    record = dict(fresh)
+    fetched = dict(fresh["_meta"]["fetched"])
+    for field, value in prev.items():
+        if field != "_meta" and field_group(field) in keep:
+            record[field] = value
+    for group in keep:
+        fetched[group] = prev_fetched[group]
+    record["_meta"] = dict(fresh["_meta"], fetched=fetched)
+    return record
+
+
+def fetch_appstore(app_id, cache=None):
+    """여러 국가 스토어를 조회 (KR → US → JP). US 스토어에서 영어 카피도 함께 수집."""
+    result = fetch_many([app_id], workers=2, cache=cache).get(app_id)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def enrich(apps, fetch=True, workers=FETCH_WORKERS, batch_size=1, ttl=CACHE_TTL, swr=False):
+    """앱마다 스토어 레코드(_store)를 붙인다. 네트워크 조회는 캐시가 만료된 항목만.
+
+    swr=True 면 유예 기간 안의 stale 항목은 캐시로 먼저 렌더하고 백그라운드에서 재검증한다.
+    반환: (apps, 재검증 Future | None) — Future 가 있으면 finish_revalidation() 으로 마무리.
+    """
     cache = load_cache()
     for app in apps:
-        app_id = extract_appstore_id(app)
-        app["_appStoreId"] = app_id
+        app["_appStoreId"] = extract_appstore_id(app)
+    due, background = [], []
+    if fetch:
+        for app_id in dict.fromkeys(a["_appStoreId"] for a in apps if a["_appStoreId"]):
+            state = cache_state(cache.get(app_id), ttl)
+            if state == "stale" and swr:
+                background.append(app_id)
+            elif state != "fresh":
+                due.append(app_id)
+    results = fetch_many(due, workers, batch_size, cache) if due else {}
+    pending = None
+    if background:
+        revalidator = ThreadPoolExecutor(max_workers=1)
+        pending = revalidator.submit(fetch_many, background, workers, batch_size, dict(cache))
+        revalidator.shutdown(wait=False)  # 제출한 작업은 끝까지 돌고, 끝나면 스레드가 정리된다
+    # 결과 보고는 완료 순서가 아니라 앱 목록 순서대로
+    for app in apps:
+        app_id = app["_appStoreId"]
         store = cache.get(app_id) if app_id else None
-        if app_id and fetch:
-            try:
-                fresh = fetch_appstore(app_id)
-                if fresh:
-                    store = fresh
-                    cache[app_id] = fresh
-                    print(f"  ✓ {app.get('name')} ({app_id})")
-                else:
-                    print(f"  · {app.get('name')} ({app_id}) — 앱스토어 미발견")
-            except (urllib.error.URLError, TimeoutError) as e:
-                print(f"  ! {app.get('name')} ({app_id}) — fetch 실패: {e} (캐시 사용)")
+        if app_id in results:
+            store = _apply_result(cache, app, results[app_id], ttl) or store
+        elif app_id in background:
+            print(f"  ~ {app.get('name')} ({app_id}) — 캐시 사용, 백그라운드 재검증")
         app["_store"] = store
     save_cache(cache)
-    return apps
+    return apps, pending
+
+
+def _apply_result(cache, app, fresh, ttl=CACHE_TTL):
+    """fetch_many 결과 하나를 캐시에 반영하고 진행 상황을 출력한다. 새 레코드를 반환(없으면 None).
+
+    이전 캐시 항목이 있으면 만료된(fresh 가 아닌) 필드 그룹만 새 값으로 바꾼다.
+    """
+    app_id = app["_appStoreId"]
+    if isinstance(fresh, Exception):
+        print(f"  ! {app.get('name')} ({app_id}) — fetch 실패: {fresh} (캐시 사용)")
+    elif fresh:
+        prev = cache.get(app_id)
+        if prev:
+            due = {group for group, state in group_states(prev, ttl).items() if state != "fresh"}
+            fresh = merge_groups(prev, fresh, due)
+        cache[app_id] = fresh
+        print(f"  ✓ {app.get('name')} ({app_id})")
+        return fresh
+    else:
+        print(f"  · {app.get('name')} ({app_id}) — 앱스토어 미발견")
+    return None
+
+
+def finish_revalidation(apps, pending, ttl=CACHE_TTL):
+    """백그라운드 재검증 결과를 캐시에 반영한다 (이번 빌드는 이미 stale 캐시로 렌더됨)."""
+    results = pending.result()
+    cache = load_cache()
+    for app in apps:
+        if app["_appStoreId"] in results:
+            _apply_result(cache, app, results.pop(app["_appStoreId"]), ttl)
+    save_cache(cache)
+
+
+def parse_ttl(spec):
+    """"ratings=3600,details=86400" → {"ratings": 3600, "details": 86400} (명시하지 않은 그룹은 기본값)."""
+    ttl = dict(CACHE_TTL)
+    for part in filter(None, (spec or "").split(",")):
+        key, _, sec = part.partition("=")
+        key = key.strip()
+        if key not in CACHE_TTL:
+            raise SystemExit(f"❌ 알 수 없는 TTL 그룹: {key} (가능: {', '.join(CACHE_TTL)})")
+        try:
+            ttl[key] = int(sec)
+        except ValueError:
+            raise SystemExit(f"❌ TTL 은 초 단위 정수여야 합니다: {part}")
+    return ttl
 
 
 # ---------------------------------------------------------------- 렌더링
@@ -482,10 +787,160 @@ def render_problem_hub(pm, by_slug, copy_map, copy_map_en, released):
       <div class="toc-groups">{"".join(toc_groups)}</div>
       <p class="pmap-more"><a href="https://m1zz.github.io/industry-explorer/" target="_blank" rel="noopener">{bi("산업 전체의 문제 ↔ 솔루션 지도 탐색하기", "Explore the full industry problem ↔ solution map")} →</a></p>
     </section>"""
-    graph_json = json.dumps({"domains": graph_domains}, ensure_ascii=False)
+    graph = {"domains": graph_domains, "layout": precompute_layout(graph_domains)}
+    graph_json = json.dumps(graph, ensure_ascii=False)
     return section, graph_json
 
 
+# ---------------------------------------------------------------- 그래프 사전 배치
+
+# 빌드 때 GRAPH_JS 의 힘 모델로 배치를 미리 안정화해 PMAP_GRAPH.layout 에 싣는다.
+# 반발력은 REPEL_R 안의 모든 쌍을 정확히 계산한다 — 클라이언트는 같은 힘을 Barnes–Hut(THETA 0.8)로
+# 근사하므로, 이 배치는 클라이언트에서 거의(완전히는 아닌) 안정 상태다. 클라이언트는 기준 캔버스 크기에서
+# 실제 크기로 좌표만 늘려 쓰고, 상호작용 전에는 시뮬레이션하지 않아 차이는 드래그를 시작할 때만 드러난다.
+# 배치는 그래프 모양(도메인별 앱 수)에만 달려 있으므로 모양 해시로 LAYOUT_CACHE_FILE 에 캐시한다.
+LAYOUT_SIZES = {"wide": (1000, 480), "narrow": (390, 400)}  # GRAPH_JS 의 W < 700 분기와 대응
+LAYOUT_MAX_TICKS = 800
+LAYOUT_REST_SPEED = 0.01  # 모든 노드 속도가 이보다 작아지면 안정으로 본다
+LAYOUT_CACHE_FILE = ROOT / "scripts" / ".layout-cache.json"
+REPEL_R = 160  # GRAPH_JS 의 REPEL_R — 이보다 먼 쌍은 반발하지 않는다
+# 격자에서 (자기 칸 +) 이 이웃 칸들만 보면 REPEL_R 안의 쌍을 한 번씩 모두 만난다
+_GRID_NEIGHBORS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+try:  # 선택 의존성: 있으면 반발력을 벡터화, 없으면 순수 파이썬 (격자로 먼 쌍은 건너뜀)
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def graph_topology(domains):
+    """GRAPH_JS 와 같은 순서(중심 → 도메인 → 그 앱들)의 노드 반지름과 링크 [(s, t, 길이)]."""
+    radii = [25]
+    links = []
+    for d in domains:
+        di = len(radii)
+        radii.append(21)
+        links.append((0, di, 150))
+        for _ in d["apps"]:
+            links.append((di, len(radii), 56))
+            radii.append(12)
+    return radii, links
+
+
+def seed_layout(domains, W, H):
+    """GRAPH_JS layout() 과 같은 초기 배치: 도메인은 원형, 앱은 도메인 바깥 부채꼴."""
+    cx, cy = W / 2, H / 2
+    R = min(W, H) * 0.30
+    pos = [(cx, cy)]
+    for i, d in enumerate(domains):
+        ang = (i / len(domains)) * math.pi * 2 - math.pi / 2
+        pos.append((cx + math.cos(ang) * R, cy + math.sin(ang) * R))
+        k = len(d["apps"])
+        for j in range(k):
+            a2 = ang + (j - (k - 1) / 2) * 0.42
+            pos.append((cx + math.cos(a2) * (R + 64), cy + math.sin(a2) * (R + 64)))
+    return pos
+
+
+def _repel_py(xs, ys, vx, vy):
+    """REPEL_R 크기 격자에 노드를 나눠 같은 칸 · 이웃 칸 쌍만 계산 (결과는 전쌍 계산과 같다)"""
+    r2 = REPEL_R * REPEL_R
+    grid = {}
+    for i in range(len(xs)):
+        grid.setdefault((int(xs[i] // REPEL_R), int(ys[i] // REPEL_R)), []).append(i)
+    pairs = []
+    for (gx, gy), members in grid.items():
+        pairs.extend(combinations(members, 2))
+        for ox, oy in _GRID_NEIGHBORS:
+            near = grid.get((gx + ox, gy + oy))
+            if near:
+                pairs.extend(product(members, near))
+    for i, j in pairs:
+        dx, dy = xs[j] - xs[i], ys[j] - ys[i]
+        d2 = dx * dx + dy * dy or 1
+        if d2 > r2:
+            continue
+        d = math.sqrt(d2)
+        f = 640 / d2
+        dx, dy = dx / d * f, dy / d * f
+        vx[i] -= dx
+        vy[i] -= dy
+        vx[j] += dx
+        vy[j] += dy
+
+
+def _repel_np(xs, ys, vx, vy):
+    x, y = np.asarray(xs), np.asarray(ys)
+    dx = x[None, :] - x[:, None]
+    dy = y[None, :] - y[:, None]
+    d2 = dx * dx + dy * dy
+    d2[d2 == 0] = 1
+    f = np.where(d2 <= REPEL_R * REPEL_R, 640 / (d2 * np.sqrt(d2)), 0.0)
+    np.fill_diagonal(f, 0.0)
+    vx -= (f * dx).sum(axis=1)
+    vy -= (f * dy).sum(axis=1)
+
+
+def simulate_layout(domains, W, H, max_ticks=LAYOUT_MAX_TICKS):
+    """GRAPH_JS tick() 을 안정될 때까지 반복한 노드 좌표 [[x, y], …] (중심 노드 고정)."""
+    radii, links = graph_topology(domains)
+    pos = seed_layout(domains, W, H)
+    n = len(pos)
+    if np is not None:
+        xs, ys = np.array([p[0] for p in pos]), np.array([p[1] for p in pos])
+        vx, vy = np.zeros(n), np.zeros(n)
+        repel = _repel_np
+    else:
+        xs, ys = [p[0] for p in pos], [p[1] for p in pos]
+        vx, vy = [0.0] * n, [0.0] * n
+        repel = _repel_py
+    for _ in range(max_ticks):
+        repel(xs, ys, vx, vy)
+        for s, t, length in links:
+            dx, dy = xs[t] - xs[s], ys[t] - ys[s]
+            d = math.sqrt(dx * dx + dy * dy) or 1
+            f = (d - length) * 0.02
+            dx, dy = dx / d * f, dy / d * f
+            vx[s] += dx
+            vy[s] += dy
+            vx[t] -= dx
+            vy[t] -= dy
+        vx[0] = vy[0] = 0  # 중심 고정
+        fastest = 0.0
+        for i in range(1, n):
+            vx[i] *= 0.82
+            vy[i] *= 0.82
+            m = radii[i] + 16
+            xs[i] = min(max(xs[i] + vx[i], m), W - m)
+            ys[i] = min(max(ys[i] + vy[i], m), H - m)
+            fastest = max(fastest, abs(vx[i]), abs(vy[i]))
+        if fastest < LAYOUT_REST_SPEED:
+            break
+    return [[round(float(xs[i]), 1), round(float(ys[i]), 1)] for i in range(n)]
+
+
+def precompute_layout(domains):
+    """기준 캔버스 크기별 안정 배치 — PMAP_GRAPH["layout"] 에 그대로 들어간다.
+
+    같은 모양(도메인별 앱 수)의 배치는 LAYOUT_CACHE_FILE 에서 꺼내 쓴다. 빌더 코드가 바뀌면 다시 계산.
+    """
+    key = _digest({"builder": BUILDER_FP, "shape": [len(d["apps"]) for d in domains], "sizes": LAYOUT_SIZES})
+    try:
+        with open(LAYOUT_CACHE_FILE, encoding="utf-8") as fp:
+            cached = json.load(fp)
+    except (OSError, json.JSONDecodeError):
+        cached = {}
+    if cached.get("key") == key:
+        return cached["layout"]
+    layout = {
+        name: {"w": W, "h": H, "pos": simulate_layout(domains, W, H)}
+        for name, (W, H) in LAYOUT_SIZES.items()
+    }
+    with open(LAYOUT_CACHE_FILE, "w", encoding="utf-8") as fp:
+        json.dump({"key": key, "layout": layout}, fp)
+    return layout
+
+
 # 네트워크 그래프(중심 → 도메인 → 앱) — 템플릿에 그대로 삽입되는 순수 JS
 GRAPH_JS = r"""
 (function () {
@@ -508,7 +963,7 @@ GRAPH_JS = r"""
       var an = { type: 'a', a: a, d: d, r: 12, x: 0, y: 0, vx: 0, vy: 0 };
       if (a.icon) {
         var im = new Image();
-        im.onload = function () { an.img = im; };
+        im.onload = function () { an.img = im; redraw(); };
         im.src = a.icon;
       }
       nodes.push(an);
@@ -558,26 +1013,95 @@ GRAPH_JS = r"""
     canvas.style.height = H + 'px';
     center.x = W / 2;
     center.y = H / 2;
-    layout();
+    // 빌드 때 계산해 둔 안정 배치가 있으면 그대로 쓰고, 없으면 시드 배치에서 시뮬레이션을 돌린다
+    preset = applyLayout();
+    if (!preset) layout();
+    gridDirty = true;
     draw();
+    if (!preset) kick();
+  }
+  function applyLayout() {
+    var L = data.layout && data.layout[W < 700 ? 'narrow' : 'wide'];
+    if (!L || L.pos.length !== nodes.length) return false;
+    var sx = W / L.w, sy = H / L.h;
+    nodes.forEach(function (n, i) {
+      if (n.fixed) return;
+      n.x = L.pos[i][0] * sx;
+      n.y = L.pos[i][1] * sy;
+      n.vx = 0;
+      n.vy = 0;
+    });
+    return true;
   }
 
   var dragging = null, moved = 0, hover = null;
-  function tick() {
-    var i, j, a, b, dx, dy, d2, d, f;
-    for (i = 0; i < nodes.length; i++) {
-      for (j = i + 1; j < nodes.length; j++) {
-        a = nodes[i]; b = nodes[j];
-        dx = b.x - a.x; dy = b.y - a.y;
-        d2 = dx * dx + dy * dy || 1;
-        if (d2 > 25600) continue;
-        d = Math.sqrt(d2);
-        f = 640 / d2;
-        dx /= d; dy /= d;
-        if (!a.fixed && a !== dragging) { a.vx -= dx * f; a.vy -= dy * f; }
-        if (!b.fixed && b !== dragging) { b.vx += dx * f; b.vy += dy * f; }
-      }
+
+  // 반발력: Barnes–Hut 쿼드트리 근사. 셀 크기 / 거리 < THETA 이면 셀 전체를 질량중심 하나로 본다.
+  // THETA = 0 이면 전쌍 계산과 같다. 160px(REPEL_R) 밖은 원래대로 무시.
+  var THETA = 0.8, REPEL_R = 160, REPEL_R2 = REPEL_R * REPEL_R, MAX_DEPTH = 20;
+  function cell(x, y, s) { return { x: x, y: y, s: s, n: 0, cx: 0, cy: 0, bodies: [], kids: null }; }
+  function insert(c, n, depth) {
+    c.cx = (c.cx * c.n + n.x) / (c.n + 1);
+    c.cy = (c.cy * c.n + n.y) / (c.n + 1);
+    c.n++;
+    if (!c.kids) {
+      if (!c.bodies.length || depth >= MAX_DEPTH) { c.bodies.push(n); return; }
+      c.kids = [null, null, null, null];
+      var old = c.bodies;
+      c.bodies = [];
+      old.forEach(function (b) { place(c, b, depth); });
+    }
+    place(c, n, depth);
+  }
+  function place(c, n, depth) {
+    var h = c.s / 2;
+    var q = (n.x >= c.x + h ? 1 : 0) + (n.y >= c.y + h ? 2 : 0);
+    if (!c.kids[q]) c.kids[q] = cell(c.x + (q & 1) * h, c.y + (q >> 1) * h, h);
+    insert(c.kids[q], n, depth + 1);
+  }
+  function buildTree() {
+    var x0 = Infinity, y0 = Infinity, x1 = -Infinity, y1 = -Infinity;
+    nodes.forEach(function (n) {
+      if (n.x < x0) x0 = n.x;
+      if (n.y < y0) y0 = n.y;
+      if (n.x > x1) x1 = n.x;
+      if (n.y > y1) y1 = n.y;
+    });
+    var root = cell(x0, y0, Math.max(x1 - x0, y1 - y0) + 1);
+    nodes.forEach(function (n) { insert(root, n, 0); });
+    return root;
+  }
+  function push(a, dx, dy, mass) {
+    var d2 = dx * dx + dy * dy || 1;
+    if (d2 > REPEL_R2) return;
+    var d = Math.sqrt(d2), f = 640 * mass / d2;
+    a.vx -= dx / d * f;
+    a.vy -= dy / d * f;
+  }
+  function repel(a, c) {
+    if (!c) return;
+    // 셀까지의 최단 거리가 반발 반경 밖이면 통째로 건너뜀
+    var ox = Math.max(c.x - a.x, 0, a.x - c.x - c.s), oy = Math.max(c.y - a.y, 0, a.y - c.y - c.s);
+    if (ox * ox + oy * oy > REPEL_R2) return;
+    if (!c.kids) {
+      c.bodies.forEach(function (b) { if (b !== a) push(a, b.x - a.x, b.y - a.y, 1); });
+      return;
+    }
+    var dx = c.cx - a.x, dy = c.cy - a.y;
+    var inside = ox === 0 && oy === 0;
+    if (!inside && c.s * c.s < THETA * THETA * (dx * dx + dy * dy)) {
+      push(a, dx, dy, c.n);
+      return;
     }
+    for (var q = 0; q < 4; q++) repel(a, c.kids[q]);
+  }
+
+  function tick() {
+    var root = buildTree();
+    nodes.forEach(function (n) {
+      if (!n.fixed && n !== dragging) repel(n, root);
+    });
+    gridDirty = true;
     links.forEach(function (l) {
       var dx = l.t.x - l.s.x, dy = l.t.y - l.s.y;
       var d = Math.sqrt(dx * dx + dy * dy) || 1;
@@ -669,13 +1193,31 @@ GRAPH_JS = r"""
     var r = canvas.getBoundingClientRect();
     return { x: e.clientX - r.left, y: e.clientY - r.top };
   }
+  // 히트 테스트: 노드 위치가 바뀐 뒤 처음 필요할 때 격자(GRID px 칸)로 묶어 두고 주변 9칸만 검사
+  var GRID = 2 * (25 + 4), grid = null, gridDirty = true;
+  nodes.forEach(function (n, i) { n.i = i; });
+  function gridKey(gx, gy) { return gx + ',' + gy; }
+  function buildGrid() {
+    grid = {};
+    nodes.forEach(function (n) {
+      var k = gridKey(Math.floor(n.x / GRID), Math.floor(n.y / GRID));
+      (grid[k] || (grid[k] = [])).push(n);
+    });
+    gridDirty = false;
+  }
   function hit(p) {
-    for (var i = nodes.length - 1; i >= 0; i--) {
-      var n = nodes[i];
-      var dx = p.x - n.x, dy = p.y - n.y;
-      if (dx * dx + dy * dy <= (n.r + 4) * (n.r + 4)) return n;
+    if (gridDirty || !grid) buildGrid();
+    var gx = Math.floor(p.x / GRID), gy = Math.floor(p.y / GRID), best = null;
+    for (var ix = gx - 1; ix <= gx + 1; ix++) {
+      for (var iy = gy - 1; iy <= gy + 1; iy++) {
+        (grid[gridKey(ix, iy)] || []).forEach(function (n) {
+          var dx = p.x - n.x, dy = p.y - n.y;
+          // 겹치면 나중에 그려진(위에 있는) 노드 우선
+          if (dx * dx + dy * dy <= (n.r + 4) * (n.r + 4) && (!best || n.i > best.i)) best = n;
+        });
+      }
     }
-    return null;
+    return best;
   }
   function showTip(n) {
     var html = '';
@@ -702,6 +1244,7 @@ GRAPH_JS = r"""
       dragging = n;
       moved = 0;
       canvas.setPointerCapture(e.pointerId);
+      kick();
     }
   });
   canvas.addEventListener('pointermove', function (e) {
@@ -710,11 +1253,15 @@ GRAPH_JS = r"""
       moved += Math.abs(p.x - dragging.x) + Math.abs(p.y - dragging.y);
       dragging.x = p.x;
       dragging.y = p.y;
+      gridDirty = true;
       dragging.vx = 0;
       dragging.vy = 0;
+      kick();
       return;
     }
+    var was = hover;
     hover = hit(p);
+    if (hover !== was) redraw();
     canvas.style.cursor = hover ? 'pointer' : 'grab';
     if (hover) showTip(hover);
     else tip.style.opacity = 0;
@@ -727,30 +1274,51 @@ GRAPH_JS = r"""
       if (n.type === 'a') el = document.getElementById('app-' + n.a.slug);
       else if (n.type === 'd') el = document.getElementById('pd-' + n.d.id);
       if (el) el.scrollIntoView({ behavior: 'smooth', block: 'start' });
+      else if (n.type === 'a' && window.showApp) window.showApp(n.a.slug);
     }
   });
   canvas.addEventListener('pointerleave', function () {
     hover = null;
     tip.style.opacity = 0;
+    redraw();
   });
 
-  var running = false, raf = null;
+  // 시뮬레이션은 흔들렸을 때만(드래그·리사이즈·사전 배치 없음) 돌고, 노드가 멈추면 루프를 끝낸다
+  var REST_ENERGY = 0.02, REST_FRAMES = 30;
+  var running = false, raf = null, preset = false, calm = 0;
+  var visible = !('IntersectionObserver' in window);
+  function energy() {
+    var e = 0;
+    nodes.forEach(function (n) { e += n.vx * n.vx + n.vy * n.vy; });
+    return e / nodes.length;
+  }
   function frame() {
     tick();
     tick();
     draw();
+    calm = !dragging && energy() < REST_ENERGY ? calm + 1 : 0;
+    if (!visible || calm > REST_FRAMES) { running = false; return; }
     raf = requestAnimationFrame(frame);
   }
+  function kick() {
+    calm = 0;
+    if (visible && !running) { running = true; frame(); }
+  }
+  function redraw() { if (!running) draw(); }
   if ('IntersectionObserver' in window) {
     new IntersectionObserver(function (es) {
       es.forEach(function (en) {
-        if (en.isIntersecting && !running) { running = true; frame(); }
-        else if (!en.isIntersecting && running) { running = false; cancelAnimationFrame(raf); }
+        visible = en.isIntersecting;
+        if (visible) { if (preset) redraw(); else kick(); }
+        else if (running) { running = false; cancelAnimationFrame(raf); }
       });
     }).observe(wrap);
-  } else {
-    running = true;
-    frame();
+  }
+  // 언어·테마 전환 시 라벨·색만 다시 그림
+  if ('MutationObserver' in window) {
+    new MutationObserver(redraw).observe(document.documentElement, {
+      attributes: true, attributeFilter: ['data-lang', 'data-theme']
+    });
   }
   window.addEventListener('resize', resize);
   resize();
@@ -758,88 +1326,364 @@ GRAPH_JS = r"""
 """
 
 
-def render(apps, content=None, content_en=None, problem_map=None):
+# ---------------------------------------------------------------- 증분 빌드
+
+def load_manifest():
+    """이전 빌드의 조각 캐시: {"cards": {slug: {"fp", "html"}}, "hub": {"fp", "html", "graph"}}."""
+    if MANIFEST_FILE.exists():
+        with open(MANIFEST_FILE, encoding="utf-8") as fp:
+            return json.load(fp)
+    return {"cards": {}, "hub": {}}
+
+
+def save_manifest(manifest):
+    with open(MANIFEST_FILE, "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, ensure_ascii=False)
+
+
+def _digest(obj):
+    raw = json.dumps(obj, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:20]
+
+
+# 빌더 코드가 바뀌면(템플릿 수정 등) 모든 조각을 다시 렌더
+BUILDER_FP = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:20]
+
+
+def card_fingerprint(app, copy=None, copy_en=None):
+    """카드 한 장의 입력 지문: 앱 JSON + 스토어 레코드 + 큐레이션 카피 + 로컬 스크린샷."""
+    store = {k: v for k, v in (app.get("_store") or {}).items() if k != "_meta"}
+    shots = []
+    for rel in local_shots(app["_slug"]):
+        st = (OUT_DIR / rel).stat()
+        shots.append((rel, st.st_size, st.st_mtime_ns))
+    return _digest(
+        {
+            "builder": BUILDER_FP,
+            "slug": app["_slug"],
+            "app": {k: v for k, v in app.items() if not k.startswith("_")},
+            "store": store,
+            "copy": copy or {},
+            "copy_en": copy_en or {},
+            "shots": shots,
+        }
+    )
+
+
+def incremental_renderers(manifest, stats):
+    """manifest 조각 캐시를 쓰는 (render_card, render_problem_hub) 대체 함수 쌍.
+
+    지문이 같은 조각은 이전 HTML 을 그대로 쓰고, 바뀐 조각만 다시 렌더해 manifest 를 갱신한다.
+    stats 에는 {"hit": n, "miss": n} 으로 재사용/재렌더 수를 센다.
+    """
+    cards = manifest.setdefault("cards", {})
+    fps = {}  # 허브와 카드가 같은 지문을 두 번 계산하지 않도록 slug 별로 기억
+
+    def fingerprint(app, copy, copy_en):
+        slug = app["_slug"]
+        if slug not in fps:
+            fps[slug] = card_fingerprint(app, copy, copy_en)
+        return fps[slug]
+
+    def card(app, copy=None, copy_en=None):
+        slug = app["_slug"]
+        fp = fingerprint(app, copy, copy_en)
+        hit = cards.get(slug)
+        if hit and hit.get("fp") == fp:
+            stats["hit"] += 1
+            return hit["html"]
+        stats["miss"] += 1
+        html = render_card(app, copy, copy_en)
+        cards[slug] = {"fp": fp, "html": html}
+        return html
+
+    def hub(pm, by_slug, copy_map, copy_map_en, released):
+        # 허브는 지도 + 앱 이름·아이콘·카피 전체에 걸치므로 전체 입력을 하나의 지문으로 묶는다
+        fp = _digest(
+            {
+                "builder": BUILDER_FP,
+                "pm": pm,
+                "released": [a["_slug"] for a in released],
+                "apps": {
+                    slug: fingerprint(a, copy_map.get(slug), copy_map_en.get(slug))
+                    for slug, a in by_slug.items()
+                },
+            }
+        )
+        hit = manifest.get("hub") or {}
+        if hit.get("fp") == fp:
+            stats["hit"] += 1
+            return hit["html"], hit["graph"]
+        stats["miss"] += 1
+        html, graph = render_problem_hub(pm, by_slug, copy_map, copy_map_en, released)
+        manifest["hub"] = {"fp": fp, "html": html, "graph": graph}
+        return html, graph
+
+    return card, hub
+
+
+def render(
+    apps,
+    content=None,
+    content_en=None,
+    problem_map=None,
+    card_fn=render_card,
+    hub_fn=render_problem_hub,
+):
+    """페이지 전체를 문자열로 반환 (iter_page 조각을 이어붙인 것)."""
+    return "".join(iter_page(apps, content, content_en, problem_map, card_fn, hub_fn))
+
+
+def write_page(path, chunks):
+    """조각을 받는 대로 파일에 흘려 쓴다 — 페이지 전체를 메모리에 올리지 않는다.
+
+    임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 기존 페이지는 남는다.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fp:
+        for chunk in chunks:
+            fp.write(chunk)
+    tmp.replace(path)
+
+
+def iter_page(
+    apps,
+    content=None,
+    content_en=None,
+    problem_map=None,
+    card_fn=render_card,
+    hub_fn=render_problem_hub,
+    shards=None,
+):
+    """쇼케이스 페이지를 head → 문제 지도 허브 → 카테고리 섹션(카드 단위) → footer 순으로 조각 내어 생성.
+
+    shards([(src, [slug…])]) 를 주면 섹션 대신 지연 로딩 자리표시자와 로더 스크립트를 넣는다.
+    """
     content = content or {"groups": [], "apps": {}}
     content_en = content_en or {"groups": [], "apps": {}}
     copy_map = content.get("apps", {})
     copy_map_en = content_en.get("apps", {})
-    groups_en = content_en.get("groups", [])
     by_slug = {a["_slug"]: a for a in apps}
 
     released = [a for a in apps if (a.get("_store") or {}).get("url")]
 
+    # 상단 허브: 네트워크 그래프 + 도메인별 문제 목차 (문제 해결 지도 통합)
+    toc_html, pmap_graph_json = hub_fn(
+        problem_map, by_slug, copy_map, copy_map_en, released
+    )
+
+    yield page_head(len(released))
+    yield "      " + toc_html + "\n      "
+    if shards is None:
+        sections = iter_sections(content, content_en, by_slug, released, card_fn)
+        shard_script = ""
+    else:
+        sections = iter_placeholders(shards)
+        shard_of = {slug: src for src, slugs in shards for slug in slugs}
+        shard_script = (
+            f"\n  <script>window.SHARD_OF = {json.dumps(shard_of, ensure_ascii=False)};</script>"
+            f"\n  <script>{SHARD_JS}</script>"
+        )
+    for i, section in enumerate(sections):
+        if i:
+            yield "\n"
+        yield from section
+    yield "\n"
+    yield page_tail(datetime.now(KST).strftime("%Y-%m-%d"), pmap_graph_json, shard_script)
+
+
+def plan_sections(content, content_en, by_slug, released):
+    """노출할 카테고리 섹션 목록 [(제목 HTML, 소개 HTML | None, [앱…])] — 카드 렌더는 하지 않는다.
+
+    섹션 머리의 앱 수가 카드보다 먼저 나가므로 노출 대상을 먼저 추려 둔다.
+    """
+    copy_map = content.get("apps", {})
+    groups_en = content_en.get("groups", [])
+
     def showable(app):
         # 스토어에 있거나, 큐레이션 카피가 있는 앱(예: 준비 중인 개발자 도구)만 노출
         return bool((app.get("_store") or {}).get("url")) or bool(
             copy_map.get(app["_slug"])
         )
 
-    # 카테고리 그룹 순서대로 섹션 구성 (+ 문제 목차 수집)
-    section_blocks = []
+    plan = []
     grouped_slugs = set()
     for gi, group in enumerate(content.get("groups", [])):
         group_en = groups_en[gi] if gi < len(groups_en) else {}
-        cards = []
-        for slug in group.get("slugs", []):
-            app = by_slug.get(slug)
-            if not app or not showable(app):
-                continue
-            grouped_slugs.add(slug)
-            copy = copy_map.get(slug) or {}
-            copy_en = copy_map_en.get(slug) or {}
-            cards.append(render_card(app, copy, copy_en))
-        if not cards:
+        members = [
+            by_slug[slug]
+            for slug in group.get("slugs", [])
+            if slug in by_slug and showable(by_slug[slug])
+        ]
+        grouped_slugs.update(a["_slug"] for a in members)
+        if not members:
             continue
         intro = group.get("intro", "")
         intro_html = (
             f'<p class="cat-intro">{bi(intro, group_en.get("intro"))}</p>' if intro else ""
         )
         title_html = bi(group.get("title", ""), group_en.get("title"))
-        section_blocks.append(
-            f"""
-    <section class="category">
-      <div class="cat-head">
-        <h2>{title_html}</h2>
-        {intro_html}
-        <span class="cat-count">{len(cards)}</span>
-      </div>
-      <div class="exhibits">{"".join(cards)}</div>
-    </section>"""
-        )
-
-    # 상단 허브: 네트워크 그래프 + 도메인별 문제 목차 (문제 해결 지도 통합)
-    toc_html, pmap_graph_json = render_problem_hub(
-        problem_map, by_slug, copy_map, copy_map_en, released
-    )
+        plan.append((title_html, intro_html, members))
 
     # 그룹에 빠진 출시작이 있으면 '그 외' 섹션으로 보강 (누락 방지)
-    leftovers = [
-        a
-        for a in released
-        if a["_slug"] not in grouped_slugs
-    ]
+    leftovers = [a for a in released if a["_slug"] not in grouped_slugs]
     leftovers.sort(key=lambda a: a.get("name") or "")
     if leftovers:
-        cards = "".join(
-            render_card(a, copy_map.get(a["_slug"]), copy_map_en.get(a["_slug"]))
-            for a in leftovers
-        )
-        section_blocks.append(
-            f"""
+        plan.append((bi("✨ 그 외", "✨ More"), None, leftovers))
+    return plan
+
+
+def render_section(title_html, intro_html, members, copy_map, copy_map_en, card_fn=render_card):
+    """카테고리 섹션 하나를 조각으로 낸다. 카드는 하나씩 렌더된다."""
+    head_extra = f"\n        {intro_html}" if intro_html is not None else ""
+    yield f"""
     <section class="category">
       <div class="cat-head">
-        <h2>{bi("✨ 그 외", "✨ More")}</h2>
-        <span class="cat-count">{len(leftovers)}</span>
+        <h2>{title_html}</h2>{head_extra}
+        <span class="cat-count">{len(members)}</span>
       </div>
-      <div class="exhibits">{cards}</div>
+      <div class="exhibits">"""
+    for app in members:
+        slug = app["_slug"]
+        yield card_fn(app, copy_map.get(slug) or {}, copy_map_en.get(slug) or {})
+    yield """</div>
     </section>"""
-        )
 
-    sections_html = "\n".join(section_blocks)
 
-    released_n = len(released)
-    updated = datetime.now(KST).strftime("%Y-%m-%d")
+def iter_sections(content, content_en, by_slug, released, card_fn=render_card):
+    """카테고리 그룹 순서대로 섹션마다 조각 제너레이터를 낸다."""
+    copy_map = content.get("apps", {})
+    copy_map_en = content_en.get("apps", {})
+    for title_html, intro_html, members in plan_sections(content, content_en, by_slug, released):
+        yield render_section(title_html, intro_html, members, copy_map, copy_map_en, card_fn)
 
+
+# ---------------------------------------------------------------- 샤딩 출력
+
+SHARD_DIR = OUT_DIR / "sections"
+
+# 샤드 자리표시자를 화면 근처에서 불러와 끼워 넣는 로더 (목차·그래프 링크도 필요 시 먼저 로드)
+SHARD_JS = r"""
+(function () {
+  var shardOf = window.SHARD_OF || {};
+  var loading = {};
+  function load(el) {
+    var src = el.getAttribute('data-src');
+    if (!loading[src]) {
+      loading[src] = fetch(src)
+        .then(function (r) { return r.text(); })
+        .then(function (html) { el.insertAdjacentHTML('afterend', html); el.remove(); });
+    }
+    return loading[src];
+  }
+  function jump(slug) {
+    var el = document.getElementById('app-' + slug);
+    if (el) el.scrollIntoView({ behavior: 'smooth', block: 'start' });
+    return !!el;
+  }
+  window.showApp = function (slug) {
+    if (jump(slug)) return;
+    var holder = document.querySelector('.shard[data-src="' + shardOf[slug] + '"]');
+    if (holder) load(holder).then(function () { jump(slug); });
+  };
+  var holders = Array.prototype.slice.call(document.querySelectorAll('.shard[data-src]'));
+  if ('IntersectionObserver' in window) {
+    var io = new IntersectionObserver(function (es) {
+      es.forEach(function (en) {
+        if (en.isIntersecting) { io.unobserve(en.target); load(en.target); }
+      });
+    }, { rootMargin: '800px 0px' });
+    holders.forEach(function (h) { io.observe(h); });
+  } else {
+    holders.forEach(load);
+  }
+  document.addEventListener('click', function (e) {
+    var a = e.target.closest && e.target.closest('a[href^="#app-"]');
+    if (!a) return;
+    var slug = a.getAttribute('href').slice(5);
+    if (document.getElementById('app-' + slug)) return;
+    e.preventDefault();
+    history.replaceState(null, '', '#app-' + slug);
+    window.showApp(slug);
+  });
+  if (location.hash.indexOf('#app-') === 0) window.showApp(location.hash.slice(5));
+})();
+"""
+
+
+def plan_shards(plan, shard_size=0):
+    """섹션 계획을 샤드로 묶는다. shard_size 가 0 이면 그룹(섹션)당 1샤드,
+    아니면 연속한 섹션을 앱 shard_size 개 안팎까지 한 샤드로 묶는다 (큰 섹션은 단독 샤드)."""
+    shards = []
+    for section in plan:
+        n = len(section[2])
+        if shards and shard_size and shards[-1][0] + n <= shard_size:
+            shards[-1][0] += n
+            shards[-1][1].append(section)
+        else:
+            shards.append([n, [section]])
+    return [sections for _, sections in shards]
+
+
+def clear_shards():
+    """이전 빌드의 섹션 샤드 삭제 — 남아 있으면 배포 스크립트가 docs/ 와 함께 올린다."""
+    if not SHARD_DIR.is_dir():
+        return
+    for old in SHARD_DIR.glob("*.html"):
+        old.unlink()
+    if not any(SHARD_DIR.iterdir()):
+        SHARD_DIR.rmdir()
+
+
+def write_sharded(apps, content, content_en, problem_map, card_fn=render_card,
+                  hub_fn=render_problem_hub, shard_size=0):
+    """섹션을 docs/sections/NN.html 로 나눠 쓰고, index.html 에는 허브 + 지연 로딩 자리표시자만 둔다.
+
+    첫 로드 크기가 카드 수와 무관해진다. 샤드 URL 에 내용 해시를 붙여 배포 후 캐시 문제를 피한다.
+    """
+    content = content or {"groups": [], "apps": {}}
+    content_en = content_en or {"groups": [], "apps": {}}
+    copy_map = content.get("apps", {})
+    copy_map_en = content_en.get("apps", {})
+    by_slug = {a["_slug"]: a for a in apps}
+    released = [a for a in apps if (a.get("_store") or {}).get("url")]
+
+    clear_shards()
+    SHARD_DIR.mkdir(parents=True, exist_ok=True)
+    plan = plan_sections(content, content_en, by_slug, released)
+    shards = []
+    for i, sections in enumerate(plan_shards(plan, shard_size)):
+        path = SHARD_DIR / f"{i + 1:02d}.html"
+        digest = hashlib.sha256()
+
+        def chunks():
+            for section in sections:
+                for chunk in render_section(*section, copy_map, copy_map_en, card_fn):
+                    digest.update(chunk.encode("utf-8"))
+                    yield chunk
+
+        write_page(path, chunks())
+        src = f"{SHARD_DIR.name}/{path.name}?v={digest.hexdigest()[:10]}"
+        shards.append((src, [a["_slug"] for section in sections for a in section[2]]))
+
+    write_page(
+        OUT_FILE,
+        iter_page(apps, content, content_en, problem_map, card_fn, hub_fn, shards=shards),
+    )
+    return shards
+
+
+def iter_placeholders(shards):
+    """샤드 자리표시자. 대략적인 높이를 잡아 두어 스크롤 위치가 크게 튀지 않게 한다."""
+    for src, slugs in shards:
+        yield (
+            f'\n    <div class="shard" data-src="{escape(src)}" '
+            f'style="min-height:{len(slugs) * 420}px"></div>',
+        )
+
+
+def page_head(released_n):
+    """<!DOCTYPE> 부터 본문 wrap 여는 태그까지 (인라인 CSS 포함)."""
     return f"""<!DOCTYPE html>
 <html lang="ko" data-lang="ko" data-theme="dark">
 <head>
@@ -1185,9 +2029,12 @@ try {{
 
   <main>
     <div class="wrap">
-      {toc_html}
-      {sections_html}
-    </div>
+"""
+
+
+def page_tail(updated, pmap_graph_json, shard_script=""):
+    """본문 wrap 닫는 태그부터 footer · 스크립트 · </html> 까지."""
+    return f"""    </div>
   </main>
 
   <footer>
@@ -1195,7 +2042,7 @@ try {{
   </footer>
 
   <script>window.PMAP_GRAPH = {pmap_graph_json};</script>
-  <script>{GRAPH_JS}</script>
+  <script>{GRAPH_JS}</script>{shard_script}
   <script>
   (function () {{
     var root = document.documentElement;
@@ -1296,23 +2143,74 @@ def update_readme(apps):
         print("   ✓ README.md 앱 목록 갱신")
 
 
-def main():
-    fetch = "--no-fetch" not in sys.argv
+def arg_value(name, default=None):
+    """`--name 값` 또는 `--name=값` 형태의 명령행 인자를 읽는다."""
+    for i, arg in enumerate(sys.argv):
+        if arg == name and i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+def build(fetch=True, workers=FETCH_WORKERS, batch_size=1, ttl=CACHE_TTL, swr=False,
+          incremental=False, shard_size=None, content=None, content_en=None, problem_map=None):
+    """docs/index.html (+ README 앱 목록) 생성. shard_size 가 None 이 아니면 섹션 샤딩 (0 = 그룹별).
+
+    content / content_en / problem_map 을 넘기면 파일을 다시 읽지 않는다 (watch-portfolio.py 가 재사용).
+    """
     print("📦 앱 데이터 로드 중...")
     apps = load_apps()
     print(f"   {len(apps)}개 앱 발견")
     print("🌐 앱스토어 정보 수집 중..." if fetch else "💾 캐시 사용 (--no-fetch)")
-    apps = enrich(apps, fetch=fetch)
-    content = load_content()
-    content_en = load_content_en()
-    problem_map = load_problem_map()
+    apps, pending = enrich(
+        apps, fetch=fetch, workers=workers, batch_size=batch_size, ttl=ttl, swr=swr
+    )
+    content = load_content() if content is None else content
+    content_en = load_content_en() if content_en is None else content_en
+    problem_map = load_problem_map() if problem_map is None else problem_map
     OUT_DIR.mkdir(parents=True, exist_ok=True)
-    html = render(apps, content, content_en, problem_map)
-    OUT_FILE.write_text(html, encoding="utf-8")
+    card_fn, hub_fn = render_card, render_problem_hub
+    if incremental:
+        manifest = load_manifest()
+        stats = {"hit": 0, "miss": 0}
+        card_fn, hub_fn = incremental_renderers(manifest, stats)
+    if shard_size is not None:
+        shards = write_sharded(
+            apps, content, content_en, problem_map, card_fn, hub_fn, shard_size
+        )
+        print(f"   🧩 섹션 샤드 {len(shards)}개 → {SHARD_DIR.relative_to(ROOT)}/")
+    else:
+        clear_shards()
+        write_page(OUT_FILE, iter_page(apps, content, content_en, problem_map, card_fn, hub_fn))
+    if incremental:
+        # 카탈로그에서 빠진 앱의 조각은 정리
+        live = {a["_slug"] for a in apps}
+        manifest["cards"] = {k: v for k, v in manifest["cards"].items() if k in live}
+        save_manifest(manifest)
+        print(f"   ♻️ 조각 재사용 {stats['hit']} / 다시 렌더 {stats['miss']}")
     update_readme(apps)
+    if pending:
+        print("🔄 백그라운드 재검증 결과를 캐시에 반영 (다음 빌드부터 적용)")
+        finish_revalidation(apps, pending, ttl)
     released = sum(1 for a in apps if (a.get("_store") or {}).get("url"))
     print(f"✅ 생성 완료: {OUT_FILE.relative_to(ROOT)} (출시 {released} / 전체 {len(apps)})")
 
 
+def main():
+    ttl = parse_ttl(arg_value("--ttl"))
+    if "--refresh" in sys.argv:
+        ttl = {k: 0 for k in ttl}
+    shard_size = arg_value("--shard-size")
+    build(
+        fetch="--no-fetch" not in sys.argv,
+        workers=int(arg_value("--workers", FETCH_WORKERS)),
+        batch_size=int(arg_value("--batch", 1)),
+        ttl=ttl,
+        swr="--swr" in sys.argv and "--refresh" not in sys.argv,
+        incremental="--incremental" in sys.argv,
+        shard_size=int(shard_size or 0) if "--shard" in sys.argv or shard_size else None,
+    )
+
 if __name__ == "__main__":
     main()
@@ -31,7 +31,7 @@ echo ""
 
 # 3. 대시보드 생성
 echo "📈 대시보드 업데이트 중..."
-python3 scripts/generate-dashboard.py > /dev/null 2>&1
+python3 scripts/build-graph.py dashboard > /dev/null 2>&1
 echo "   ✅ 대시보드 준비 완료"
 echo ""
 
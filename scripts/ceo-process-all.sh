@@ -51,14 +51,12 @@ echo ""
 
 # 4. 포트폴리오 요약 재생성
 echo "4️⃣  포트폴리오 요약 재생성..."
-python3 scripts/generate-portfolio-summary.py 2>/dev/null || echo "   ⚠️  요약 생성 스크립트가 없습니다"
+python3 scripts/build-graph.py summary > /dev/null 2>&1 || echo "   ⚠️  요약 생성 실패"
 echo ""
 
 # 5. 대시보드 업데이트
 echo "5️⃣  대시보드 업데이트..."
-python3 scripts/generate-dashboard.py > /dev/null 2>&1
-python3 scripts/generate-badges.py > /dev/null 2>&1
-cp dashboard/index.html docs/index.html
+python3 scripts/build-graph.py dashboard badges > /dev/null 2>&1
 echo "   ✅ 대시보드 업데이트 완료"
 echo ""
 
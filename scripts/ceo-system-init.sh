@@ -22,7 +22,7 @@ echo "📊 3. 첫 번째 브리핑 생성..."
 
 # 4. 대시보드 생성
 echo "📈 4. CEO 대시보드 생성..."
-python3 scripts/generate-dashboard.py
+python3 scripts/build-graph.py dashboard
 
 # 5. 완료 메시지
 echo ""
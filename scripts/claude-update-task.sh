@@ -33,7 +33,7 @@ claude << EOF
 apps/ 폴더에서 "$APP_NAME" 앱의 JSON 파일을 찾아서 다음 작업을 해줘:
 
 1. allTasks 배열에서 "$TASK_NAME" 태스크를 찾아 status를 "$STATUS"로 변경
-2. stats를 재계산해서 업데이트 (totalTasks, done, inProgress, notStarted)
+2. stats는 직접 세지 말고 python3 scripts/recount-stats.py {앱 slug} 로 재생성
 3. nextTasks와 recentlyCompleted 배열 업데이트
 4. portfolio-summary.json 재생성
 
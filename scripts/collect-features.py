@@ -4,11 +4,20 @@
 각 앱의 태스크를 분석하여 피처로 분류하고 메타데이터를 추가합니다.
 """
 
+import hashlib
 import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from portfolio.jsonio import save_json
+
+# 태스크 이름별 분류 결과 캐시 (키워드 표가 바뀌면 통째로 무효)
+CACHE_FILE = Path(__file__).parent / '.classify-cache.json'
+# 프로세스 풀 기동 비용이 분류 비용보다 큰 구간은 한 프로세스에서 처리
+PARALLEL_MIN_TASKS = 2000
 
 # 피처로 간주할 키워드 패턴
 FEATURE_KEYWORDS = [
@@ -64,38 +73,115 @@ CATEGORY_KEYWORDS = {
 }
 
 
-def is_feature_task(task_name: str) -> bool:
-    """태스크가 피처인지 판단"""
-    # 제외 키워드 체크
-    for pattern in EXCLUDE_KEYWORDS:
-        if re.search(pattern, task_name, re.IGNORECASE):
-            return False
+class KeywordClassifier:
+    """여러 키워드 그룹을 하나의 정규식으로 묶어, 텍스트를 한 번 훑어 그룹별 적중 수를 센다.
+
+    그룹별 점수 = 그 그룹 키워드 중 텍스트에 (대소문자 무시) 한 번 이상 나온 키워드 수.
+    키워드별로 re.search 를 돌리던 것과 같은 결과를 텍스트 길이에 비례하는 1회 스캔으로 낸다.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = list(groups)
+        owners: Dict[str, List[str]] = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                owners.setdefault(keyword.lower(), []).append(group)
+        # 긴 키워드 우선 + lookahead 로 매 위치를 검사해 겹치는 출현(예: '뷰' 와 '리뷰')도 모두 잡는다
+        alternation = "|".join(re.escape(k) for k in sorted(owners, key=len, reverse=True))
+        self.regex = re.compile(f"(?=({alternation}))", re.IGNORECASE)
+        # 같은 위치에서 시작하는 더 짧은 키워드(접두사)는 긴 쪽에 가려지므로 미리 함께 기록
+        self.implied = {
+            k: [p for p in owners if p != k and k.startswith(p)] for k in owners
+        }
+        self.owners = owners
+
+    def hits(self, text: str) -> Dict[str, int]:
+        """그룹별 적중 키워드 수 (적중 없는 그룹은 빠짐, 그룹 선언 순서 유지)"""
+        found = set()
+        for m in self.regex.finditer(text):
+            keyword = m.group(1).lower()
+            found.add(keyword)
+            found.update(self.implied[keyword])
+        counts: Dict[str, int] = {}
+        for keyword in found:
+            for group in self.owners[keyword]:
+                counts[group] = counts.get(group, 0) + 1
+        return {g: counts[g] for g in self.groups if g in counts}
+
+
+# 제외 · 피처 · 카테고리 키워드를 한 번에 훑는 분류기 (모듈 로드 시 1회 컴파일)
+CLASSIFIER = KeywordClassifier({
+    "_exclude": EXCLUDE_KEYWORDS,
+    "_feature": FEATURE_KEYWORDS,
+    **CATEGORY_KEYWORDS,
+})
+
+
+def classify_task(task_name: str) -> Tuple[bool, str]:
+    """(피처 여부, 추천 카테고리) 를 한 번의 스캔으로 계산"""
+    hits = CLASSIFIER.hits(task_name)
+    is_feature = "_exclude" not in hits and "_feature" in hits
+    scores = {c: n for c, n in hits.items() if c in CATEGORY_KEYWORDS}
+    # 동점이면 CATEGORY_KEYWORDS 선언 순서상 앞선 카테고리
+    category = max(scores, key=scores.get) if scores else "기타"
+    return is_feature, category
+
+
+# 분류 결과를 바꿀 수 있는 입력(키워드 표 + 분류 규칙 리비전)의 지문
+CLASSIFIER_VERSION = hashlib.sha256(json.dumps(
+    [1, EXCLUDE_KEYWORDS, FEATURE_KEYWORDS, CATEGORY_KEYWORDS], ensure_ascii=False
+).encode('utf-8')).hexdigest()[:16]
+
+
+def _name_key(task_name: str) -> str:
+    return hashlib.sha1(task_name.encode('utf-8')).hexdigest()[:16]
+
+
+def classify_many(task_names: Iterable[str], workers: Optional[int] = None) -> Dict[str, Tuple[bool, str]]:
+    """여러 태스크 이름을 분류. 캐시에 없는 이름만 (많으면 프로세스 풀로) 분류하고 캐시에 더한다."""
+    names = sorted(set(task_names))
+    cache = {}
+    try:
+        stored = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+        if stored.get('version') == CLASSIFIER_VERSION:
+            cache = stored.get('tasks', {})
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    results: Dict[str, Tuple[bool, str]] = {}
+    misses = []
+    for name in names:
+        hit = cache.get(_name_key(name))
+        if hit is not None:
+            results[name] = (hit[0], hit[1])
+        else:
+            misses.append(name)
+
+    if misses:
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(misses) >= PARALLEL_MIN_TASKS:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                classified = list(pool.map(classify_task, misses, chunksize=max(1, len(misses) // (workers * 4))))
+        else:
+            classified = [classify_task(name) for name in misses]
+        for name, result in zip(misses, classified):
+            results[name] = result
+            cache[_name_key(name)] = list(result)
+        tmp = CACHE_FILE.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': CLASSIFIER_VERSION, 'tasks': cache}, ensure_ascii=False), encoding='utf-8')
+        tmp.replace(CACHE_FILE)
+
+    return results
 
-    # 피처 키워드 체크
-    for pattern in FEATURE_KEYWORDS:
-        if re.search(pattern, task_name, re.IGNORECASE):
-            return True
 
-    return False
+def is_feature_task(task_name: str) -> bool:
+    """태스크가 피처인지 판단"""
+    return classify_task(task_name)[0]
 
 
 def categorize_feature(task_name: str) -> str:
     """피처의 카테고리 추천"""
-    scores = {}
-
-    for category, patterns in CATEGORY_KEYWORDS.items():
-        score = 0
-        for pattern in patterns:
-            if re.search(pattern, task_name, re.IGNORECASE):
-                score += 1
-        if score > 0:
-            scores[category] = score
-
-    if scores:
-        # 가장 높은 점수의 카테고리 반환
-        return max(scores, key=scores.get)
-
-    return "기타"
+    return classify_task(task_name)[1]
 
 
 def generate_feature_description(task_name: str, category: str) -> str:
@@ -125,37 +211,35 @@ def generate_user_value(category: str) -> str:
     return value_map.get(category, "앱 사용 경험 향상")
 
 
-def process_app_file(file_path: Path) -> Dict:
-    """앱 JSON 파일 처리"""
-    print(f"\n처리 중: {file_path.name}")
+def unlabeled_task_names(data: Dict) -> List[str]:
+    """아직 feature 라벨이 없어 분류가 필요한 태스크 이름"""
+    return [
+        task.get('name', '') for task in data.get('allTasks', [])
+        if 'feature' not in (task.get('labels') or [])
+    ]
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
 
-    app_name = data.get('name', file_path.stem)
-    all_tasks = data.get('allTasks', [])
+def transform(app_id: str, data: Dict, classified: Optional[Dict[str, Tuple[bool, str]]] = None) -> int:
+    """메모리 상의 앱 데이터에서 피처로 보이는 태스크에 라벨·메타데이터 붙이기. 반환: 새로 붙인 수
 
-    if not all_tasks:
-        print(f"  ⚠️  태스크가 없습니다")
-        return data
-
-    feature_count = 0
-    updated_tasks = []
+    classified: classify_many() 결과. 주어지면 그 결과를 쓰고, 없는 이름만 그 자리에서 분류한다.
+    """
+    tagged = 0
 
-    for task in all_tasks:
+    for task in data.get('allTasks', []):
         task_name = task.get('name', '')
 
         # 이미 feature 라벨이 있으면 스킵
         labels = task.get('labels', [])
         if labels and 'feature' in labels:
-            updated_tasks.append(task)
-            feature_count += 1
             continue
 
         # 피처로 판단되면 메타데이터 추가
-        if is_feature_task(task_name):
-            category = categorize_feature(task_name)
-
+        if classified is not None and task_name in classified:
+            is_feature, category = classified[task_name]
+        else:
+            is_feature, category = classify_task(task_name)
+        if is_feature:
             # labels 추가
             if not labels:
                 task['labels'] = ['feature']
@@ -171,12 +255,7 @@ def process_app_file(file_path: Path) -> Dict:
                     'technicalNotes': None
                 }
 
-            feature_count += 1
-            print(f"  ✓ {task_name} → [{category}]")
-
-        updated_tasks.append(task)
-
-    data['allTasks'] = updated_tasks
+            tagged += 1
 
     # stats에 todo 필드 추가 (없으면)
     if 'stats' in data:
@@ -184,6 +263,23 @@ def process_app_file(file_path: Path) -> Dict:
         if 'todo' not in stats:
             stats['todo'] = 0
 
+    return tagged
+
+
+def process_app_file(file_path: Path, data: Dict, classified: Dict[str, Tuple[bool, str]]) -> Dict:
+    """앱 JSON 데이터 처리"""
+    print(f"\n처리 중: {file_path.name}")
+
+    all_tasks = data.get('allTasks', [])
+
+    if not all_tasks:
+        print(f"  ⚠️  태스크가 없습니다")
+        return data
+
+    tagged = transform(file_path.stem, data, classified)
+    feature_count = sum(1 for t in all_tasks if 'feature' in (t.get('labels') or []))
+
+    print(f"  ✓ 새 피처 {tagged}개")
     print(f"  📊 총 {len(all_tasks)}개 태스크 중 {feature_count}개 피처 발견")
 
     return data
@@ -201,35 +297,42 @@ def main():
     print(f"📁 앱 데이터 폴더: {apps_dir}")
     print("=" * 60)
 
-    # 모든 JSON 파일 처리
+    # 모든 JSON 파일을 먼저 읽고, 분류가 필요한 태스크 이름을 한꺼번에 분류 (캐시 + 프로세스 풀)
     json_files = sorted(apps_dir.glob('*.json'))
     total_apps = len(json_files)
+    documents = {}
+    for json_file in json_files:
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                documents[json_file] = json.load(f)
+        except Exception as e:
+            print(f"❌ {json_file.name}: {e}")
+
+    classified = classify_many(
+        name for data in documents.values() for name in unlabeled_task_names(data)
+    )
+    print(f"🔎 분류 대상 태스크 이름 {len(classified)}개")
 
     for i, json_file in enumerate(json_files, 1):
+        if json_file not in documents:
+            continue
         print(f"\n[{i}/{total_apps}] {json_file.stem}")
 
         try:
-            updated_data = process_app_file(json_file)
-
-            # 백업 생성
-            backup_path = json_file.with_suffix('.json.backup')
-            if not backup_path.exists():
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    with open(backup_path, 'w', encoding='utf-8') as bf:
-                        bf.write(f.read())
-
-            # 업데이트된 데이터 저장
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(updated_data, f, ensure_ascii=False, indent=2)
+            updated_data = process_app_file(json_file, documents[json_file], classified)
 
-            print(f"  ✅ 저장 완료")
+            # 업데이트된 데이터 저장 (원본은 스냅숏으로 보관)
+            if save_json(json_file, updated_data):
+                print(f"  ✅ 저장 완료")
+            else:
+                print(f"  ⏭️  변경 없음")
 
         except Exception as e:
             print(f"  ❌ 오류: {e}")
 
     print("\n" + "=" * 60)
     print("✨ 피처 수집 완료!")
-    print(f"💡 백업 파일: *.json.backup")
+    print(f"💡 되돌리기: python3 scripts/portfolio-snapshots.py list")
 
 
 if __name__ == '__main__':
@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 """
 vision.md와 feature.md를 바탕으로 각 앱의 비전과 기능 정보를 수집하는 스크립트
+
+사용:
+    python3 scripts/collect-vision-features.py          # 이름이 (정규화 후) 같은 태스크에만 feature 정보를 붙임
+    python3 scripts/collect-vision-features.py --fuzzy  # 이름이 조금 바뀐 태스크도 같은 태스크로 봄 (매칭마다 출력)
 """
 
-import json
 import os
-from pathlib import Path
+import sys
 from datetime import datetime
 
-# 경로 설정
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import APPS_DIR
+from portfolio.jsonio import load_json, save_json
+from portfolio.tasks import TaskIndex, new_task_id, normalize_task_name
+
+# --fuzzy 일 때 이 유사도 이상이면 이름이 바뀐 같은 태스크로 본다 (difflib ratio, 정규화된 이름 기준)
+RENAME_MATCH_CUTOFF = 0.9
 
 # 앱별 비전 및 기능 정보 (기존 데이터와 추가 분석)
 APP_VISIONS = {
@@ -505,33 +512,76 @@ APP_VISIONS = {
 }
 
 
-def load_app_json(app_file):
-    """앱 JSON 파일 로드"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def transform(app_id, data, fuzzy=False):
+    """메모리 상의 앱 데이터에 vision 과 feature 정보 넣기.
 
+    fuzzy 면 이름이 조금 바뀐 태스크도 같은 태스크로 보고, 그렇게 맞춘 것은 하나씩 출력한다.
+    반환: 갱신한 feature 수 (vision 을 넣었는지는 data['vision'] 으로 본다)
+    """
+    # 이미 vision이 있으면 스킵
+    if 'vision' in data and data['vision']:
+        return 0
 
-def save_app_json(app_file, data):
-    """앱 JSON 파일 저장"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        original = f.read()
+    # vision 정보가 있는지 확인
+    if app_id not in APP_VISIONS:
+        return 0
 
-    # 백업
-    backup_file = app_file.with_suffix('.json.backup')
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(original)
+    vision_data = APP_VISIONS[app_id]
 
-    # 저장
-    with open(app_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # vision 추가
+    data['vision'] = vision_data['vision']
+
+    # feature 정보를 allTasks에 추가 (한 태스크에는 feature 하나만 — 앞 feature 가 가져간 태스크는 다시 쓰지 않음)
+    index = TaskIndex(data.get('allTasks', []))
+    claimed = set()
+    updated_count = 0
+    for feature_info in vision_data.get('features', []):
+        feature_metadata = {
+            'category': feature_info['category'],
+            'description': feature_info['description'],
+            'userValue': feature_info['userValue'],
+            'technicalNotes': feature_info['technicalNotes']
+        }
+        # 해당 feature 이름과 일치하는 task 찾기
+        task = index.find(feature_info['name'], cutoff=RENAME_MATCH_CUTOFF if fuzzy else None, exclude=claimed)
+        if task is not None:
+            claimed.add(id(task))
+            if normalize_task_name(task.get('name', '')) != normalize_task_name(feature_info['name']):
+                print(f"  ≈ {app_id}: '{feature_info['name']}' → 기존 태스크 '{task.get('name', '')}'")
+            # labels 추가
+            if 'labels' not in task:
+                task['labels'] = []
+            if 'feature' not in task['labels']:
+                task['labels'].append('feature')
+
+            # featureMetadata 추가
+            task['featureMetadata'] = feature_metadata
+            updated_count += 1
+        else:
+            # task가 없으면 새로 생성
+            new_task = {
+                'id': new_task_id(),
+                'name': feature_info['name'],
+                'status': 'not-started',
+                'targetDate': None,
+                'targetVersion': None,
+                'labels': ['feature'],
+                'featureMetadata': feature_metadata
+            }
+            data['allTasks'].append(new_task)
+            index.add(new_task)
+            claimed.add(id(new_task))
+            updated_count += 1
+
+    return updated_count
 
 
-def update_app_with_vision_features(app_file):
+def update_app_with_vision_features(app_file, fuzzy=False):
     """앱에 vision과 feature 정보 추가"""
     app_id = app_file.stem
+    data = load_json(app_file)
 
     # 이미 vision이 있으면 스킵
-    data = load_app_json(app_file)
     if 'vision' in data and data['vision']:
         print(f"✓ {data.get('name', app_id)}: 이미 vision 정보가 있습니다")
         return False
@@ -541,53 +591,10 @@ def update_app_with_vision_features(app_file):
         print(f"⚠ {data.get('name', app_id)}: vision 정보가 준비되지 않았습니다")
         return False
 
-    vision_data = APP_VISIONS[app_id]
-
-    # vision 추가
-    data['vision'] = vision_data['vision']
-
-    # feature 정보를 allTasks에 추가
-    if 'features' in vision_data:
-        updated_count = 0
-        for feature_info in vision_data['features']:
-            # 해당 feature 이름과 일치하는 task 찾기
-            for task in data.get('allTasks', []):
-                if task['name'] == feature_info['name']:
-                    # labels 추가
-                    if 'labels' not in task:
-                        task['labels'] = []
-                    if 'feature' not in task['labels']:
-                        task['labels'].append('feature')
-
-                    # featureMetadata 추가
-                    task['featureMetadata'] = {
-                        'category': feature_info['category'],
-                        'description': feature_info['description'],
-                        'userValue': feature_info['userValue'],
-                        'technicalNotes': feature_info['technicalNotes']
-                    }
-                    updated_count += 1
-                    break
-            else:
-                # task가 없으면 새로 생성
-                new_task = {
-                    'name': feature_info['name'],
-                    'status': 'not-started',
-                    'targetDate': None,
-                    'targetVersion': None,
-                    'labels': ['feature'],
-                    'featureMetadata': {
-                        'category': feature_info['category'],
-                        'description': feature_info['description'],
-                        'userValue': feature_info['userValue'],
-                        'technicalNotes': feature_info['technicalNotes']
-                    }
-                }
-                data['allTasks'].append(new_task)
-                updated_count += 1
+    updated_count = transform(app_id, data, fuzzy=fuzzy)
 
     # 저장
-    save_app_json(app_file, data)
+    save_json(app_file, data)
     print(f"✅ {data.get('name', app_id)}: vision 추가, {updated_count}개 feature 업데이트")
     return True
 
@@ -599,6 +606,7 @@ def main():
     print("=" * 60)
     print()
 
+    fuzzy = "--fuzzy" in sys.argv
     app_files = sorted(APPS_DIR.glob("*.json"))
 
     updated = 0
@@ -606,12 +614,12 @@ def main():
     missing = 0
 
     for app_file in app_files:
-        result = update_app_with_vision_features(app_file)
+        result = update_app_with_vision_features(app_file, fuzzy=fuzzy)
         if result:
             updated += 1
         elif result is False:
             app_id = app_file.stem
-            data = load_app_json(app_file)
+            data = load_json(app_file)
             if 'vision' in data and data['vision']:
                 skipped += 1
             else:
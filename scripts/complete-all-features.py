@@ -3,10 +3,9 @@
 모든 앱의 태스크를 분석하여 feature 정보를 완성하는 스크립트
 """
 
-import json
-from pathlib import Path
-
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import APPS_DIR
+from portfolio.jsonio import load_json, save_json
+from portfolio.tasks import TaskIndex
 
 # 각 앱별 태스크의 feature 메타데이터
 # 태스크 이름을 키로, feature 정보를 값으로
@@ -256,27 +255,6 @@ COMPLETE_FEATURES = {
 }
 
 
-def load_app_json(app_file):
-    """앱 JSON 파일 로드"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
-def save_app_json(app_file, data):
-    """앱 JSON 파일 저장"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        original = f.read()
-
-    # 백업
-    backup_file = app_file.with_suffix('.json.backup2')
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(original)
-
-    # 저장
-    with open(app_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
 def should_be_feature(task_name):
     """태스크가 feature로 분류될 수 있는지 판단"""
     # 제외할 패턴
@@ -295,39 +273,42 @@ def should_be_feature(task_name):
     return True
 
 
-def complete_features(app_file):
-    """앱의 feature 정보 완성"""
-    app_id = app_file.stem
-    data = load_app_json(app_file)
-
+def transform(app_id, data):
+    """메모리 상의 앱 데이터에 feature 정보 채우기. 반환: 채운 feature 수"""
     updated_count = 0
 
     # 앱별 feature 정보가 있는 경우
     if app_id in COMPLETE_FEATURES:
-        features_map = COMPLETE_FEATURES[app_id]
-
-        for task in data.get('allTasks', []):
-            task_name = task['name']
+        index = TaskIndex(data.get('allTasks', []))
 
-            # 이미 feature 메타데이터가 있으면 스킵
-            if 'featureMetadata' in task and task['featureMetadata']:
-                continue
+        for task_name, feature_metadata in COMPLETE_FEATURES[app_id].items():
+            for task in index.get_all(task_name):
+                # 이미 feature 메타데이터가 있으면 스킵
+                if 'featureMetadata' in task and task['featureMetadata']:
+                    continue
 
-            # feature 정보가 있는 경우 추가
-            if task_name in features_map:
                 # labels 추가
                 if 'labels' not in task:
                     task['labels'] = []
                 if 'feature' not in task['labels']:
                     task['labels'].append('feature')
 
-                # featureMetadata 추가
-                task['featureMetadata'] = features_map[task_name]
+                # featureMetadata 추가 (파이프라인에서 여러 앱이 같은 dict 를 공유하지 않도록 복사)
+                task['featureMetadata'] = dict(feature_metadata)
                 updated_count += 1
 
+    return updated_count
+
+
+def complete_features(app_file):
+    """앱의 feature 정보 완성"""
+    app_id = app_file.stem
+    data = load_json(app_file)
+    updated_count = transform(app_id, data)
+
     # 저장
     if updated_count > 0:
-        save_app_json(app_file, data)
+        save_json(app_file, data)
         print(f"✅ {data.get('name', app_id)}: {updated_count}개 feature 완성")
         return True
     else:
@@ -6,18 +6,14 @@ set -e
 echo "🚀 GitHub Pages 배포 준비 중..."
 echo ""
 
-# 1. 대시보드 생성
+# 1~2. 대시보드 · 통계 페이지 생성 (바뀐 것만)
 echo "📊 1. 대시보드 생성..."
-python3 scripts/generate-dashboard.py
-
-# 2. 통계 페이지 생성
 echo "📈 2. 통계 페이지 생성..."
-python3 scripts/generate-badges.py
+python3 scripts/build-graph.py dashboard badges
 
-# 3. docs 폴더로 복사
-echo "📁 3. docs 폴더로 복사..."
-mkdir -p docs
-cp dashboard/index.html docs/index.html
+# 3. 쇼케이스 사이트 (docs/index.html 은 site 대상이 만든다 — 대시보드를 복사하지 않음)
+echo "📁 3. 쇼케이스 사이트 생성..."
+python3 scripts/build-graph.py site
 
 # 4. 데이터 검증
 echo "🔍 4. 데이터 검증..."
@@ -3,10 +3,7 @@
 전체 앱의 feature 통계 요약
 """
 
-import json
-from pathlib import Path
-
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import PortfolioStore
 
 
 def main():
@@ -16,18 +13,15 @@ def main():
     print("=" * 80)
     print()
 
-    app_files = sorted(APPS_DIR.glob("*.json"))
+    store = PortfolioStore.load()
 
     total_features = 0
     apps_with_features = 0
     feature_breakdown = {}
 
-    for app_file in app_files:
-        with open(app_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        app_name = data.get('name', app_file.stem)
-        all_tasks = data.get('allTasks', [])
+    for app in store:
+        app_name = app.name
+        all_tasks = app.tasks
 
         # feature 태스크 찾기
         features = []
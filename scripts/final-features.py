@@ -3,10 +3,8 @@
 마지막 남은 feature들 추가
 """
 
-import json
-from pathlib import Path
-
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import APPS_DIR
+from portfolio.jsonio import load_json, save_json
 
 FINAL_FEATURES = {
     "bucket-climb": {
@@ -36,31 +34,10 @@ FINAL_FEATURES = {
 }
 
 
-def load_app_json(app_file):
-    """앱 JSON 파일 로드"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
-def save_app_json(app_file, data):
-    """앱 JSON 파일 저장"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        original = f.read()
-
-    # 백업
-    backup_file = app_file.with_suffix('.json.backup4')
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(original)
-
-    # 저장
-    with open(app_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
 def add_final_features(app_file):
     """마지막 feature 추가"""
     app_id = app_file.stem
-    data = load_app_json(app_file)
+    data = load_json(app_file)
 
     if app_id not in FINAL_FEATURES:
         return 0
@@ -84,7 +61,7 @@ def add_final_features(app_file):
             updated_count += 1
 
     if updated_count > 0:
-        save_app_json(app_file, data)
+        save_json(app_file, data)
         print(f"✅ {data.get('name', app_id)}: {updated_count}개 feature 추가")
         return updated_count
     else:
@@ -3,10 +3,7 @@
 각 앱에서 feature로 분류되지 않은 태스크들을 찾는 스크립트
 """
 
-import json
-from pathlib import Path
-
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import PortfolioStore
 
 
 def should_be_feature(task_name):
@@ -42,14 +39,9 @@ def main():
     print("=" * 80)
     print()
 
-    app_files = sorted(APPS_DIR.glob("*.json"))
-
-    for app_file in app_files:
-        with open(app_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        app_name = data.get('name', app_file.stem)
-        all_tasks = data.get('allTasks', [])
+    for app in PortfolioStore.load():
+        app_name = app.name
+        all_tasks = app.tasks
 
         # feature가 아닌 태스크 찾기
         non_features = []
@@ -64,7 +56,7 @@ def main():
                     non_features.append(task['name'])
 
         if non_features:
-            print(f"\n## {app_name} ({app_file.stem})")
+            print(f"\n## {app_name} ({app.slug})")
             print(f"   Feature 후보: {len(non_features)}개")
             for task_name in non_features:
                 print(f"   - {task_name}")
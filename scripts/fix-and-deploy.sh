@@ -16,9 +16,8 @@ echo ""
 
 # 2. 대시보드 재생성
 echo "📊 2. 대시보드 재생성 중..."
-python3 scripts/generate-dashboard.py
-python3 scripts/generate-badges.py
-cp dashboard/index.html docs/index.html
+# docs/index.html 은 쇼케이스 사이트(site 대상)가 만든다 — 대시보드는 dashboard/index.html
+python3 scripts/build-graph.py dashboard badges site
 
 echo "✅ 대시보드 생성 완료"
 echo ""
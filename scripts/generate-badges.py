@@ -78,7 +78,7 @@ def generate_badges():
         filled = int(progress / 10)
         bar = '█' * filled + '░' * (10 - filled)
 
-        next_task = app.get('nextTasks', ['없음'])[0]
+        next_task = (app.get('nextTasks') or ['없음'])[0]
 
         priority_list += f"- **{app.get('name')}** v{app.get('currentVersion')} "
         priority_list += f"`{bar}` {progress:.0f}% ({done}/{total})\n"
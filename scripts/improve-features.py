@@ -8,6 +8,9 @@ import json
 from pathlib import Path
 from typing import Dict, List
 
+from portfolio.jsonio import save_json
+from portfolio.tasks import TaskIndex
+
 # 앱별 맞춤형 피처 설명 (사용자 관점: "이 앱은 뭐하는 앱이야?")
 APP_FEATURE_IMPROVEMENTS = {
     # 꿈을 찾아서 (Bucket Climb) - 버킷리스트 관리 앱
@@ -206,6 +209,34 @@ APP_FEATURE_IMPROVEMENTS = {
 }
 
 
+def transform(app_id: str, data: Dict) -> int:
+    """메모리 상의 앱 데이터 피처 설명을 개선본으로 바꾸기. 반환: 바꾼 피처 수"""
+    index = TaskIndex(data.get('allTasks', []))
+    improved_count = 0
+
+    for task_name, improvement in APP_FEATURE_IMPROVEMENTS.get(app_id, {}).items():
+        for task in index.get_all(task_name):
+            # 기존 메타데이터 가져오기 (없으면 생성)
+            if 'featureMetadata' not in task:
+                task['featureMetadata'] = {}
+
+            if 'labels' not in task or 'feature' not in task['labels']:
+                if 'labels' not in task:
+                    task['labels'] = []
+                task['labels'].append('feature')
+
+            # 개선된 내용으로 업데이트
+            task['featureMetadata']['description'] = improvement['description']
+            task['featureMetadata']['userValue'] = improvement['userValue']
+
+            if improvement.get('technicalNotes'):
+                task['featureMetadata']['technicalNotes'] = improvement['technicalNotes']
+
+            improved_count += 1
+
+    return improved_count
+
+
 def improve_features():
     """피처 설명 개선"""
     apps_dir = Path(__file__).parent.parent / 'projects/PortfolioCEO/PortfolioCEO/Data/apps'
@@ -215,7 +246,7 @@ def improve_features():
 
     improved_count = 0
 
-    for app_id, improvements in APP_FEATURE_IMPROVEMENTS.items():
+    for app_id in APP_FEATURE_IMPROVEMENTS:
         json_file = apps_dir / f"{app_id}.json"
 
         if not json_file.exists():
@@ -228,36 +259,13 @@ def improve_features():
         app_name = data.get('name', app_id)
         print(f"\n📱 {app_name}")
 
-        updated = False
-        for task in data.get('allTasks', []):
-            task_name = task.get('name', '')
-
-            if task_name in improvements:
-                # 기존 메타데이터 가져오기 (없으면 생성)
-                if 'featureMetadata' not in task:
-                    task['featureMetadata'] = {}
-
-                if 'labels' not in task or 'feature' not in task['labels']:
-                    if 'labels' not in task:
-                        task['labels'] = []
-                    task['labels'].append('feature')
-
-                # 개선된 내용으로 업데이트
-                improvement = improvements[task_name]
-                task['featureMetadata']['description'] = improvement['description']
-                task['featureMetadata']['userValue'] = improvement['userValue']
-
-                if improvement.get('technicalNotes'):
-                    task['featureMetadata']['technicalNotes'] = improvement['technicalNotes']
-
-                print(f"  ✓ {task_name}")
-                improved_count += 1
-                updated = True
+        count = transform(app_id, data)
+        improved_count += count
 
         # 파일 저장
-        if updated:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+        if count:
+            print(f"  ✓ {count}개 피처")
+            save_json(json_file, data)
             print(f"  💾 저장 완료")
 
     print("\n" + "=" * 60)
@@ -4,7 +4,7 @@
 set -e
 
 echo "📊 대시보드 생성 중..."
-python3 scripts/generate-dashboard.py
+python3 scripts/build-graph.py dashboard
 
 echo ""
 echo "🌐 브라우저에서 대시보드 열기..."
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+앱 · 태스크 SQLite 색인 도구
+
+Data/apps/*.json 을 scripts/.portfolio-index.sqlite 로 미러링하고 (바뀐 파일만 다시 적재)
+전 포트폴리오 태스크를 색인으로 조회한다.
+
+사용:
+    python3 scripts/portfolio-index.py sync
+    python3 scripts/portfolio-index.py tasks --status not-started --label feature
+    python3 scripts/portfolio-index.py tasks --category "빠른 입력" --app clip-keyboard
+    python3 scripts/portfolio-index.py stats
+    python3 scripts/portfolio-index.py sql "SELECT app, COUNT(*) FROM tasks GROUP BY app"
+"""
+
+import argparse
+import sys
+
+from portfolio.index import PortfolioIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 · 태스크 SQLite 색인")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("sync", help="바뀐 앱 JSON 만 색인에 반영")
+    tasks = sub.add_parser("tasks", help="조건에 맞는 태스크 조회")
+    tasks.add_argument("--status")
+    tasks.add_argument("--label")
+    tasks.add_argument("--category")
+    tasks.add_argument("--app")
+    sub.add_parser("stats", help="상태별 태스크 수")
+    sql = sub.add_parser("sql", help="임의 SQL 실행 (읽기 전용 용도)")
+    sql.add_argument("statement")
+    args = parser.parse_args()
+
+    with PortfolioIndex() as index:
+        result = index.sync()
+        if args.command == "sync":
+            print(f"✅ 색인 동기화: 갱신 {len(result['updated'])}개, 삭제 {len(result['removed'])}개")
+            for slug in result["errors"]:
+                print(f"  ❌ {slug}.json: JSON 파싱 오류 (이전 색인 유지)")
+        elif args.command == "tasks":
+            rows = index.tasks(args.status, args.label, args.category, args.app)
+            for row in rows:
+                category = f" [{row['category']}]" if row["category"] else ""
+                print(f"{row['app']:24s} #{row['position']:<3d} {row['status'] or '-':12s} {row['name']}{category}")
+            print(f"\n총 {len(rows)}개")
+        elif args.command == "stats":
+            for status, n in sorted(index.status_counts().items(), key=lambda x: -x[1]):
+                print(f"{status or '-':12s} {n:5d}")
+        else:
+            for row in index.query(args.statement):
+                print("\t".join("" if v is None else str(v) for v in tuple(row)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
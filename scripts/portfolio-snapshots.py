@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+스냅숏 조회 · 비교 · 복원
+
+변경 스크립트가 save_json() 으로 덮어쓴 파일의 이전 내용은 실행 단위로
+scripts/.backups/ 에 남는다. 이 도구로 실행 기록을 보고, 현재 파일과 비교하고, 되돌린다.
+
+사용:
+    python3 scripts/portfolio-snapshots.py list [--file clip-keyboard]
+    python3 scripts/portfolio-snapshots.py diff <run-id> [파일 ...]
+    python3 scripts/portfolio-snapshots.py restore <run-id> [파일 ...] [--dry-run]
+
+<run-id> 는 앞부분만 적어도 된다 (예: 20261017-0804). 파일은 경로 일부로 거른다.
+복원도 실행 1회로 기록되므로 복원 자체를 다시 되돌릴 수 있다.
+"""
+
+import argparse
+import difflib
+import sys
+
+from portfolio import ROOT
+from portfolio.jsonio import SNAPSHOTS, write_atomic
+
+
+def select(files, patterns):
+    if not patterns:
+        return sorted(files)
+    return sorted(f for f in files if any(p in f for p in patterns))
+
+
+def read_current(name):
+    path = ROOT / name
+    return path.read_bytes() if path.exists() else None
+
+
+def cmd_list(args):
+    runs = SNAPSHOTS.runs()
+    for run in runs:
+        files = select(run["files"], [args.file] if args.file else [])
+        if not files:
+            continue
+        print(f"{run['id']}  {run['at']}  {run['script']:36s} 파일 {len(files)}개")
+        if args.file:
+            for name in files:
+                print(f"    {name}")
+    if not runs:
+        print("스냅숏 없음")
+
+
+def cmd_diff(args):
+    run = SNAPSHOTS.run(args.run)
+    for name in select(run["files"], args.files):
+        sha = run["files"][name]
+        before = SNAPSHOTS.get(sha).decode("utf-8") if sha else ""
+        current = read_current(name)
+        after = current.decode("utf-8") if current is not None else ""
+        sys.stdout.writelines(difflib.unified_diff(
+            before.splitlines(keepends=True), after.splitlines(keepends=True),
+            fromfile=f"{name}@{run['id']}", tofile=f"{name}@현재",
+        ))
+
+
+def cmd_restore(args):
+    run = SNAPSHOTS.run(args.run)
+    # 복원도 실행 1회로 기록되며 그때 오래된 실행이 정리된다 — 대상 실행은 지우지 않고,
+    # 기록을 시작하기 전에 복원할 내용을 전부 읽어 둔다
+    SNAPSHOTS.pinned.add(run["id"])
+    plan = []
+    for name in select(run["files"], args.files):
+        sha = run["files"][name]
+        raw = SNAPSHOTS.get(sha) if sha else None
+        current = read_current(name)
+        if raw != current:
+            plan.append((name, raw, current))
+    restored = 0
+    for name, raw, current in plan:
+        path = ROOT / name
+        restored += 1
+        if args.dry_run:
+            print(f"  ↩️  {name}{' (삭제)' if raw is None else ''}")
+            continue
+        SNAPSHOTS.record(path, current)
+        if raw is None:
+            path.unlink()
+            print(f"  🗑️  {name}")
+        else:
+            write_atomic(path, raw, mode_from=path if current is not None else None)
+            print(f"  ↩️  {name}")
+    suffix = " (dry-run)" if args.dry_run else ""
+    print(f"✅ {run['id']} 이전 상태로 {restored}개 파일 복원{suffix}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스냅숏 조회 · 비교 · 복원")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("list", help="실행 기록 목록")
+    p.add_argument("--file", help="이 경로 일부를 포함한 파일이 있는 실행만")
+    p = sub.add_parser("diff", help="실행 전 내용과 현재 파일 비교")
+    p.add_argument("run")
+    p.add_argument("files", nargs="*")
+    p = sub.add_parser("restore", help="실행 전 내용으로 되돌리기")
+    p.add_argument("run")
+    p.add_argument("files", nargs="*")
+    p.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        {"list": cmd_list, "diff": cmd_diff, "restore": cmd_restore}[args.command](args)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return 1
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""
+포트폴리오 스크립트 공용 패키지
+"""
+
+from .paths import APPS_DIR, DATA_DIR, ROOT, SUMMARY_FILE
+from .store import AppEntry, PortfolioStore
+
+__all__ = ["APPS_DIR", "DATA_DIR", "ROOT", "SUMMARY_FILE", "AppEntry", "PortfolioStore"]
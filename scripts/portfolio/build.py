@@ -0,0 +1,233 @@
+"""
+생성 스크립트 빌드 그래프
+
+대상(target)마다 실행할 스크립트, 입력 · 출력 파일(저장소 루트 기준 glob)을 선언하면
+한 대상의 출력이 다른 대상의 입력과 겹치는 곳에서 의존 관계가 생긴다.
+마지막 성공 빌드의 입력 · 출력 내용 해시를 상태 파일에 남겨 두고, 해시가 달라진
+대상만 다시 실행한다. 서로 의존하지 않는 대상은 동시에 실행한다.
+
+파일 해시는 (mtime, 크기) 가 그대로면 다시 계산하지 않는다.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from .paths import ROOT
+
+STATE_FILE = ROOT / "scripts" / ".build-state.json"
+STATE_VERSION = 1
+
+
+class Target:
+    """빌드 대상 하나. command 는 python3 로 실행할 인자 목록 (첫 항목이 스크립트)."""
+
+    __slots__ = ("name", "command", "inputs", "outputs")
+
+    def __init__(self, name: str, command: Sequence[str], inputs: Sequence[str], outputs: Sequence[str] = ()):
+        self.name = name
+        self.command = list(command)
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+
+    def input_files(self) -> List[str]:
+        """입력 패턴에 맞는 (지금 있는) 파일들 — 루트 기준 상대 경로"""
+        files = set()
+        for pattern in self.inputs:
+            for path in ROOT.glob(pattern):
+                if path.is_file():
+                    files.add(path.relative_to(ROOT).as_posix())
+        return sorted(files)
+
+    def consumes(self, rel: str) -> bool:
+        return any(fnmatch.fnmatchcase(rel, pattern) for pattern in self.inputs)
+
+    def __repr__(self):
+        return f"Target({self.name!r})"
+
+
+class BuildState:
+    """파일 해시 캐시 + 대상별 마지막 성공 빌드의 입력 · 출력 해시"""
+
+    def __init__(self, path: Path = STATE_FILE):
+        self.path = Path(path)
+        self.files: Dict[str, Dict] = {}  # 상대 경로 → {"mtime_ns", "size", "sha"}
+        self.targets: Dict[str, Dict[str, Dict[str, Optional[str]]]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") == STATE_VERSION:
+            self.files = data.get("files", {})
+            self.targets = data.get("targets", {})
+
+    def sha(self, rel: str) -> Optional[str]:
+        """파일 내용 해시. 없는 파일은 None"""
+        path = ROOT / rel
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.files.pop(rel, None)
+            return None
+        known = self.files.get(rel)
+        if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            return known["sha"]
+        sha = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.files[rel] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha": sha}
+        return sha
+
+    def hashes(self, rels: Iterable[str]) -> Dict[str, Optional[str]]:
+        return {rel: self.sha(rel) for rel in rels}
+
+    def stale_reason(self, target: Target) -> Optional[str]:
+        """다시 빌드해야 하는 이유, 최신이면 None"""
+        record = self.targets.get(target.name)
+        if record is None:
+            return "처음 빌드"
+        inputs = self.hashes(target.input_files())
+        if inputs != record["inputs"]:
+            changed = sorted(rel for rel in inputs.keys() | record["inputs"].keys()
+                             if inputs.get(rel) != record["inputs"].get(rel))
+            more = f" 외 {len(changed) - 3}개" if len(changed) > 3 else ""
+            return f"입력 변경: {', '.join(changed[:3])}{more}"
+        for rel, sha in self.hashes(target.outputs).items():
+            if sha is None:
+                return f"출력 없음: {rel}"
+            if sha != record["outputs"].get(rel):
+                return f"출력 변경: {rel}"
+        return None
+
+    def record(self, target: Target):
+        self.targets[target.name] = {
+            "inputs": self.hashes(target.input_files()),
+            "outputs": self.hashes(target.outputs),
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "version": STATE_VERSION,
+            "files": self.files,
+            "targets": self.targets,
+        }, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class BuildGraph:
+    def __init__(self, targets: Sequence[Target], state: Optional[BuildState] = None):
+        self.targets = {t.name: t for t in targets}
+        self.state = state or BuildState()
+        # 의존: b 의 입력 패턴이 a 의 출력에 맞으면 a → b
+        self.deps: Dict[str, Set[str]] = {
+            b.name: {a.name for a in targets if a is not b and any(b.consumes(out) for out in a.outputs)}
+            for b in targets
+        }
+        self.order()  # 순환 검사
+
+    def order(self) -> List[str]:
+        """위상 정렬 (선언 순서 유지)"""
+        done: List[str] = []
+        visiting: Set[str] = set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"빌드 그래프에 순환이 있습니다: {name}")
+            visiting.add(name)
+            for dep in sorted(self.deps[name]):
+                visit(dep)
+            visiting.discard(name)
+            done.append(name)
+
+        for name in self.targets:
+            visit(name)
+        return done
+
+    def closure(self, names: Iterable[str]) -> List[str]:
+        """요청한 대상 + 그 상류 대상 전부 (위상 순서)"""
+        wanted: Set[str] = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name not in self.targets:
+                raise KeyError(f"알 수 없는 대상: {name}")
+            if name not in wanted:
+                wanted.add(name)
+                stack.extend(self.deps[name])
+        return [name for name in self.order() if name in wanted]
+
+    def _execute(self, target: Target):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, *target.command], cwd=ROOT,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        )
+        return proc.returncode, proc.stdout, time.perf_counter() - started
+
+    def run(self, names: Optional[Iterable[str]] = None, jobs: int = 4,
+            force: bool = False, dry_run: bool = False, verbose: bool = False) -> bool:
+        """오래된 대상만 실행. 실패한 대상의 하류는 건너뛴다. 모두 성공(또는 최신)이면 True"""
+        pending = self.closure(names or self.targets)
+        ok: Set[str] = set()
+        rebuilt: Set[str] = set()
+        failed: Set[str] = set()
+        running = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+                while pending or running:
+                    # 상태 판정 · 기록은 이 (메인) 스레드에서만 한다
+                    for name in list(pending):
+                        deps = self.deps[name] & set(self.targets)
+                        if deps & failed:
+                            pending.remove(name)
+                            failed.add(name)
+                            print(f"  ⏭️  {name}: 상류 실패로 건너뜀")
+                            continue
+                        if not deps <= ok:
+                            continue
+                        pending.remove(name)
+                        target = self.targets[name]
+                        reason = "강제 빌드" if force else self.state.stale_reason(target)
+                        if reason is None and dry_run and deps & rebuilt:
+                            reason = "상류 재빌드 예정"
+                        if reason is None:
+                            ok.add(name)
+                            if verbose:
+                                print(f"  ✔️  {name}: 최신")
+                            continue
+                        if dry_run:
+                            print(f"  🔨 {name}: {reason}")
+                            ok.add(name)
+                            rebuilt.add(name)
+                            continue
+                        print(f"  🔨 {name}: {reason}")
+                        running[pool.submit(self._execute, target)] = name
+                    if not running:
+                        continue
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name = running.pop(future)
+                        code, output, elapsed = future.result()
+                        if verbose or code != 0:
+                            sys.stdout.write(output)
+                        if code != 0:
+                            failed.add(name)
+                            print(f"  ❌ {name}: 종료 코드 {code}")
+                            continue
+                        self.state.record(self.targets[name])
+                        ok.add(name)
+                        rebuilt.add(name)
+                        print(f"  ✅ {name} ({elapsed:.1f}s)")
+        finally:
+            if not dry_run:
+                self.state.save()
+        return not failed
@@ -0,0 +1,246 @@
+"""
+앱 · 태스크 SQLite 색인
+
+Data/apps/*.json 을 SQLite 로 미러링해 전 포트폴리오에 걸친 질의를 색인으로 처리한다.
+동기화는 파일 mtime → 내용 해시 순으로 비교해 바뀐 앱만 다시 적재한다.
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .paths import APPS_DIR, ROOT
+
+INDEX_FILE = ROOT / "scripts" / ".portfolio-index.sqlite"
+# SCHEMA 가 바뀌면 올린다 — 버전이 다른 색인 파일은 비우고 다시 적재 (PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+FEATURE_FIELDS = (
+    "category", "description", "userValue", "technicalNotes",
+    "usageScenario", "problemSolved", "userBenefit",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    slug TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    sha TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS apps (
+    slug TEXT PRIMARY KEY,
+    name TEXT, nameEn TEXT, bundleId TEXT, appStoreId TEXT,
+    status TEXT, priority TEXT, currentVersion TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS apps_status ON apps(status);
+CREATE INDEX IF NOT EXISTS apps_bundle ON apps(bundleId);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    app TEXT NOT NULL REFERENCES apps(slug) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT, status TEXT, priority TEXT,
+    targetDate TEXT, targetVersion TEXT,
+    data TEXT NOT NULL,
+    UNIQUE (app, position)
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks(status);
+CREATE TABLE IF NOT EXISTS task_labels (
+    task INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    label TEXT NOT NULL,
+    PRIMARY KEY (task, label)
+);
+CREATE INDEX IF NOT EXISTS task_labels_label ON task_labels(label, task);
+CREATE TABLE IF NOT EXISTS feature_metadata (
+    task INTEGER PRIMARY KEY REFERENCES tasks(id) ON DELETE CASCADE,
+    category TEXT, description TEXT, userValue TEXT, technicalNotes TEXT,
+    usageScenario TEXT, problemSolved TEXT, userBenefit TEXT
+);
+CREATE INDEX IF NOT EXISTS feature_metadata_category ON feature_metadata(category);
+CREATE TABLE IF NOT EXISTS vision (
+    app TEXT PRIMARY KEY REFERENCES apps(slug) ON DELETE CASCADE,
+    tagline TEXT, coreValue TEXT, targetUsers TEXT, uniqueSellingPoint TEXT,
+    conceptDescription TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS potential (
+    app TEXT PRIMARY KEY REFERENCES apps(slug) ON DELETE CASCADE,
+    marketSize TEXT,
+    data TEXT NOT NULL
+);
+"""
+
+
+def _dump(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True)
+
+
+class PortfolioIndex:
+    """앱 JSON 의 SQLite 미러. sync() 로 최신화하고 tasks() / query() 로 질의한다."""
+
+    def __init__(self, db_path: Path = INDEX_FILE, apps_dir: Path = APPS_DIR):
+        self.db_path = Path(db_path)
+        self.apps_dir = Path(apps_dir)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._drop_tables()
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _drop_tables(self):
+        """이전 스키마의 테이블을 모두 지운다 (색인은 앱 JSON 에서 언제든 다시 만들 수 있다)"""
+        tables = [row[0] for row in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )]
+        for table in tables:
+            self.conn.execute(f'DROP TABLE "{table}"')
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------ 동기화
+
+    def sync(self) -> Dict[str, List[str]]:
+        """바뀐 파일만 다시 적재한다. 반환: {"updated": [...], "removed": [...], "errors": [...]}"""
+        known = {
+            row["slug"]: (row["mtime_ns"], row["sha"])
+            for row in self.conn.execute("SELECT slug, mtime_ns, sha FROM files")
+        }
+        result = {"updated": [], "removed": [], "errors": []}
+        seen = set()
+        with self.conn:
+            for path in sorted(self.apps_dir.glob("*.json")):
+                slug = path.stem
+                seen.add(slug)
+                mtime = path.stat().st_mtime_ns
+                if slug in known and known[slug][0] == mtime:
+                    continue
+                raw = path.read_bytes()
+                sha = hashlib.sha256(raw).hexdigest()
+                if slug in known and known[slug][1] == sha:
+                    # touch 만 된 파일 — 내용은 그대로
+                    self.conn.execute("UPDATE files SET mtime_ns = ? WHERE slug = ?", (mtime, slug))
+                    continue
+                try:
+                    data = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    result["errors"].append(slug)
+                    continue
+                self._load_app(slug, data)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files (slug, mtime_ns, sha) VALUES (?, ?, ?)",
+                    (slug, mtime, sha),
+                )
+                result["updated"].append(slug)
+            for slug in sorted(set(known) - seen):
+                self.conn.execute("DELETE FROM apps WHERE slug = ?", (slug,))
+                self.conn.execute("DELETE FROM files WHERE slug = ?", (slug,))
+                result["removed"].append(slug)
+        return result
+
+    def _load_app(self, slug: str, data: Dict[str, Any]):
+        c = self.conn
+        c.execute("DELETE FROM apps WHERE slug = ?", (slug,))  # 태스크·비전 등은 CASCADE 로 함께 삭제
+        c.execute(
+            "INSERT INTO apps (slug, name, nameEn, bundleId, appStoreId, status, priority,"
+            " currentVersion, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                slug, data.get("name"), data.get("nameEn"), data.get("bundleId"),
+                str(data["appStoreId"]) if data.get("appStoreId") else None,
+                data.get("status"), data.get("priority"), data.get("currentVersion"),
+                _dump({k: v for k, v in data.items() if k not in ("allTasks", "vision")}),
+            ),
+        )
+        for pos, task in enumerate(data.get("allTasks", [])):
+            cur = c.execute(
+                "INSERT INTO tasks (app, position, name, status, priority, targetDate,"
+                " targetVersion, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    slug, pos, task.get("name"), task.get("status"), task.get("priority"),
+                    task.get("targetDate"), task.get("targetVersion"), _dump(task),
+                ),
+            )
+            task_id = cur.lastrowid
+            # 같은 라벨이 여러 번 달린 태스크도 라벨 행은 하나 (라벨 필터가 태스크를 중복해 내지 않도록)
+            c.executemany(
+                "INSERT OR IGNORE INTO task_labels (task, label) VALUES (?, ?)",
+                [(task_id, label) for label in task.get("labels") or []],
+            )
+            meta = task.get("featureMetadata")
+            if meta:
+                c.execute(
+                    f"INSERT INTO feature_metadata (task, {', '.join(FEATURE_FIELDS)})"
+                    f" VALUES (?{', ?' * len(FEATURE_FIELDS)})",
+                    (task_id, *(meta.get(f) for f in FEATURE_FIELDS)),
+                )
+        vision = data.get("vision")
+        if isinstance(vision, dict):
+            c.execute(
+                "INSERT INTO vision (app, tagline, coreValue, targetUsers, uniqueSellingPoint,"
+                " conceptDescription, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    slug, vision.get("tagline"), vision.get("coreValue"),
+                    vision.get("targetUsers"), vision.get("uniqueSellingPoint"),
+                    vision.get("conceptDescription"),
+                    _dump({k: v for k, v in vision.items() if k != "potential"}),
+                ),
+            )
+            potential = vision.get("potential")
+            if isinstance(potential, dict):
+                c.execute(
+                    "INSERT INTO potential (app, marketSize, data) VALUES (?, ?, ?)",
+                    (slug, potential.get("marketSize"), _dump(potential)),
+                )
+
+    # ------------------------------------------------------------ 질의
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        return self.conn.execute(sql, tuple(params)).fetchall()
+
+    def tasks(
+        self,
+        status: Optional[str] = None,
+        label: Optional[str] = None,
+        category: Optional[str] = None,
+        app: Optional[str] = None,
+    ) -> List[sqlite3.Row]:
+        """조건에 맞는 태스크 (app, position, name, status, category). 조건은 모두 AND."""
+        sql = [
+            "SELECT t.app, t.position, t.name, t.status, fm.category FROM tasks t",
+            "LEFT JOIN feature_metadata fm ON fm.task = t.id",
+        ]
+        where, params = [], []
+        if label is not None:
+            sql.append("JOIN task_labels tl ON tl.task = t.id AND tl.label = ?")
+            params.append(label)
+        if status is not None:
+            where.append("t.status = ?")
+            params.append(status)
+        if category is not None:
+            where.append("fm.category = ?")
+            params.append(category)
+        if app is not None:
+            where.append("t.app = ?")
+            params.append(app)
+        if where:
+            sql.append("WHERE " + " AND ".join(where))
+        sql.append("ORDER BY t.app, t.position")
+        return self.query(" ".join(sql), params)
+
+    def status_counts(self, app: Optional[str] = None) -> Dict[str, int]:
+        sql = "SELECT status, COUNT(*) AS n FROM tasks"
+        params = []
+        if app is not None:
+            sql += " WHERE app = ?"
+            params.append(app)
+        return {row["status"]: row["n"] for row in self.query(sql + " GROUP BY status", params)}
@@ -0,0 +1,77 @@
+"""
+JSON 원자적 저장 + 스냅숏
+
+save_json() 은 같은 디렉터리의 임시 파일에 쓰고 fsync 후 rename 하므로
+중간에 죽어도 원본이 잘린 채로 남지 않는다. 직렬화 결과가 디스크 내용과 같으면
+아무것도 쓰지 않는다. 덮어쓰기 전 원본은 스냅숏 저장소(snapshots.py)의 현재 실행 기록에 남긴다.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from .snapshots import SnapshotStore
+
+SNAPSHOTS = SnapshotStore()
+
+
+def load_json(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dumps(data: Any) -> bytes:
+    """저장소 앱 JSON 과 같은 형식 (indent=2, 한글 그대로)"""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def save_json(path: Path, data: Any, backup: bool = True) -> bool:
+    """data 를 path 에 원자적으로 저장. 실제로 썼으면 True, 내용이 같아 건너뛰었으면 False.
+
+    기존 파일의 끝 줄바꿈 유무는 그대로 따른다 (앱 편집기와 스크립트가 번갈아 쓰는 파일).
+    """
+    path = Path(path)
+    new = dumps(data)
+    try:
+        old = path.read_bytes()
+    except FileNotFoundError:
+        old = None
+    if old is not None:
+        if old.endswith(b"\n"):
+            new += b"\n"
+        if new == old:
+            return False
+    if backup:
+        SNAPSHOTS.record(path, old)
+    write_atomic(path, new, mode_from=path if old is not None else None)
+    return True
+
+
+def write_atomic(path: Path, raw: bytes, mode_from: Optional[Path] = None):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode_from is not None:
+            shutil.copymode(mode_from, tmp)
+        else:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    # rename 자체도 디스크에 남도록 디렉터리 엔트리까지 동기화 (지원하는 OS 에서만)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,10 @@
+"""
+포트폴리오 데이터 경로 (저장소 루트 기준)
+"""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+DATA_DIR = ROOT / "projects/PortfolioCEO/PortfolioCEO/Data"
+APPS_DIR = DATA_DIR / "apps"
+SUMMARY_FILE = DATA_DIR / "data" / "portfolio-summary.json"
@@ -0,0 +1,283 @@
+"""
+앱 JSON 선언적 스키마
+
+app / task / featureMetadata / vision / potential 문서의 형태를 dict 로 선언하고,
+모듈 로드 시 한 번 검사 클로저로 컴파일해 문서마다 재해석 없이 검사한다.
+위반은 JSON 경로와 함께 모두 모아 돌려준다 (첫 위반에서 멈추지 않음).
+
+지원 키워드 (JSON Schema 의 작은 부분집합):
+    type       "string" | "integer" | "number" | "boolean" | "array" | "object" | "null" 또는 그 목록
+    enum       허용 값 목록
+    pattern    문자열 정규식 (re.match)
+    required   object 필수 키 목록
+    properties object 키별 하위 스키마 (선언되지 않은 키는 허용)
+    items      array 원소 스키마
+    level      이 노드의 위반 수준 ("error" 기본, "warning")
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Violation(NamedTuple):
+    level: str  # "error" | "warning"
+    path: str  # 예: $.allTasks[3].featureMetadata.category
+    message: str
+
+
+# ------------------------------------------------------------ 스키마 정의
+
+STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+FEATURE_METADATA_SCHEMA = {
+    "type": "object",
+    "required": ["category", "description", "userValue"],
+    "properties": {
+        "category": {"type": "string"},
+        "description": {"type": "string"},
+        "userValue": {"type": "string"},
+        "technicalNotes": {"type": ["string", "null"]},
+        "usageScenario": {"type": "string"},
+        "problemSolved": {"type": "string"},
+        "userBenefit": {"type": "string"},
+    },
+}
+
+TASK_SCHEMA = {
+    "type": "object",
+    "required": ["name", "status"],
+    "properties": {
+        "id": {"type": "string"},
+        "name": {"type": "string"},
+        "status": {"enum": ["not-started", "todo", "in-progress", "done"]},
+        "priority": {"enum": ["critical", "high", "medium", "low"]},
+        "targetDate": {"type": ["string", "null"]},
+        "targetVersion": {"type": ["string", "null"]},
+        "labels": STRING_LIST,
+        "decisionId": {"type": "string"},
+        "estimatedTime": {"type": "string"},
+        "featureMetadata": FEATURE_METADATA_SCHEMA,
+    },
+}
+
+POTENTIAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "marketSize": {"type": "string"},
+        "targetExpansion": STRING_LIST,
+        "monetization": {
+            "type": "object",
+            "properties": {
+                "current": {"type": "string"},
+                "potential": STRING_LIST,
+            },
+        },
+        "competitiveAdvantage": STRING_LIST,
+        "expansionStrategy": STRING_LIST,
+        "longTermVision": {"type": "string"},
+        "risks": STRING_LIST,
+        "opportunities": STRING_LIST,
+    },
+}
+
+VISION_SCHEMA = {
+    "type": "object",
+    "required": ["tagline", "coreValue"],
+    "properties": {
+        "tagline": {"type": "string"},
+        "coreValue": {"type": "string"},
+        "targetUsers": {"type": "string"},
+        "uniqueSellingPoint": {"type": "string"},
+        "conceptDescription": {"type": "string"},
+        "designPrinciples": STRING_LIST,
+        "userExperienceGoals": STRING_LIST,
+        "potential": POTENTIAL_SCHEMA,
+    },
+}
+
+COUNT = {"type": "integer"}
+
+APP_SCHEMA = {
+    "type": "object",
+    "required": ["name", "nameEn", "bundleId", "currentVersion",
+                 "status", "priority", "stats", "allTasks"],
+    "properties": {
+        "name": {"type": "string"},
+        "nameEn": {"type": "string"},
+        "bundleId": {"type": "string"},
+        "currentVersion": {"type": "string", "pattern": r"\d+\.\d+\.\d+$", "level": "warning"},
+        "status": {"enum": ["active", "planning", "maintenance", "archived"]},
+        "priority": {"enum": ["high", "medium", "low"]},
+        "appStoreId": {"type": "string"},
+        "appStoreUrl": {"type": "string"},
+        "supportUrl": {"type": ["string", "null"]},
+        "minimumOS": {"type": "string"},
+        "categories": STRING_LIST,
+        "nextTasks": STRING_LIST,
+        "recentlyCompleted": STRING_LIST,
+        "sharedModules": {"type": "array"},
+        "price": {
+            "type": "object",
+            "properties": {
+                "isFree": {"type": "boolean"},
+                "hasInAppPurchases": {"type": "boolean"},
+                "pricingModel": {"type": "string"},
+                "priceKRW": {"type": "number"},
+                "priceUSD": {"type": "number"},
+                "iapItems": {"type": "array"},
+            },
+        },
+        "stats": {
+            "type": "object",
+            "required": ["totalTasks", "done", "inProgress", "todo", "notStarted"],
+            "properties": {
+                "totalTasks": COUNT,
+                "done": COUNT,
+                "inProgress": COUNT,
+                "notStarted": COUNT,
+                "todo": COUNT,
+            },
+        },
+        "allTasks": {"type": "array", "items": TASK_SCHEMA},
+        "vision": VISION_SCHEMA,
+    },
+}
+
+SCHEMAS = {
+    "app": APP_SCHEMA,
+    "task": TASK_SCHEMA,
+    "featureMetadata": FEATURE_METADATA_SCHEMA,
+    "vision": VISION_SCHEMA,
+    "potential": POTENTIAL_SCHEMA,
+}
+
+
+# ------------------------------------------------------------ 컴파일러
+
+# 경로는 (부모, 키) 연결 튜플로 들고 다니다가 위반이 났을 때만 문자열로 만든다
+Path = Optional[Tuple[Any, Any]]
+Check = Callable[[Any, Path, List[Violation]], None]
+
+TYPE_CHECKS = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+def format_path(path: Path) -> str:
+    parts = []
+    while path is not None:
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "$" + "".join(reversed(parts))
+
+
+def compile_schema(schema: Dict[str, Any]) -> Check:
+    """스키마 dict → check(value, path, out) 클로저. 하위 스키마도 재귀적으로 미리 컴파일한다."""
+    level = schema.get("level", "error")
+    checks: List[Check] = []
+
+    types = schema.get("type")
+    if types is not None:
+        names = [types] if isinstance(types, str) else list(types)
+        preds = [TYPE_CHECKS[name] for name in names]
+        expected = " | ".join(names)
+
+        def check_type(value, path, out):
+            for pred in preds:
+                if pred(value):
+                    return True
+            out.append(Violation(level, format_path(path), f"타입 불일치 ({expected} 기대, {type(value).__name__})"))
+            return False
+    else:
+        check_type = None
+
+    enum = schema.get("enum")
+    if enum is not None:
+        allowed = frozenset(enum)
+        shown = ", ".join(map(str, enum))
+
+        def check_enum(value, path, out):
+            try:
+                ok = value in allowed
+            except TypeError:  # dict / list 등 해시 불가 값
+                ok = False
+            if not ok:
+                out.append(Violation(level, format_path(path), f"허용되지 않는 값 {value!r} ({shown})"))
+        checks.append(check_enum)
+
+    pattern = schema.get("pattern")
+    if pattern is not None:
+        match = re.compile(pattern).match
+
+        def check_pattern(value, path, out):
+            if isinstance(value, str) and not match(value):
+                out.append(Violation(level, format_path(path), f"형식 불일치 ({value!r})"))
+        checks.append(check_pattern)
+
+    required = tuple(schema.get("required", ()))
+    if required:
+        def check_required(value, path, out):
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        out.append(Violation(level, format_path(path), f"필수 필드 누락 - {key}"))
+        checks.append(check_required)
+
+    properties = [(key, compile_schema(sub)) for key, sub in schema.get("properties", {}).items()]
+    if properties:
+        def check_properties(value, path, out):
+            if isinstance(value, dict):
+                for key, check in properties:
+                    if key in value:
+                        check(value[key], (path, key), out)
+        checks.append(check_properties)
+
+    items = schema.get("items")
+    if items is not None:
+        check_item = compile_schema(items)
+
+        def check_items(value, path, out):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    check_item(item, (path, i), out)
+        checks.append(check_items)
+
+    checks = tuple(checks)
+
+    if check_type is None:
+        def check(value, path, out):
+            for c in checks:
+                c(value, path, out)
+    else:
+        # 타입이 틀리면 하위 키워드 검사는 의미가 없으므로 건너뛴다
+        def check(value, path, out):
+            if check_type(value, path, out):
+                for c in checks:
+                    c(value, path, out)
+    return check
+
+
+VALIDATORS: Dict[str, Check] = {name: compile_schema(schema) for name, schema in SCHEMAS.items()}
+
+
+def validate(doc: Any, kind: str = "app") -> List[Violation]:
+    """문서 하나의 모든 위반 (문서 순서대로)"""
+    out: List[Violation] = []
+    VALIDATORS[kind](doc, None, out)
+    return out
+
+
+def validate_many(docs: Iterable[Any], kind: str = "app") -> Iterator[Tuple[int, List[Violation]]]:
+    """여러 문서를 같은 컴파일된 검사기로 일괄 검사. 위반이 있는 문서만 (인덱스, 위반 목록) 으로 낸다."""
+    check = VALIDATORS[kind]
+    for i, doc in enumerate(docs):
+        out: List[Violation] = []
+        check(doc, None, out)
+        if out:
+            yield i, out
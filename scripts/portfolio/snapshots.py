@@ -0,0 +1,126 @@
+"""
+내용 주소 스냅숏 저장소
+
+save_json() 이 덮어쓰기 직전 원본을 여기에 남긴다.
+  - objects/<sha[:2]>/<sha>.z : zlib 압축 blob (sha 는 원본 바이트 기준, 같은 내용은 한 번만 저장)
+  - runs/<run-id>.json       : 스크립트 실행 1회의 매니페스트 {파일: 덮어쓰기 전 sha (새로 만든 파일은 null)}
+실행 기록은 최근 KEEP_RUNS 개만 남기고, 어느 매니페스트도 참조하지 않는 blob 은 지운다.
+정리는 새 실행의 매니페스트를 쓴 뒤에 하며, pinned 에 든 실행(복원 중인 실행 등)은 지우지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .paths import ROOT
+
+SNAPSHOT_DIR = ROOT / "scripts" / ".backups"
+KEEP_RUNS = 50
+
+
+def _rel(path: Path) -> str:
+    try:
+        return str(Path(path).resolve().relative_to(ROOT))
+    except ValueError:
+        return str(Path(path).resolve())
+
+
+class SnapshotStore:
+    def __init__(self, root: Path = SNAPSHOT_DIR, keep_runs: int = KEEP_RUNS):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.runs_dir = self.root / "runs"
+        self.keep_runs = keep_runs
+        self._run: Optional[Dict] = None
+        self.pinned: Set[str] = set()  # prune 에서 지우지 않을 실행 id
+
+    # ------------------------------------------------------------ blob
+
+    def _blob_path(self, sha: str) -> Path:
+        return self.objects / sha[:2] / f"{sha}.z"
+
+    def put(self, raw: bytes) -> str:
+        sha = hashlib.sha256(raw).hexdigest()
+        blob = self._blob_path(sha)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_suffix(f".tmp{os.getpid()}")
+            tmp.write_bytes(zlib.compress(raw, 9))
+            os.replace(tmp, blob)
+        return sha
+
+    def get(self, sha: str) -> bytes:
+        return zlib.decompress(self._blob_path(sha).read_bytes())
+
+    # ------------------------------------------------------------ 실행 매니페스트
+
+    def record(self, path: Path, raw: Optional[bytes]) -> Optional[str]:
+        """현재 실행의 매니페스트에 path 의 덮어쓰기 전 내용을 기록 (파일당 실행 1회, 첫 기록만 유지)
+
+        raw 가 None 이면 '이 실행 전에는 없던 파일' 로 기록한다.
+        """
+        first = self._run is None
+        if first:
+            self._start_run()
+        name = _rel(path)
+        if name in self._run["files"]:
+            return self._run["files"][name]
+        sha = self.put(raw) if raw is not None else None
+        self._run["files"][name] = sha
+        self._write_manifest(self._run)
+        if first:
+            # 새 매니페스트가 디스크에 있어야 방금 넣은 blob 이 정리 대상에서 빠진다
+            self.prune()
+        return sha
+
+    def _start_run(self):
+        now = datetime.now()
+        self._run = {
+            "id": f"{now:%Y%m%d-%H%M%S}-{os.getpid()}",
+            "at": now.isoformat(timespec="seconds"),
+            "script": Path(sys.argv[0]).name if sys.argv and sys.argv[0] else "-",
+            "files": {},
+        }
+
+    def _write_manifest(self, run: Dict):
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        target = self.runs_dir / f"{run['id']}.json"
+        tmp = target.with_suffix(".tmp")
+        tmp.write_text(json.dumps(run, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, target)
+
+    def runs(self) -> List[Dict]:
+        """오래된 순 매니페스트 목록"""
+        out = []
+        for path in sorted(self.runs_dir.glob("*.json")):
+            try:
+                out.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, json.JSONDecodeError):
+                continue
+        return out
+
+    def run(self, run_id: str) -> Dict:
+        """run id 또는 그 접두사로 매니페스트 찾기"""
+        matches = [r for r in self.runs() if r["id"].startswith(run_id)]
+        if len(matches) != 1:
+            raise KeyError(f"실행 기록 '{run_id}' 를 {'찾을 수 없음' if not matches else '특정할 수 없음'}")
+        return matches[0]
+
+    def prune(self):
+        """최근 keep_runs 개 밖의 매니페스트(pinned 제외)와 참조가 끊긴 blob 삭제"""
+        manifests = sorted(self.runs_dir.glob("*.json"))
+        excess = len(manifests) - self.keep_runs
+        if excess <= 0:
+            return
+        for path in manifests[:excess]:
+            if path.stem not in self.pinned:
+                path.unlink()
+        live = {sha for r in self.runs() for sha in r["files"].values() if sha}
+        for blob in self.objects.glob("*/*.z"):
+            if blob.stem not in live:
+                blob.unlink()
@@ -0,0 +1,187 @@
+"""
+앱 JSON 공용 저장소
+
+Data/apps/*.json 을 한 번만 읽어 slug · bundleId · appStoreId · status 로 색인한다.
+같은 프로세스 안에서는 PortfolioStore.load() 가 디렉터리별 인스턴스를 재사용하고,
+refresh() 는 mtime 이 바뀐 파일만 다시 읽는다.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .paths import APPS_DIR
+
+APPSTORE_ID_RE = re.compile(r"/id(\d+)")
+
+
+class AppEntry:
+    """앱 JSON 한 개 — 원본 dict(data)와 파일 정보."""
+
+    __slots__ = ("slug", "path", "data", "mtime_ns")
+
+    def __init__(self, path: Path, data: Dict[str, Any], mtime_ns: int):
+        self.slug = path.stem
+        self.path = path
+        self.data = data
+        self.mtime_ns = mtime_ns
+
+    @property
+    def name(self) -> str:
+        return self.data.get("name") or self.slug
+
+    @property
+    def bundle_id(self) -> Optional[str]:
+        return self.data.get("bundleId")
+
+    @property
+    def app_store_id(self) -> Optional[str]:
+        """appStoreId 필드, 없으면 appStoreUrl 의 /id123… 에서 추출."""
+        if self.data.get("appStoreId"):
+            return str(self.data["appStoreId"])
+        m = APPSTORE_ID_RE.search(self.data.get("appStoreUrl") or "")
+        return m.group(1) if m else None
+
+    @property
+    def status(self) -> Optional[str]:
+        return self.data.get("status")
+
+    @property
+    def priority(self) -> Optional[str]:
+        return self.data.get("priority")
+
+    @property
+    def tasks(self) -> List[Dict[str, Any]]:
+        return self.data.get("allTasks", [])
+
+    def __repr__(self):
+        return f"AppEntry({self.slug!r})"
+
+
+class PortfolioStore:
+    """앱 JSON 전체를 메모리에 올려 두고 색인으로 조회하는 저장소."""
+
+    _instances: Dict[Path, "PortfolioStore"] = {}
+
+    def __init__(self, apps_dir: Path = APPS_DIR):
+        self.apps_dir = Path(apps_dir)
+        self.errors: Dict[str, str] = {}  # slug → 파싱 오류 메시지
+        self._entries: Dict[str, AppEntry] = {}
+        self._by_bundle: Dict[str, AppEntry] = {}
+        self._by_store_id: Dict[str, AppEntry] = {}
+        self._by_status: Dict[str, List[AppEntry]] = {}
+        self._task_locations: Optional[Dict[str, Tuple[str, int]]] = None
+        self.refresh()
+
+    @classmethod
+    def load(cls, apps_dir: Path = APPS_DIR) -> "PortfolioStore":
+        """디렉터리별 공유 인스턴스. 이미 있으면 바뀐 파일만 다시 읽어 돌려준다."""
+        key = Path(apps_dir).resolve()
+        store = cls._instances.get(key)
+        if store is None:
+            store = cls._instances[key] = cls(key)
+        else:
+            store.refresh()
+        return store
+
+    # ------------------------------------------------------------ 로드
+
+    def refresh(self) -> List[str]:
+        """mtime 이 바뀌었거나 새로 생긴 파일만 다시 읽고, 사라진 파일은 뺀다. 바뀐 slug 목록을 반환."""
+        changed = []
+        seen = set()
+        for path in sorted(self.apps_dir.glob("*.json")):
+            slug = path.stem
+            seen.add(slug)
+            mtime = path.stat().st_mtime_ns
+            entry = self._entries.get(slug)
+            if entry is not None and entry.mtime_ns == mtime:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                self.errors[slug] = str(e)
+                self._entries.pop(slug, None)
+                changed.append(slug)
+                continue
+            self.errors.pop(slug, None)
+            self._entries[slug] = AppEntry(path, data, mtime)
+            changed.append(slug)
+        for slug in set(self._entries) - seen:
+            del self._entries[slug]
+            changed.append(slug)
+        for slug in set(self.errors) - seen:
+            del self.errors[slug]
+        if changed:
+            self._entries = dict(sorted(self._entries.items()))
+            self._reindex()
+        return changed
+
+    def _reindex(self):
+        self._task_locations = None  # 처음 조회할 때 다시 만든다
+        self._by_bundle = {}
+        self._by_store_id = {}
+        self._by_status = {}
+        for entry in self._entries.values():
+            if entry.bundle_id:
+                self._by_bundle.setdefault(entry.bundle_id, entry)
+            if entry.app_store_id:
+                self._by_store_id.setdefault(entry.app_store_id, entry)
+            self._by_status.setdefault(entry.status, []).append(entry)
+
+    # ------------------------------------------------------------ 조회
+
+    def __iter__(self) -> Iterator[AppEntry]:
+        return iter(list(self._entries.values()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self._entries
+
+    def get(self, slug: str) -> Optional[AppEntry]:
+        return self._entries.get(slug)
+
+    def by_bundle_id(self, bundle_id: str) -> Optional[AppEntry]:
+        return self._by_bundle.get(bundle_id)
+
+    def by_app_store_id(self, app_store_id) -> Optional[AppEntry]:
+        return self._by_store_id.get(str(app_store_id))
+
+    def with_status(self, status: str) -> List[AppEntry]:
+        return list(self._by_status.get(status, []))
+
+    def slugs(self) -> List[str]:
+        return list(self._entries)
+
+    def tasks(self) -> Iterator[Tuple[AppEntry, Dict[str, Any]]]:
+        """(앱, 태스크) 쌍을 전 앱에 걸쳐 순서대로."""
+        for entry in self:
+            for task in entry.tasks:
+                yield entry, task
+
+    def task_location(self, task_id: str) -> Optional[Tuple[AppEntry, int]]:
+        """태스크 id → (앱, allTasks 내 위치). 전역 색인은 처음 호출할 때 한 번 만든다.
+
+        entry.data 를 직접 고친 뒤에는 저장 후 refresh() 해야 위치가 맞다.
+        """
+        if self._task_locations is None:
+            locations = {}
+            for entry in self._entries.values():
+                for position, task in enumerate(entry.tasks):
+                    task_id_ = task.get("id")
+                    if task_id_:
+                        locations.setdefault(task_id_, (entry.slug, position))
+            self._task_locations = locations
+        found = self._task_locations.get(task_id)
+        if found is None:
+            return None
+        slug, position = found
+        return self._entries[slug], position
+
+    def task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        found = self.task_location(task_id)
+        return found[0].tasks[found[1]] if found else None
@@ -0,0 +1,177 @@
+"""
+portfolio-summary.json 증분 계산
+
+앱 파일마다 요약 행(summary["apps"] 원소)과 전체 집계(overview)에 더하는 기여분을
+내용 해시와 함께 상태 파일에 남긴다. 파일이 바뀌면 옛 기여분을 빼고 새 기여분을 더하므로
+갱신 비용은 바뀐 파일 수에 비례한다 (변경 목록을 모르면 mtime → 해시로 바뀐 파일을 찾는다).
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .jsonio import save_json
+from .paths import ROOT
+
+STATE_FILE = ROOT / "scripts" / ".summary-state.json"
+STATE_VERSION = 1
+VOLATILE_KEYS = ("lastUpdated",)  # 내용 비교에서 빼는 필드
+
+OVERVIEW_KEYS = (
+    "active", "planning", "highPriority",
+    "totalTasks", "totalDone", "totalInProgress", "totalNotStarted",
+)
+
+
+def summary_row(filename: str, app: Dict) -> Dict:
+    """summary["apps"] 의 한 행"""
+    return {
+        "name": app.get("name", ""),
+        "nameEn": app.get("nameEn", ""),
+        "file": filename,
+        "currentVersion": app.get("currentVersion", "1.0.0"),
+        "status": app.get("status", "planning"),
+        "priority": app.get("priority", "medium"),
+        "stats": app.get("stats", {
+            "totalTasks": 0,
+            "done": 0,
+            "inProgress": 0,
+            "notStarted": 0
+        }),
+        "nextTasks": app.get("nextTasks", [])[:2]  # 최대 2개
+    }
+
+
+def contribution(row: Dict) -> Dict[str, int]:
+    """한 앱이 overview 각 항목에 더하는 값"""
+    stats = row["stats"]
+    return {
+        "active": int(row["status"] == "active"),
+        "planning": int(row["status"] == "planning"),
+        "highPriority": int(row["priority"] == "high"),
+        "totalTasks": stats.get("totalTasks", 0),
+        "totalDone": stats.get("done", 0),
+        "totalInProgress": stats.get("inProgress", 0),
+        "totalNotStarted": stats.get("notStarted", 0),
+    }
+
+
+class SummaryEngine:
+    """앱별 기여분을 들고 있다가 바뀐 파일만 빼고 더해 overview 를 유지한다."""
+
+    def __init__(self, apps_dir: Path, state_file: Path = STATE_FILE):
+        self.apps_dir = Path(apps_dir)
+        self.state_file = Path(state_file)
+        self.apps: Dict[str, Dict] = {}  # 파일명 → {"mtime_ns", "sha", "row", "contrib"}
+        self.overview = {key: 0 for key in OVERVIEW_KEYS}
+        self.errors: Dict[str, str] = {}
+        self._load_state()
+
+    def _load_state(self):
+        try:
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if state.get("version") != STATE_VERSION or state.get("appsDir") != str(self.apps_dir.resolve()):
+            return
+        self.apps = state.get("apps", {})
+        self.overview = {key: state.get("overview", {}).get(key, 0) for key in OVERVIEW_KEYS}
+
+    def reset(self):
+        """상태를 버린다 — 다음 update() 가 모든 파일을 다시 읽는다"""
+        self.apps = {}
+        self.overview = {key: 0 for key in OVERVIEW_KEYS}
+        self.errors = {}
+
+    def save_state(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "version": STATE_VERSION,
+            "appsDir": str(self.apps_dir.resolve()),
+            "overview": self.overview,
+            "apps": self.apps,
+        }, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.state_file)
+
+    # ------------------------------------------------------------ 갱신
+
+    def _apply(self, contrib: Dict[str, int], sign: int):
+        for key in OVERVIEW_KEYS:
+            self.overview[key] += sign * contrib.get(key, 0)
+
+    def _drop(self, filename: str):
+        old = self.apps.pop(filename, None)
+        if old is not None:
+            self._apply(old["contrib"], -1)
+
+    def update_file(self, path: Path) -> bool:
+        """파일 하나의 기여분을 최신화. 실제로 바뀌었으면 True"""
+        path = Path(path)
+        filename = path.name
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.errors.pop(filename, None)
+            if filename in self.apps:
+                self._drop(filename)
+                return True
+            return False
+        old = self.apps.get(filename)
+        if old is not None and old["mtime_ns"] == stat.st_mtime_ns:
+            return False
+        raw = path.read_bytes()
+        sha = hashlib.sha256(raw).hexdigest()
+        if old is not None and old["sha"] == sha:
+            old["mtime_ns"] = stat.st_mtime_ns
+            return False
+        try:
+            app = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            # 읽을 수 없는 파일은 요약에서 빠진다 (전체 재계산과 같은 결과)
+            self.errors[filename] = str(e)
+            self._drop(filename)
+            return True
+        self.errors.pop(filename, None)
+        self._drop(filename)
+        row = summary_row(filename, app)
+        contrib = contribution(row)
+        self.apps[filename] = {"mtime_ns": stat.st_mtime_ns, "sha": sha, "row": row, "contrib": contrib}
+        self._apply(contrib, +1)
+        return True
+
+    def update(self, changed: Optional[Iterable[Path]] = None) -> List[str]:
+        """changed 가 주어지면 그 파일들만, 아니면 디렉터리 전체를 mtime/해시로 비교해 갱신. 바뀐 파일명 목록 반환"""
+        if changed is None:
+            paths = sorted(self.apps_dir.glob("*.json"))
+            present = {p.name for p in paths}
+            paths += [self.apps_dir / name for name in sorted(set(self.apps) - present)]
+        else:
+            paths = [Path(p) for p in changed]
+        return [p.name for p in paths if self.update_file(p)]
+
+    # ------------------------------------------------------------ 결과
+
+    def summary(self) -> Dict:
+        return {
+            "lastUpdated": datetime.now().isoformat(),
+            "totalApps": len(self.apps),
+            "overview": dict(self.overview),
+            "apps": [self.apps[name]["row"] for name in sorted(self.apps)],
+        }
+
+
+def write_summary(path: Path, summary: Dict) -> bool:
+    """요약을 저장. lastUpdated 외에 달라진 것이 없으면 쓰지 않는다 (하류 산출물이 괜히 다시 만들어지지 않도록)."""
+    try:
+        current = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        current = None
+    if isinstance(current, dict):
+        strip = lambda doc: {k: v for k, v in doc.items() if k not in VOLATILE_KEYS}
+        if strip(current) == strip(summary):
+            return False
+    return save_json(path, summary, backup=False)
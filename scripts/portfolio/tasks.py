@@ -0,0 +1,128 @@
+"""
+앱 하나의 allTasks 색인
+
+병합 스크립트들이 '이 이름의 태스크' 를 찾으려고 allTasks 를 매번 훑던 것을
+정규화된 이름 → 태스크 목록 사전 조회로 바꾼다. 이름이 조금 바뀐 태스크는
+find(..., cutoff=...) 로 유사도 매칭할 수 있다.
+
+stats 블록은 allTasks 에서 파생되는 캐시다. status_histogram() 한 번의 순회로
+모든 상태 수를 세고, derive_stats() / stale_stats() / recount_stats() 로 계산 · 검증 · 재생성한다.
+
+태스크의 "id" 는 이름과 무관한 고정 식별자다 (scripts/task-ids.py migrate 로 부여).
+이름이 바뀌어도 id 로는 같은 태스크를 찾는다.
+"""
+
+import difflib
+import re
+import unicodedata
+import uuid
+from collections import Counter
+from typing import Container, Dict, Iterable, List, Optional, Set, Tuple
+
+_SPACE = re.compile(r"\s+")
+
+# 태스크 status 값 → stats 키
+STATUS_STATS_KEYS = {
+    "done": "done",
+    "in-progress": "inProgress",
+    "todo": "todo",
+    "not-started": "notStarted",
+}
+# derive_stats 가 쓰는 키 전부 — 검증도 이 키들로 한다 (schema.APP_SCHEMA 의 stats.required 와 같다)
+VERIFIED_STATS_KEYS = ("totalTasks", "done", "inProgress", "todo", "notStarted")
+
+
+def normalize_task_name(name: str) -> str:
+    """유니코드 정규화(NFKC) + 대소문자 무시 + 공백 제거 — '일정관리' 와 '일정 관리' 를 같은 키로"""
+    return _SPACE.sub("", unicodedata.normalize("NFKC", name or "")).casefold()
+
+
+def new_task_id() -> str:
+    """Swift 앱의 UUID().uuidString 과 같은 형식"""
+    return str(uuid.uuid4()).upper()
+
+
+def assign_task_ids(data: Dict, taken: Optional[Set[str]] = None) -> int:
+    """id 가 없거나 (taken 기준으로) 이미 쓰인 id 인 태스크에 새 id 부여. 반환: 부여한 수
+
+    taken 을 넘기면 부여·확인한 id 를 거기에 더해 가므로, 여러 앱에 걸쳐 호출하면 전역 유일성이 보장된다.
+    """
+    taken = set() if taken is None else taken
+    assigned = 0
+    for task in data.get("allTasks", []):
+        task_id = task.get("id")
+        if not isinstance(task_id, str) or not task_id or task_id in taken:
+            task_id = task["id"] = new_task_id()
+            assigned += 1
+        taken.add(task_id)
+    return assigned
+
+
+def status_histogram(tasks: Iterable[Dict]) -> Counter:
+    """status 값 → 태스크 수 (한 번 순회). status 가 없는 태스크는 None 으로 센다."""
+    return Counter(task.get("status") for task in tasks)
+
+
+def derive_stats(tasks: List[Dict]) -> Dict[str, int]:
+    """allTasks 로 계산한 stats 블록"""
+    histogram = status_histogram(tasks)
+    stats = {key: histogram[status] for status, key in STATUS_STATS_KEYS.items()}
+    stats["totalTasks"] = len(tasks)
+    return stats
+
+
+def stale_stats(data: Dict) -> List[Tuple[str, Optional[int], int]]:
+    """저장된 stats 중 allTasks 와 어긋난 항목 (키, 저장값, 실제값)"""
+    stored = data.get("stats") or {}
+    actual = derive_stats(data.get("allTasks", []))
+    return [(key, stored.get(key), actual[key]) for key in VERIFIED_STATS_KEYS if stored.get(key) != actual[key]]
+
+
+def recount_stats(data: Dict) -> Dict[str, int]:
+    """allTasks 로 stats 를 다시 계산해 data["stats"] 에 넣고 돌려준다"""
+    stats = derive_stats(data.get("allTasks", []))
+    data["stats"] = stats
+    return stats
+
+
+class TaskIndex:
+    """allTasks 리스트에 대한 이름 색인. 리스트의 dict 를 그대로 가리키므로 찾은 태스크를 고치면 원본이 바뀐다."""
+
+    def __init__(self, tasks: Iterable[Dict]):
+        self._by_name: Dict[str, List[Dict]] = {}
+        self._by_id: Dict[str, Dict] = {}
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: Dict):
+        """새로 만든 태스크를 색인에 더한다 (allTasks 에 append 하는 것은 호출 측 책임)"""
+        self._by_name.setdefault(normalize_task_name(task.get("name", "")), []).append(task)
+        if task.get("id"):
+            self._by_id.setdefault(task["id"], task)
+
+    def by_id(self, task_id: str) -> Optional[Dict]:
+        return self._by_id.get(task_id)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_task_name(name) in self._by_name
+
+    def get_all(self, name: str) -> List[Dict]:
+        """정규화된 이름이 같은 태스크 전부 (allTasks 순서)"""
+        return self._by_name.get(normalize_task_name(name), [])
+
+    def get(self, name: str) -> Optional[Dict]:
+        tasks = self.get_all(name)
+        return tasks[0] if tasks else None
+
+    def find(self, name: str, cutoff: Optional[float] = None, exclude: Container[int] = ()) -> Optional[Dict]:
+        """정확(정규화) 일치 우선, 없고 cutoff 가 주어지면 유사도 cutoff 이상인 가장 가까운 태스크.
+
+        exclude 는 건너뛸 태스크의 id() 모음 — 한 번에 여러 이름을 맞출 때 이미 쓴 태스크를 다시 고르지 않도록.
+        """
+        free = lambda key: [task for task in self._by_name.get(key, []) if id(task) not in exclude]
+        tasks = free(normalize_task_name(name))
+        if tasks or cutoff is None:
+            return tasks[0] if tasks else None
+        candidates = [key for key in self._by_name if free(key)]
+        close = difflib.get_close_matches(normalize_task_name(name), candidates, n=1, cutoff=cutoff)
+        return free(close[0])[0] if close else None
@@ -26,7 +26,7 @@ $QUEUE_FILE 파일을 읽어서 pendingDecisions를 처리해줘:
 1. **feature-decision** (기능 결정):
    - selectedOption에 따라 해당 앱에 태스크 추가
    - apps/{앱파일}.json의 allTasks에 추가
-   - stats 업데이트
+   - stats 재생성: python3 scripts/recount-stats.py {앱 slug}
    - notes에 CEO의 메모 추가
 
 2. **priority-change** (우선순위 변경):
@@ -35,7 +35,7 @@ $QUEUE_FILE 파일을 읽어서 pendingDecisions를 처리해줘:
 
 3. **task-update** (태스크 상태 변경):
    - 해당 태스크의 status 업데이트
-   - stats 재계산
+   - stats 재생성: python3 scripts/recount-stats.py {앱 slug}
 
 처리 후:
 - 각 결정을 completedDecisions로 이동
@@ -29,7 +29,7 @@ $QUEUE_FILE 파일을 읽어서 status가 "pending"인 요청들을 처리해줘
    - priority에 따라 nextTasks 순서 조정
    - targetVersion 설정 (있으면)
    - status: "not-started"
-   - stats 업데이트
+   - stats 재생성: python3 scripts/recount-stats.py {앱 slug}
 
 2. **bug-report** (버그 리포트):
    - 새 태스크로 추가
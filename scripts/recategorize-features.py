@@ -3,10 +3,9 @@
 20년차 기획자 관점에서 feature를 사용자 중심 카테고리로 재분류
 """
 
-import json
-from pathlib import Path
-
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import APPS_DIR
+from portfolio.jsonio import load_json, save_json
+from portfolio.tasks import TaskIndex
 
 # 각 앱별 feature 재분류 맵
 # {앱ID: {태스크명: {새로운 카테고리, 상세 설명, 사용 시나리오, 해결하는 문제}}}
@@ -745,49 +744,19 @@ FEATURE_RECATEGORIZATION = {
 # 이 패턴을 모든 앱에 적용
 
 
-def load_app_json(app_file):
-    """앱 JSON 파일 로드"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
-def save_app_json(app_file, data):
-    """앱 JSON 파일 저장"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        original = f.read()
-
-    # 백업
-    backup_file = app_file.with_suffix('.json.backup5')
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(original)
-
-    # 저장
-    with open(app_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def recategorize_features(app_file):
-    """feature 카테고리 재분류"""
-    app_id = app_file.stem
-    data = load_app_json(app_file)
-
+def transform(app_id, data):
+    """메모리 상의 앱 데이터 feature 재분류. 반환: 재분류한 feature 수"""
     if app_id not in FEATURE_RECATEGORIZATION:
-        print(f"⚠ {data.get('name', app_id)}: 재분류 데이터 없음")
         return 0
 
-    recategorization_map = FEATURE_RECATEGORIZATION[app_id]
+    index = TaskIndex(data.get('allTasks', []))
     updated_count = 0
 
-    for task in data.get('allTasks', []):
-        task_name = task['name']
-
-        # feature인지 확인
-        if 'featureMetadata' not in task or not task['featureMetadata']:
-            continue
-
-        # 재분류 정보가 있는 경우
-        if task_name in recategorization_map:
-            new_info = recategorization_map[task_name]
+    for task_name, new_info in FEATURE_RECATEGORIZATION[app_id].items():
+        for task in index.get_all(task_name):
+            # feature인지 확인
+            if 'featureMetadata' not in task or not task['featureMetadata']:
+                continue
 
             # 기존 메타데이터 유지하면서 업데이트
             task['featureMetadata']['category'] = new_info['category']
@@ -799,8 +768,21 @@ def recategorize_features(app_file):
 
             updated_count += 1
 
+    return updated_count
+
+
+def recategorize_features(app_file):
+    """feature 카테고리 재분류"""
+    app_id = app_file.stem
+    data = load_json(app_file)
+
+    if app_id not in FEATURE_RECATEGORIZATION:
+        print(f"⚠ {data.get('name', app_id)}: 재분류 데이터 없음")
+        return 0
+
+    updated_count = transform(app_id, data)
     if updated_count > 0:
-        save_app_json(app_file, data)
+        save_json(app_file, data)
         print(f"✅ {data.get('name', app_id)}: {updated_count}개 feature 재분류")
         return updated_count
     else:
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+stats 검증 · 재생성
+
+앱 JSON 의 stats 는 allTasks 에서 파생되는 캐시다. 태스크 상태를 손으로(또는 큐 처리에서)
+바꾼 뒤에는 stats 를 직접 세지 말고 이 스크립트로 다시 만든다.
+
+사용:
+    python3 scripts/recount-stats.py                 # 어긋난 앱의 stats 재생성
+    python3 scripts/recount-stats.py clip-keyboard   # 이 앱들만
+    python3 scripts/recount-stats.py --check         # 고치지 않고 어긋난 앱만 보고 (있으면 종료 코드 1)
+"""
+
+import argparse
+import sys
+
+from portfolio import PortfolioStore
+from portfolio.jsonio import save_json
+from portfolio.tasks import recount_stats, stale_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="stats 검증 · 재생성")
+    parser.add_argument("apps", nargs="*", help="앱 slug (생략하면 전체)")
+    parser.add_argument("--check", action="store_true", help="검증만 하고 파일은 고치지 않음")
+    args = parser.parse_args()
+
+    store = PortfolioStore.load()
+    entries = list(store)
+    if args.apps:
+        entries = [store.get(slug) for slug in args.apps]
+        missing = [slug for slug, entry in zip(args.apps, entries) if entry is None]
+        if missing:
+            print(f"❌ 앱을 찾을 수 없습니다: {', '.join(missing)}")
+            return 1
+
+    stale = 0
+    for entry in entries:
+        diffs = stale_stats(entry.data)
+        if not diffs:
+            continue
+        stale += 1
+        detail = ", ".join(f"{key} {stored}→{actual}" for key, stored, actual in diffs)
+        if args.check:
+            print(f"  ❌ {entry.name}: {detail}")
+            continue
+        recount_stats(entry.data)
+        save_json(entry.path, entry.data)
+        print(f"  🔄 {entry.name}: {detail}")
+
+    if args.check:
+        print(f"{'❌' if stale else '✅'} stats 불일치 앱 {stale}개 / {len(entries)}개")
+        return 1 if stale else 0
+    print(f"✅ stats 재생성 {stale}개 / {len(entries)}개")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+피처 보강 파이프라인
+
+collect-features.py, improve-features.py 등 앱 파일을 하나씩 읽고 다시 쓰던 스크립트들의
+transform(app_id, data) 를 메모리에서 차례로 적용한다. 앱마다 한 번 읽고, 내용이 바뀐
+앱만 한 번 쓴다 (N개 패스 = 입출력 1회). 덮어쓴 원본은 스냅숏으로 남는다.
+
+사용:
+    python3 scripts/run-feature-pipeline.py                       # 기본 순서 전체
+    python3 scripts/run-feature-pipeline.py --dry-run             # 쓰지 않고 diff 만 출력
+    python3 scripts/run-feature-pipeline.py --passes collect-features,recategorize-features
+    python3 scripts/run-feature-pipeline.py --app clip-keyboard --dry-run
+"""
+
+import argparse
+import difflib
+import importlib.util
+import sys
+from pathlib import Path
+
+from portfolio import APPS_DIR
+from portfolio.jsonio import dumps, load_json, save_json
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# 기본 적용 순서 (각 항목은 scripts/<이름>.py 의 transform)
+DEFAULT_PASSES = [
+    "collect-features",
+    "improve-features",
+    "complete-all-features",
+    "collect-vision-features",
+    "recategorize-features",
+    "add-app-potential",
+    "upgrade-apps-to-clipkeyboard-level",
+]
+
+
+def load_pass(name):
+    """하이픈 이름 스크립트를 모듈로 읽어 transform 을 돌려준다 (__main__ 블록은 실행되지 않음)"""
+    path = SCRIPTS_DIR / f"{name}.py"
+    if not path.exists():
+        raise SystemExit(f"❌ 알 수 없는 패스: {name}")
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not hasattr(module, "transform"):
+        raise SystemExit(f"❌ {name}.py 에 transform(app_id, data) 가 없습니다")
+    return module.transform
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피처 보강 패스를 앱당 1회 입출력으로 적용")
+    parser.add_argument("--passes", help="쉼표로 구분한 패스 목록 (기본: 전체, 정해진 순서)")
+    parser.add_argument("--app", action="append", help="이 앱만 (여러 번 지정 가능)")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 변경 diff 출력")
+    args = parser.parse_args()
+
+    names = args.passes.split(",") if args.passes else DEFAULT_PASSES
+    passes = [(name, load_pass(name)) for name in names]
+
+    app_files = sorted(APPS_DIR.glob("*.json"))
+    if args.app:
+        app_files = [f for f in app_files if f.stem in args.app]
+
+    totals = {name: 0 for name in names}
+    changed = 0
+    for app_file in app_files:
+        app_id = app_file.stem
+        before = app_file.read_bytes()
+        data = load_json(app_file)
+        for name, transform in passes:
+            totals[name] += transform(app_id, data) or 0
+
+        after = dumps(data) + (b"\n" if before.endswith(b"\n") else b"")
+        if after == before:
+            continue
+        changed += 1
+        if args.dry_run:
+            rel = app_file.relative_to(APPS_DIR.parent)
+            sys.stdout.writelines(difflib.unified_diff(
+                before.decode("utf-8").splitlines(keepends=True),
+                after.decode("utf-8").splitlines(keepends=True),
+                fromfile=f"a/{rel}", tofile=f"b/{rel}",
+            ))
+        else:
+            save_json(app_file, data)
+            print(f"✅ {data.get('name', app_id)}")
+
+    print()
+    print("=" * 60)
+    for name in names:
+        print(f"  {name:40s} {totals[name]:4d}")
+    verb = "변경 예정" if args.dry_run else "저장"
+    print(f"앱 {len(app_files)}개 중 {changed}개 {verb} (패스 {len(passes)}개, 앱당 읽기 1회 · 쓰기 최대 1회)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,9 @@
 재분류된 카테고리 통계 보기
 """
 
-import json
-from pathlib import Path
 from collections import Counter
 
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import PortfolioStore
 
 
 def main():
@@ -17,19 +15,14 @@ def main():
     print("=" * 80)
     print()
 
-    app_files = sorted(APPS_DIR.glob("*.json"))
-
     all_categories = []
     app_categories = {}
 
-    for app_file in app_files:
-        with open(app_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        app_name = data.get('name', app_file.stem)
+    for app in PortfolioStore.load():
+        app_name = app.name
         categories = []
 
-        for task in data.get('allTasks', []):
+        for task in app.tasks:
             if 'featureMetadata' in task and task['featureMetadata']:
                 category = task['featureMetadata'].get('category', '기타')
                 all_categories.append(category)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+태스크 고정 id 도구
+
+allTasks 의 태스크는 원래 한국어 이름으로만 구분돼 이름을 바꾸면 다른 태스크가 된다.
+migrate 는 id 가 없는(또는 다른 태스크와 겹치는) 태스크에 UUID 를 부여한다. 여러 번 실행해도
+이미 부여된 id 는 바뀌지 않으므로, 앱에서 새로 만든 태스크가 생길 때마다 다시 돌리면 된다.
+
+사용:
+    python3 scripts/task-ids.py migrate [--dry-run]
+    python3 scripts/task-ids.py show <task-id>
+    python3 scripts/task-ids.py move <task-id> <대상 앱 slug>
+"""
+
+import argparse
+import sys
+
+from portfolio import PortfolioStore
+from portfolio.jsonio import save_json
+from portfolio.tasks import assign_task_ids, recount_stats
+
+
+def cmd_migrate(store, args):
+    taken = set()
+    total = 0
+    for entry in store:
+        assigned = assign_task_ids(entry.data, taken)
+        if not assigned:
+            continue
+        total += assigned
+        if not args.dry_run:
+            save_json(entry.path, entry.data)
+        print(f"  🆔 {entry.name}: {assigned}개")
+    suffix = " (dry-run)" if args.dry_run else ""
+    print(f"✅ 태스크 {len(taken)}개 중 {total}개에 id 부여{suffix}")
+
+
+def cmd_show(store, args):
+    found = store.task_location(args.task_id)
+    if found is None:
+        print(f"❌ id '{args.task_id}' 인 태스크가 없습니다 (migrate 를 먼저 실행했는지 확인)")
+        return 1
+    entry, position = found
+    task = entry.tasks[position]
+    print(f"{entry.slug} #{position}  [{task.get('status')}]  {task.get('name')}")
+    return 0
+
+
+def cmd_move(store, args):
+    found = store.task_location(args.task_id)
+    if found is None:
+        print(f"❌ id '{args.task_id}' 인 태스크가 없습니다")
+        return 1
+    target = store.get(args.to)
+    if target is None:
+        print(f"❌ 앱 '{args.to}' 를 찾을 수 없습니다")
+        return 1
+    source, position = found
+    if source is target:
+        print("ℹ️  이미 그 앱의 태스크입니다")
+        return 0
+    task = source.tasks.pop(position)
+    target.tasks.append(task)
+    recount_stats(source.data)
+    recount_stats(target.data)
+    save_json(source.path, source.data)
+    save_json(target.path, target.data)
+    print(f"✅ {task.get('name')}: {source.slug} → {target.slug}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="태스크 고정 id 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("migrate", help="id 없는 태스크에 id 부여")
+    p.add_argument("--dry-run", action="store_true")
+    p = sub.add_parser("show", help="id 로 태스크 찾기")
+    p.add_argument("task_id")
+    p = sub.add_parser("move", help="태스크를 다른 앱으로 옮기기 (양쪽 stats 재계산)")
+    p.add_argument("task_id")
+    p.add_argument("to")
+    args = parser.parse_args()
+
+    store = PortfolioStore.load()
+    handler = {"migrate": cmd_migrate, "show": cmd_show, "move": cmd_move}[args.command]
+    return handler(store, args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
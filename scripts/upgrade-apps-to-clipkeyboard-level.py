@@ -4,11 +4,11 @@
 20년차 기획자 관점에서 "당연히 있어야 할 기능" 추가
 """
 
-import json
-from pathlib import Path
 from datetime import datetime
 
-APPS_DIR = Path("/Users/hyunholee/Documents/workspace/code/app-portfolio/projects/PortfolioCEO/PortfolioCEO/Data/apps")
+from portfolio import APPS_DIR
+from portfolio.jsonio import load_json, save_json
+from portfolio.tasks import TaskIndex, new_task_id, recount_stats
 
 # 각 앱별 추가할 feature 목록
 NEW_FEATURES = {
@@ -1807,28 +1807,27 @@ NEW_FEATURES = {
 }
 
 
-def load_app_json(app_file):
-    """앱 JSON 파일 로드"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def transform(app_id, data):
+    """메모리 상의 앱 데이터에 NEW_FEATURES 중 없는 feature 추가. 반환: 추가한 수"""
+    existing_tasks = TaskIndex(data.get('allTasks', []))
 
+    # 중복되지 않는 feature만 추가 (새 태스크는 고정 id 와 함께, 상수 dict 는 복사해서)
+    new_features = [
+        dict(f, id=new_task_id()) for f in NEW_FEATURES.get(app_id, [])
+        if f['name'] not in existing_tasks
+    ]
+    if not new_features:
+        return 0
 
-def save_app_json(app_file, data):
-    """앱 JSON 파일 저장"""
-    with open(app_file, 'r', encoding='utf-8') as f:
-        original = f.read()
-
-    # 백업
-    backup_file = app_file.with_suffix('.json.backup-upgrade')
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        f.write(original)
+    # allTasks에 추가
+    data['allTasks'].extend(new_features)
 
-    # 저장
-    with open(app_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # stats 업데이트
+    recount_stats(data)
+    return len(new_features)
 
 
-def add_features_to_app(app_id, features):
+def add_features_to_app(app_id):
     """앱에 새로운 feature 추가"""
     app_file = APPS_DIR / f"{app_id}.json"
 
@@ -1836,40 +1835,17 @@ def add_features_to_app(app_id, features):
         print(f"⚠ {app_id}: 파일을 찾을 수 없습니다")
         return 0
 
-    data = load_app_json(app_file)
+    data = load_json(app_file)
     app_name = data.get('name', app_id)
 
-    # 기존 태스크 이름들
-    existing_tasks = {task['name'] for task in data.get('allTasks', [])}
-
-    # 중복되지 않는 feature만 추가
-    new_features = [f for f in features if f['name'] not in existing_tasks]
-
-    if not new_features:
+    added = transform(app_id, data)
+    if not added:
         print(f"ℹ️  {app_name}: 이미 모든 feature가 존재합니다")
         return 0
 
-    # allTasks에 추가
-    data['allTasks'].extend(new_features)
-
-    # stats 업데이트
-    total_tasks = len(data['allTasks'])
-    done = sum(1 for task in data['allTasks'] if task.get('status') == 'done')
-    in_progress = sum(1 for task in data['allTasks'] if task.get('status') == 'in-progress')
-    todo = sum(1 for task in data['allTasks'] if task.get('status') == 'todo')
-    not_started = sum(1 for task in data['allTasks'] if task.get('status') == 'not-started')
-
-    data['stats'] = {
-        'done': done,
-        'inProgress': in_progress,
-        'todo': todo,
-        'notStarted': not_started,
-        'totalTasks': total_tasks
-    }
-
-    save_app_json(app_file, data)
-    print(f"✅ {app_name}: {len(new_features)}개 feature 추가 (총 {total_tasks}개)")
-    return len(new_features)
+    save_json(app_file, data)
+    print(f"✅ {app_name}: {added}개 feature 추가 (총 {len(data['allTasks'])}개)")
+    return added
 
 
 def main():
@@ -1882,8 +1858,8 @@ def main():
 
     total_added = 0
 
-    for app_id, features in NEW_FEATURES.items():
-        count = add_features_to_app(app_id, features)
+    for app_id in NEW_FEATURES:
+        count = add_features_to_app(app_id)
         total_added += count
 
     print()
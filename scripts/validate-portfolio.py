@@ -2,153 +2,290 @@
 """
 포트폴리오 데이터 유효성 검증 스크립트
 Git pre-commit hook으로 사용하거나 수동 실행 가능
+
+각 앱 파일은 한 번만 파싱하고, 파싱된 문서에 모든 규칙을 적용한다.
+파일이 많으면 프로세스 풀로 나눠 검증하고 결과는 파일명 순으로 합친다.
+파일별 결과는 내용 해시로 scripts/.validate-cache.json 에 캐시해 바뀐 파일만 다시 검증한다.
+
+사용:
+    python3 scripts/validate-portfolio.py [--jobs N] [--apps-dir DIR]
+    python3 scripts/validate-portfolio.py --changed   # git 에서 스테이징/수정된 앱만 (pre-commit 용)
+    python3 scripts/validate-portfolio.py --no-cache  # 캐시 무시하고 전부 다시 검증
 """
 
+import hashlib
 import json
 import os
+import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
+
+from portfolio import schema, tasks
+from portfolio.tasks import stale_stats
+
+ROOT = Path(__file__).parent.parent
+CACHE_FILE = ROOT / "scripts" / ".validate-cache.json"
+# 교차 검증 대상: 앱 slug 를 참조하는 큐레이션 파일
+SHOWCASE_FILE = ROOT / "scripts" / "showcase-content.json"
+PROBLEM_MAP_FILE = ROOT / "scripts" / "problem-map.json"
+# 규칙(이 스크립트 + 스키마 + stats 계산)이 바뀌면 캐시된 결과도 무효
+RULES_FP = hashlib.sha256(
+    Path(__file__).read_bytes() + Path(schema.__file__).read_bytes() + Path(tasks.__file__).read_bytes()
+).hexdigest()[:20]
+
+# 프로세스 풀 기동 비용이 파일 검증보다 비싼 구간은 한 프로세스에서 처리
+PARALLEL_MIN_FILES = 64
+
+
+def check_schema(app_name: str, app_data: Dict, errors: List[str], warnings: List[str]):
+    """선언적 스키마 검증 (필수 필드, status/priority 값, 버전 형식, 태스크·비전 구조)"""
+    for violation in schema.validate(app_data, "app"):
+        if violation.level == "warning":
+            warnings.append(f"⚠️  {app_name}: {violation.path} - {violation.message}")
+        else:
+            errors.append(f"❌ {app_name}: {violation.path} - {violation.message}")
+
+
+def check_stats_sync(app_name: str, app_data: Dict, errors: List[str], warnings: List[str]):
+    """stats와 allTasks 동기화 검증"""
+    for key, stored, actual in stale_stats(app_data):
+        errors.append(
+            f"❌ {app_name}: {key} 불일치 "
+            f"(stats: {stored}, actual: {actual})"
+        )
+
+
+def check_task_ids(app_name: str, app_data: Dict, errors: List[str], warnings: List[str]):
+    """id 없는 태스크 · 앱 안에서 겹치는 id (task-ids.py show/move 와 전역 색인에서 안 보인다)"""
+    ids = [task.get("id") for task in app_data.get("allTasks", []) if isinstance(task, dict)]
+    missing = sum(1 for task_id in ids if not task_id)
+    if missing:
+        warnings.append(f"⚠️  {app_name}: id 없는 태스크 {missing}개 (python3 scripts/task-ids.py migrate)")
+    counts = Counter(task_id for task_id in ids if task_id)
+    for task_id in sorted(task_id for task_id, count in counts.items() if count > 1):
+        warnings.append(f"⚠️  {app_name}: 태스크 id 중복 - {task_id}")
+
+
+# (규칙, 규칙 안에서 예외가 나면 붙일 라벨)
+RULES = [
+    (check_schema, "스키마 검증 오류"),
+    (check_stats_sync, "stats 검증 오류"),
+    (check_task_ids, "태스크 id 검증 오류"),
+]
+
+
+def validate_file(job: Tuple[str, bytes]) -> Tuple[List[str], List[str], str]:
+    """파일 하나(이름, 원본 바이트)를 파싱하고 모든 규칙을 적용한다.
+
+    반환: (errors, warnings, bundleId)
+    """
+    filename, raw = job
+    errors, warnings = [], []
+    try:
+        app_data = json.loads(raw.decode('utf-8'))
+    except json.JSONDecodeError as e:
+        return [f"❌ {filename}: JSON 파싱 오류 - {str(e)}"], [], None
+    except Exception as e:
+        return [f"❌ {filename}: 검증 오류 - {str(e)}"], [], None
+
+    if not isinstance(app_data, dict):
+        return [f"❌ {filename}: 검증 오류 - 최상위가 객체가 아님"], [], None
+    app_name = app_data.get('name', filename)
+    for rule, label in RULES:
+        try:
+            rule(app_name, app_data, errors, warnings)
+        except Exception as e:
+            errors.append(f"❌ {filename}: {label} - {str(e)}")
+    return errors, warnings, app_data.get('bundleId')
+
+
+def referenced_slugs() -> Dict[str, List[str]]:
+    """큐레이션 파일별로 참조하는 앱 slug 목록"""
+    refs = {}
+    try:
+        showcase = json.loads(SHOWCASE_FILE.read_text(encoding='utf-8'))
+        slugs = list(showcase.get('apps', {}))
+        for group in showcase.get('groups', []):
+            slugs.extend(group.get('slugs', []))
+        refs[SHOWCASE_FILE.name] = slugs
+    except (OSError, json.JSONDecodeError):
+        pass
+    try:
+        problem_map = json.loads(PROBLEM_MAP_FILE.read_text(encoding='utf-8'))
+        refs[PROBLEM_MAP_FILE.name] = [
+            entry.get('slug')
+            for domain in problem_map.get('domains', [])
+            for entry in domain.get('apps', [])
+        ]
+    except (OSError, json.JSONDecodeError):
+        pass
+    return refs
+
+
+def check_cross_file(bundle_ids: Dict[str, str], focus: Set[str] = None,
+                     refs_changed: Set[str] = frozenset()) -> Tuple[List[str], List[str]]:
+    """여러 파일에 걸친 불변식: bundleId 중복, slug 대소문자 충돌, 큐레이션 파일의 없는 slug 참조.
+
+    bundle_ids: {slug: bundleId} (현존 앱 전체)
+    focus: 주어지면 이 slug 가 얽힌 위반만 보고 (--changed 모드)
+    refs_changed: 변경된 큐레이션 파일 — 이 파일의 참조는 focus 와 무관하게 전부 검사
+    """
+    errors, warnings = [], []
+
+    def relevant(slugs):
+        return focus is None or any(slug in focus for slug in slugs)
+
+    by_bundle = {}
+    for slug, bundle_id in bundle_ids.items():
+        if bundle_id:
+            by_bundle.setdefault(bundle_id, []).append(slug)
+    for bundle_id, slugs in sorted(by_bundle.items()):
+        if len(slugs) > 1 and relevant(slugs):
+            files = ", ".join(f"{slug}.json" for slug in sorted(slugs))
+            errors.append(f"❌ bundleId 중복 ({bundle_id}): {files}")
+
+    # 대소문자를 구분하지 않는 파일시스템(macOS 기본)에서는 같은 파일이 된다
+    by_folded = {}
+    for slug in bundle_ids:
+        by_folded.setdefault(slug.lower(), []).append(slug)
+    for slugs in sorted(by_folded.values()):
+        if len(slugs) > 1 and relevant(slugs):
+            files = ", ".join(f"{slug}.json" for slug in sorted(slugs))
+            errors.append(f"❌ slug 대소문자 충돌: {files}")
+
+    for filename, slugs in referenced_slugs().items():
+        check_all = focus is None or filename in refs_changed
+        missing = sorted({
+            slug for slug in slugs
+            if slug not in bundle_ids and (check_all or slug in focus)
+        })
+        for slug in missing:
+            warnings.append(f"⚠️  {filename}: 없는 앱 slug 참조 - {slug}")
+    return errors, warnings
+
 
 class PortfolioValidator:
-    def __init__(self):
+    def __init__(self, apps_dir: Path = None, jobs: int = None, use_cache: bool = True):
         self.errors = []
         self.warnings = []
-        self.root_dir = Path(__file__).parent.parent
-
-    def validate(self) -> bool:
-        """전체 검증 실행"""
-        print("🔍 포트폴리오 데이터 검증 중...\n")
-
-        # 1. JSON 파일 유효성 검사
-        self.validate_json_files()
+        self.root_dir = ROOT
+        self.apps_dir = Path(apps_dir) if apps_dir else self.root_dir / "apps"
+        self.jobs = jobs or os.cpu_count() or 1
+        self.use_cache = use_cache
+
+    def validate(self, changed_only: bool = False) -> bool:
+        """전체 검증 실행 (changed_only: git 에서 바뀐 앱과 그 앱이 얽힌 교차 검증만 보고)"""
+        focus, refs_changed = None, set()
+        if changed_only:
+            focus, refs_changed = self.changed_slugs()
+            if not focus and not refs_changed:
+                print("✅ 변경된 앱 데이터 없음\n")
+                return True
+            print(f"🔍 변경된 앱 {len(focus)}개 검증 중...\n")
+        else:
+            print("🔍 포트폴리오 데이터 검증 중...\n")
 
-        # 2. 앱 데이터 일관성 검사
-        self.validate_app_data()
+        files = sorted(self.apps_dir.glob("*.json"))
+        results = self._results(files)
 
-        # 3. stats 동기화 검사
-        self.validate_stats_sync()
+        bundle_ids = {}
+        for json_file, (errors, warnings, bundle_id) in zip(files, results):
+            bundle_ids[json_file.stem] = bundle_id
+            if focus is None or json_file.stem in focus:
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
 
-        # 4. 필수 필드 검사
-        self.validate_required_fields()
+        # 앱 디렉터리가 비어 있으면 교차 검증할 대상도 없다
+        if files:
+            errors, warnings = check_cross_file(bundle_ids, focus, refs_changed)
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
 
         # 결과 출력
         self.print_results()
 
         return len(self.errors) == 0
 
-    def validate_json_files(self):
-        """JSON 파일 형식 검증"""
-        apps_dir = self.root_dir / "apps"
-
-        for json_file in apps_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    json.load(f)
-            except json.JSONDecodeError as e:
-                self.errors.append(f"❌ {json_file.name}: JSON 파싱 오류 - {str(e)}")
-
-    def validate_app_data(self):
-        """앱 데이터 검증"""
-        apps_dir = self.root_dir / "apps"
-
-        for json_file in apps_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    app_data = json.load(f)
-
-                app_name = app_data.get('name', json_file.name)
-
-                # 상태 값 검증
-                if app_data.get('status') not in ['active', 'planning', 'maintenance', 'archived']:
-                    self.errors.append(f"❌ {app_name}: 잘못된 status 값")
-
-                # 우선순위 값 검증
-                if app_data.get('priority') not in ['high', 'medium', 'low']:
-                    self.errors.append(f"❌ {app_name}: 잘못된 priority 값")
-
-                # 버전 형식 검증
-                version = app_data.get('currentVersion', '')
-                if version and not self._is_valid_version(version):
-                    self.warnings.append(f"⚠️  {app_name}: 버전 형식 확인 필요 ({version})")
-
-            except Exception as e:
-                self.errors.append(f"❌ {json_file.name}: 검증 오류 - {str(e)}")
-
-    def validate_stats_sync(self):
-        """stats와 allTasks 동기화 검증"""
-        apps_dir = self.root_dir / "apps"
-
-        for json_file in apps_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    app_data = json.load(f)
-
-                app_name = app_data.get('name', json_file.name)
-                stats = app_data.get('stats', {})
-                all_tasks = app_data.get('allTasks', [])
-
-                # 실제 카운트 계산
-                actual_total = len(all_tasks)
-                actual_done = sum(1 for t in all_tasks if t.get('status') == 'done')
-                actual_in_progress = sum(1 for t in all_tasks if t.get('status') == 'in-progress')
-                actual_not_started = sum(1 for t in all_tasks if t.get('status') == 'not-started')
-
-                # stats와 비교
-                if stats.get('totalTasks') != actual_total:
-                    self.errors.append(
-                        f"❌ {app_name}: totalTasks 불일치 "
-                        f"(stats: {stats.get('totalTasks')}, actual: {actual_total})"
-                    )
-
-                if stats.get('done') != actual_done:
-                    self.errors.append(
-                        f"❌ {app_name}: done 불일치 "
-                        f"(stats: {stats.get('done')}, actual: {actual_done})"
-                    )
-
-                if stats.get('inProgress') != actual_in_progress:
-                    self.errors.append(
-                        f"❌ {app_name}: inProgress 불일치 "
-                        f"(stats: {stats.get('inProgress')}, actual: {actual_in_progress})"
-                    )
-
-                if stats.get('notStarted') != actual_not_started:
-                    self.errors.append(
-                        f"❌ {app_name}: notStarted 불일치 "
-                        f"(stats: {stats.get('notStarted')}, actual: {actual_not_started})"
-                    )
-
-            except Exception as e:
-                self.errors.append(f"❌ {json_file.name}: stats 검증 오류 - {str(e)}")
-
-    def validate_required_fields(self):
-        """필수 필드 존재 여부 검증"""
-        required_fields = ['name', 'nameEn', 'bundleId', 'currentVersion',
-                          'status', 'priority', 'stats', 'allTasks']
-
-        apps_dir = self.root_dir / "apps"
-
-        for json_file in apps_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    app_data = json.load(f)
-
-                app_name = app_data.get('name', json_file.name)
-
-                for field in required_fields:
-                    if field not in app_data:
-                        self.errors.append(f"❌ {app_name}: 필수 필드 누락 - {field}")
-
-            except Exception as e:
-                self.errors.append(f"❌ {json_file.name}: 필드 검증 오류 - {str(e)}")
-
-    def _is_valid_version(self, version: str) -> bool:
-        """버전 형식 검증 (x.y.z)"""
-        parts = version.split('.')
-        if len(parts) != 3:
-            return False
-        return all(part.isdigit() for part in parts)
+    def changed_slugs(self) -> Tuple[Set[str], Set[str]]:
+        """git 기준 스테이징/수정/추가/삭제된 앱 slug 와 변경된 큐레이션 파일명"""
+        paths = set()
+        for args in (["diff", "--name-only", "--cached"], ["diff", "--name-only"],
+                     ["ls-files", "--others", "--exclude-standard"]):
+            out = subprocess.run(
+                ["git", *args], cwd=self.root_dir, capture_output=True, text=True
+            ).stdout
+            paths.update(self.root_dir / line for line in out.splitlines() if line)
+        apps_dir = self.apps_dir.resolve()
+        curated = {SHOWCASE_FILE.resolve(), PROBLEM_MAP_FILE.resolve()}
+        slugs, refs_changed = set(), set()
+        for path in paths:
+            path = path.resolve()
+            if path.suffix == ".json" and path.parent == apps_dir:
+                slugs.add(path.stem)
+            elif path in curated:
+                refs_changed.add(path.name)
+        return slugs, refs_changed
+
+    def _results(self, files: List[Path]) -> List[Tuple[List[str], List[str], str]]:
+        """파일별 (errors, warnings, bundleId). 내용 해시가 같은 파일은 캐시된 결과를 쓴다."""
+        cache = self._load_cache()
+        results, misses = [None] * len(files), []
+        raws, shas = {}, {}
+        for i, json_file in enumerate(files):
+            raw = json_file.read_bytes()
+            sha = hashlib.sha256(raw).hexdigest()
+            shas[i] = sha
+            hit = cache.get(json_file.name)
+            if hit and hit.get("sha") == sha:
+                results[i] = (hit["errors"], hit["warnings"], hit.get("bundleId"))
+            else:
+                raws[i] = raw
+                misses.append(i)
+
+        jobs = [(files[i].name, raws[i]) for i in misses]
+        for i, result in zip(misses, self._run(jobs)):
+            results[i] = result
+
+        if misses and self.use_cache:
+            # 디렉터리에서 사라진 파일은 캐시에서도 뺀다
+            self._save_cache({
+                json_file.name: {
+                    "sha": shas[i],
+                    "errors": results[i][0],
+                    "warnings": results[i][1],
+                    "bundleId": results[i][2],
+                }
+                for i, json_file in enumerate(files)
+            })
+        return results
+
+    def _load_cache(self) -> Dict:
+        if not self.use_cache:
+            return {}
+        try:
+            data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if data.get("rules") != RULES_FP or data.get("appsDir") != str(self.apps_dir.resolve()):
+            return {}
+        return data.get("files", {})
+
+    def _save_cache(self, files: Dict):
+        payload = {"rules": RULES_FP, "appsDir": str(self.apps_dir.resolve()), "files": files}
+        tmp = CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(CACHE_FILE)
+
+    def _run(self, jobs: List[Tuple[str, bytes]]):
+        """파일별 결과를 입력 순서대로 돌려준다"""
+        if self.jobs <= 1 or len(jobs) < PARALLEL_MIN_FILES:
+            return [validate_file(job) for job in jobs]
+        chunksize = max(1, len(jobs) // (self.jobs * 4))
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            return list(pool.map(validate_file, jobs, chunksize=chunksize))
 
     def print_results(self):
         """검증 결과 출력"""
@@ -170,8 +307,13 @@ class PortfolioValidator:
             print(f"\n❌ 검증 실패: {len(self.errors)}개 오류, {len(self.warnings)}개 경고\n")
 
 def main():
-    validator = PortfolioValidator()
-    success = validator.validate()
+    jobs = apps_dir = None
+    if "--jobs" in sys.argv:
+        jobs = int(sys.argv[sys.argv.index("--jobs") + 1])
+    if "--apps-dir" in sys.argv:
+        apps_dir = sys.argv[sys.argv.index("--apps-dir") + 1]
+    validator = PortfolioValidator(apps_dir=apps_dir, jobs=jobs, use_cache="--no-cache" not in sys.argv)
+    success = validator.validate(changed_only="--changed" in sys.argv)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
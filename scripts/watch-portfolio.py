@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+앱 데이터 감시 → 파생 산출물 자동 재생성
+
+Data/apps/*.json, showcase-content*.json, problem-map.json 을 mtime 스냅숏으로 폴링하다가
+변경이 잠잠해지면(디바운스) 입력이 바뀐 산출물만 다시 만든다.
+
+    summary    portfolio-summary.json   ← apps          (바뀐 앱만 증분 반영)
+    dashboard  dashboard/index.html     ← apps, summary
+    badges     STATS.md                 ← summary
+    site       docs/index.html, README  ← apps, showcase-content, problem-map (캐시만, 바뀐 카드만 렌더)
+
+한 프로세스에서 계속 돌기 때문에 앱 JSON(PortfolioStore), 요약 기여분, 쇼케이스 문구는
+메모리에 둔 채 바뀐 파일만 다시 읽는다. 앱스토어 조회는 하지 않는다 (build-portfolio-site.py 로 따로).
+
+사용:
+    python3 scripts/watch-portfolio.py                    # 처음 한 번 전부 만들고 감시 시작 (Ctrl+C 로 종료)
+    python3 scripts/watch-portfolio.py --only site,summary
+    python3 scripts/watch-portfolio.py --debounce 2 --interval 0.5
+    python3 scripts/watch-portfolio.py --once             # 한 번 만들고 종료
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Set, Tuple
+
+from portfolio import APPS_DIR, ROOT
+from portfolio.summary import SummaryEngine, write_summary
+
+SCRIPTS_DIR = Path(__file__).parent
+SUMMARY_OUT = ROOT / "portfolio-summary.json"  # update-summary.py 와 같은 위치
+CONTENT_FILES = sorted(SCRIPTS_DIR.glob("showcase-content*.json"))
+PROBLEM_MAP_FILE = SCRIPTS_DIR / "problem-map.json"
+
+# (산출물, 입력 종류) — 앞 산출물이 뒤 산출물의 입력이 되므로 이 순서대로 본다
+TARGETS = [
+    ("summary", {"apps"}),
+    ("dashboard", {"apps", "summary"}),
+    ("badges", {"summary"}),
+    ("site", {"apps", "content", "problem-map"}),
+]
+
+Snapshot = Dict[Path, Tuple[int, int]]
+
+
+def load_script(name):
+    """하이픈 이름 스크립트를 모듈로 읽는다 (__main__ 블록은 실행되지 않음)"""
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def input_kind(path: Path) -> str:
+    if path.parent == APPS_DIR:
+        return "apps"
+    if path in CONTENT_FILES:
+        return "content"
+    return "problem-map"
+
+
+def snapshot() -> Snapshot:
+    """감시 대상 파일 → (mtime_ns, size)"""
+    snap = {}
+    for path in [*sorted(APPS_DIR.glob("*.json")), *CONTENT_FILES, PROBLEM_MAP_FILE]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        snap[path] = (stat.st_mtime_ns, stat.st_size)
+    return snap
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> Set[Path]:
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+class Watcher:
+    def __init__(self, only=None, verbose=False):
+        self.only = set(only or (name for name, _ in TARGETS))
+        self.verbose = verbose
+        self.site = load_script("build-portfolio-site")
+        self.dashboard = load_script("generate-dashboard")
+        self.badges = load_script("generate-badges")
+        self.summary = SummaryEngine(APPS_DIR)
+        self.inputs: Dict[str, object] = {}  # 읽어 둔 쇼케이스 문구 · 문제 지도
+
+    # ------------------------------------------------------------ 산출물
+
+    def build_summary(self, changed: Set[Path]):
+        self.summary.update(p for p in changed if input_kind(p) == "apps")
+        write_summary(SUMMARY_OUT, self.summary.summary())
+        self.summary.save_state()
+
+    def build_dashboard(self, changed: Set[Path]):
+        generator = self.dashboard.DashboardGenerator(APPS_DIR)
+        generator.load_data()
+        generator.save_dashboard()
+
+    def build_badges(self, changed: Set[Path]):
+        self.badges.generate_badges()
+
+    def _reuse(self, key: str, paths, changed: Set[Path], loader):
+        if key not in self.inputs or changed & set(paths):
+            self.inputs[key] = loader()
+        return self.inputs[key]
+
+    def build_site(self, changed: Set[Path]):
+        site = self.site
+        site.build(
+            fetch=False,
+            incremental=True,
+            content=self._reuse("content", [site.CONTENT_FILE], changed, site.load_content),
+            content_en=self._reuse("content_en", [site.CONTENT_EN_FILE], changed, site.load_content_en),
+            problem_map=self._reuse("problem_map", [site.PROBLEM_MAP_FILE], changed, site.load_problem_map),
+        )
+
+    # ------------------------------------------------------------ 실행
+
+    def rebuild(self, changed: Set[Path]):
+        """바뀐 입력에 걸린 산출물만 순서대로 다시 만든다. 한 산출물이 실패해도 나머지는 계속."""
+        dirty = {input_kind(path) for path in changed}
+        for name, inputs in TARGETS:
+            if name not in self.only or not dirty & inputs:
+                continue
+            started = time.perf_counter()
+            out = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(sys.stdout if self.verbose else out):
+                    getattr(self, f"build_{name}")(changed)
+            except Exception as e:
+                sys.stdout.write(out.getvalue())
+                print(f"  ❌ {name}: {e}")
+                continue
+            dirty.add(name)
+            print(f"  ✅ {name} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    def watch(self, interval: float, debounce: float):
+        before = snapshot()
+        print(f"🔨 처음 빌드 (감시 파일 {len(before)}개)")
+        self.rebuild(set(before))
+        print(f"👀 감시 중 — {APPS_DIR.relative_to(ROOT)}/*.json, showcase-content*.json, problem-map.json")
+        pending: Set[Path] = set()
+        last_change = 0.0
+        while True:
+            time.sleep(interval)
+            now = snapshot()
+            changed = diff_snapshots(before, now)
+            before = now
+            if changed:
+                # 편집이 몰리는 동안은 모아 두고 debounce 초 동안 잠잠해지면 한 번에 반영
+                pending |= changed
+                last_change = time.monotonic()
+                continue
+            if pending and time.monotonic() - last_change >= debounce:
+                names = ", ".join(sorted(path.name for path in pending)[:5])
+                more = f" 외 {len(pending) - 5}개" if len(pending) > 5 else ""
+                print(f"\n🔄 {time.strftime('%H:%M:%S')} 변경: {names}{more}")
+                self.rebuild(pending)
+                pending = set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 데이터가 바뀌면 파생 산출물을 다시 만든다")
+    parser.add_argument("--only", help="쉼표로 구분한 산출물 (summary,dashboard,badges,site)")
+    parser.add_argument("--interval", type=float, default=0.5, help="폴링 간격(초, 기본 0.5)")
+    parser.add_argument("--debounce", type=float, default=1.0, help="마지막 변경 후 기다릴 시간(초, 기본 1)")
+    parser.add_argument("--once", action="store_true", help="한 번 만들고 종료")
+    parser.add_argument("--verbose", action="store_true", help="각 생성 스크립트의 출력을 그대로 보여 줌")
+    args = parser.parse_args()
+
+    only = args.only.split(",") if args.only else None
+    unknown = set(only or ()) - {name for name, _ in TARGETS}
+    if unknown:
+        print(f"❌ 알 수 없는 산출물: {', '.join(sorted(unknown))}")
+        return 1
+
+    watcher = Watcher(only, verbose=args.verbose)
+    if args.once:
+        watcher.rebuild(set(snapshot()))
+        return 0
+    try:
+        watcher.watch(args.interval, args.debounce)
+    except KeyboardInterrupt:
+        print("\n👋 감시 종료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
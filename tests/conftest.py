@@ -0,0 +1,30 @@
+"""
+scripts/ 의 공용 패키지(portfolio)와 하이픈 이름 스크립트를 테스트에서 불러오기 위한 설정
+
+    python3 -m pytest -q tests
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture(scope="session")
+def load_script():
+    """하이픈 이름 스크립트를 모듈로 읽는 함수 (__main__ 블록은 실행되지 않음)"""
+    loaded = {}
+
+    def load(name):
+        if name not in loaded:
+            spec = importlib.util.spec_from_file_location(name.replace("-", "_"), SCRIPTS_DIR / f"{name}.py")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            loaded[name] = module
+        return loaded[name]
+
+    return load
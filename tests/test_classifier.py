@@ -0,0 +1,112 @@
+"""collect-features 의 KeywordClassifier 가 예전 키워드별 re.search 판정과 같은지"""
+
+import re
+
+import pytest
+
+NAMES = [
+    "",
+    "리뷰 화면 개선",  # '뷰' 가 '리뷰' 안에 겹쳐 있음 → 제외
+    "위젯 뷰 추가",
+    "Face ID 잠금 지원",
+    "face id로 잠금 해제",
+    "TOUCH ID 인증",
+    "UI 테마 변경",
+    "ui/ux 전면 개편",
+    "iCloud 동기화 및 백업",
+    "ICLOUD 복원",
+    "데이터 내보내기 / 가져오기",
+    "CSV 불러오기 기능",
+    "앱스토어 배포",
+    "테스트플라이트 제출",
+    "스토어 스크린샷 영상 제작",
+    "성능 최적화",
+    "빠르게 로딩하기",
+    "메모리 사용량 줄이기",
+    "캘린더 API 연동",
+    "사진 공유",
+    "비밀번호 잠금 설정",
+    "폰트 크기 조정",
+    "통계 화면 추가",
+    "히스토리 기록 검색",
+    "다크모드",
+    "버그 수정",
+    "알림 권한 요청 화면",
+    "관리자 기능 관리",  # 같은 키워드 반복은 한 번만 센다
+    "레이아웃 배치 변경",
+    "탭 네비게이션 애니메이션 전환",
+]
+
+
+def old_is_feature_task(module, task_name):
+    for pattern in module.EXCLUDE_KEYWORDS:
+        if re.search(pattern, task_name, re.IGNORECASE):
+            return False
+    for pattern in module.FEATURE_KEYWORDS:
+        if re.search(pattern, task_name, re.IGNORECASE):
+            return True
+    return False
+
+
+def old_categorize_feature(module, task_name):
+    scores = {}
+    for category, patterns in module.CATEGORY_KEYWORDS.items():
+        score = 0
+        for pattern in patterns:
+            if re.search(pattern, task_name, re.IGNORECASE):
+                score += 1
+        if score > 0:
+            scores[category] = score
+    if scores:
+        return max(scores, key=scores.get)
+    return "기타"
+
+
+@pytest.fixture(scope="module")
+def collect_features(load_script):
+    return load_script("collect-features")
+
+
+def all_names(module):
+    """고정 목록 + 키워드 하나씩 + 서로 다른 그룹 키워드 두 개씩 붙인 이름"""
+    keywords = sorted({
+        *module.EXCLUDE_KEYWORDS, *module.FEATURE_KEYWORDS,
+        *(k for ks in module.CATEGORY_KEYWORDS.values() for k in ks),
+    })
+    names = list(NAMES) + keywords
+    names += [f"{a} {b}" for a, b in zip(keywords, reversed(keywords))]
+    names += [f"{a}{b}" for a, b in zip(keywords, keywords[1:])]
+    return names
+
+
+def test_classify_task_matches_old_rules(collect_features):
+    for name in all_names(collect_features):
+        expected = (old_is_feature_task(collect_features, name), old_categorize_feature(collect_features, name))
+        assert collect_features.classify_task(name) == expected, name
+
+
+def test_wrappers_match_classify_task(collect_features):
+    for name in NAMES:
+        is_feature, category = collect_features.classify_task(name)
+        assert collect_features.is_feature_task(name) is is_feature
+        assert collect_features.categorize_feature(name) == category
+
+
+def test_overlapping_keywords_are_counted(collect_features):
+    # '리뷰' 는 제외 키워드, 그 안의 '뷰' 는 피처 · UI/UX 키워드 — 둘 다 잡혀야 한다
+    hits = collect_features.CLASSIFIER.hits("리뷰")
+    assert hits["_exclude"] == 1
+    assert hits["_feature"] == 1
+    assert hits["UI/UX"] == 1
+
+
+def test_prefix_keywords_are_counted(collect_features):
+    # 현재 키워드 표에는 없는 경우: 같은 위치에서 시작하는 짧은 키워드가 긴 키워드에 가려짐 ('관' ⊂ '관리' ⊂ '관리자')
+    groups = {"a": ["관리", "관리자", "Face"], "b": ["관", "리자", "FACE ID"], "c": ["자"]}
+    classifier = collect_features.KeywordClassifier(groups)
+    for text in ["관리자", "관리자 Face ID", "관", "face id 관리", "리자", "무관"]:
+        counts = {
+            group: sum(1 for k in keywords if re.search(re.escape(k), text, re.IGNORECASE))
+            for group, keywords in groups.items()
+        }
+        assert classifier.hits(text) == {g: n for g, n in counts.items() if n}, text
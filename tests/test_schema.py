@@ -0,0 +1,76 @@
+"""portfolio.schema 의 필수 필드 · 값 검사"""
+
+import copy
+
+import pytest
+
+from portfolio import schema
+from portfolio.tasks import derive_stats
+
+TASKS = [
+    {"id": "A", "name": "학습 노트 작성", "status": "done"},
+    {"id": "B", "name": "복습 알림", "status": "todo"},
+]
+
+VALID_APP = {
+    "name": "바미로그",
+    "nameEn": "Bami Log",
+    "bundleId": "com.example.bamilog",
+    "currentVersion": "1.2.0",
+    "status": "active",
+    "priority": "high",
+    "stats": derive_stats(TASKS),
+    "allTasks": TASKS,
+}
+
+
+def errors(doc, kind="app"):
+    return [(v.path, v.message) for v in schema.validate(doc, kind) if v.level == "error"]
+
+
+def test_valid_app_has_no_violations():
+    assert schema.validate(VALID_APP, "app") == []
+
+
+@pytest.mark.parametrize("key", schema.APP_SCHEMA["required"])
+def test_missing_app_field_is_an_error(key):
+    doc = copy.deepcopy(VALID_APP)
+    del doc[key]
+    assert ("$", f"필수 필드 누락 - {key}") in errors(doc)
+
+
+@pytest.mark.parametrize("key", ["totalTasks", "done", "inProgress", "todo", "notStarted"])
+def test_missing_stats_count_is_an_error(key):
+    doc = copy.deepcopy(VALID_APP)
+    del doc["stats"][key]
+    assert errors(doc) == [("$.stats", f"필수 필드 누락 - {key}")]
+
+
+def test_task_errors_carry_their_path():
+    doc = copy.deepcopy(VALID_APP)
+    del doc["allTasks"][1]["status"]
+    doc["allTasks"][0]["featureMetadata"] = {"category": "핵심기능"}
+    assert errors(doc) == [
+        ("$.allTasks[0].featureMetadata", "필수 필드 누락 - description"),
+        ("$.allTasks[0].featureMetadata", "필수 필드 누락 - userValue"),
+        ("$.allTasks[1]", "필수 필드 누락 - status"),
+    ]
+
+
+def test_all_violations_are_collected():
+    doc = {"name": 1, "status": "unknown"}
+    found = errors(doc)
+    assert ("$.name", "타입 불일치 (string 기대, int)") in found
+    assert any(path == "$.status" for path, _ in found)
+    missing = {message for path, message in found if path == "$"}
+    assert missing == {f"필수 필드 누락 - {key}" for key in schema.APP_SCHEMA["required"] if key not in doc}
+
+
+def test_version_format_is_only_a_warning():
+    doc = dict(VALID_APP, currentVersion="1.0")
+    violations = schema.validate(doc, "app")
+    assert [(v.level, v.path) for v in violations] == [("warning", "$.currentVersion")]
+
+
+def test_required_vision_fields():
+    assert errors({"tagline": "t"}, "vision") == [("$", "필수 필드 누락 - coreValue")]
@@ -0,0 +1,98 @@
+"""태스크 이름 정규화 · TaskIndex 매칭 규칙"""
+
+import pytest
+
+from portfolio.tasks import TaskIndex, normalize_task_name
+
+
+@pytest.mark.parametrize("a, b", [
+    ("일정관리", "일정 관리"),
+    ("일정 관리", " 일정\t관리\n"),
+    ("iCloud 동기화", "ICLOUD동기화"),
+    ("ＵＩ 개선", "ui 개선"),  # 전각 → 반각 (NFKC)
+    ("Face ID 잠금", "face id 잠금"),
+    ("Straße", "STRASSE"),  # casefold
+])
+def test_normalize_collides(a, b):
+    assert normalize_task_name(a) == normalize_task_name(b)
+
+
+@pytest.mark.parametrize("a, b", [
+    ("일정 관리", "일정 관리!"),
+    ("저장", "저장하기"),
+    ("맛집 기록", "맛집 기록 지도"),
+    ("v1.0", "v1.1"),
+])
+def test_normalize_keeps_distinct(a, b):
+    assert normalize_task_name(a) != normalize_task_name(b)
+
+
+def test_normalize_handles_missing_name():
+    assert normalize_task_name(None) == ""
+
+
+def test_find_exact_ignores_cutoff_for_normalized_match():
+    tasks = [{"name": "학습 노트 작성"}]
+    index = TaskIndex(tasks)
+    assert index.find("학습노트작성") is tasks[0]
+    assert index.find("학습노트작성!") is None  # cutoff 없으면 정확 일치만
+
+
+def test_find_fuzzy_respects_cutoff(load_script):
+    cutoff = load_script("collect-vision-features").RENAME_MATCH_CUTOFF
+    tasks = [{"name": "학습 노트 작성"}]
+    index = TaskIndex(tasks)
+    assert index.find("학습 노트 작성!", cutoff=cutoff) is tasks[0]  # ratio 0.92
+    assert index.find("학습 노트 작성하기", cutoff=cutoff) is None  # ratio 0.86
+
+
+def test_find_claims_each_task_once():
+    tasks = [{"name": "맛집 기록"}, {"name": "맛집기록"}, {"name": "맛집 기록!"}]
+    index = TaskIndex(tasks)
+    claimed = set()
+    found = []
+    for _ in range(4):
+        task = index.find("맛집 기록", cutoff=0.85, exclude=claimed)  # '맛집기록!' 은 ratio 0.89
+        if task is None:
+            break
+        claimed.add(id(task))
+        found.append(task)
+    # 정확 일치 두 개를 순서대로, 그다음 유사 일치, 그 뒤로는 없음
+    assert len(found) == len(tasks)
+    assert all(t is u for t, u in zip(found, tasks))
+
+
+FEATURE = {"category": "핵심기능", "description": "d", "userValue": "u", "technicalNotes": "t"}
+
+
+@pytest.fixture
+def vision_pass(load_script, monkeypatch):
+    """기존 태스크 하나에 두 feature 가 모두 유사(ratio 0.94)하지만 정확히 같지는 않은 상황"""
+    module = load_script("collect-vision-features")
+    monkeypatch.setitem(module.APP_VISIONS, "test-app", {
+        "vision": {"tagline": "t", "coreValue": "c"},
+        "features": [dict(FEATURE, name="반복 알림 설정 화면!"), dict(FEATURE, name="반복 알림 설정 화면?")],
+    })
+    return module
+
+
+def app_data():
+    return {"allTasks": [{"id": "A", "name": "반복 알림 설정 화면", "status": "done"}]}
+
+
+def test_vision_pass_is_exact_by_default(vision_pass, capsys):
+    data = app_data()
+    assert vision_pass.transform("test-app", data) == 2
+    assert [t["name"] for t in data["allTasks"]] == ["반복 알림 설정 화면", "반복 알림 설정 화면!", "반복 알림 설정 화면?"]
+    assert "featureMetadata" not in data["allTasks"][0]
+    assert capsys.readouterr().out == ""
+
+
+def test_vision_pass_fuzzy_never_reuses_a_claimed_task(vision_pass, capsys):
+    data = app_data()
+    assert vision_pass.transform("test-app", data, fuzzy=True) == 2
+    # 첫 feature 가 기존 태스크를 가져가고, 두 번째 feature 는 그것을 다시 쓰지 않고 새로 만든다
+    assert [t["name"] for t in data["allTasks"]] == ["반복 알림 설정 화면", "반복 알림 설정 화면?"]
+    assert data["allTasks"][0]["labels"] == ["feature"]
+    out = capsys.readouterr().out
+    assert out.count("≈") == 1 and "반복 알림 설정 화면!" in out